@@ -1,12 +1,18 @@
-from .connectors import OutboundConnector, InboundConnector
+from .connectors import (
+    OutboundConnector,
+    BatchOutboundConnector,
+    InboundConnector,
+)
 from .runtime import CloudConfig, InsecureConfig, SecureConfig
-from .runtime import CamundaRuntime
+from .runtime import CamundaRuntime, CamundaSupervisor
 
 __all__ = [
     "OutboundConnector",
+    "BatchOutboundConnector",
     "InboundConnector",
     "CloudConfig",
     "InsecureConfig",
     "SecureConfig",
     "CamundaRuntime",
+    "CamundaSupervisor",
 ]
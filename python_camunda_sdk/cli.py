@@ -0,0 +1,36 @@
+import importlib
+import click
+import re
+
+
+def import_connector(connector: str) -> type:
+    """Imports a connector class from its full name for the command line
+    tools.
+
+    Arguments:
+        connector: Full class name including the module name, e.g.
+            `mymodule.submodule.MyConnector`.
+
+    Raises:
+        click.BadParameter: If the class cannot be imported.
+    """
+    match = re.search(r"([a-zA-Z_\.]*)\.([a-zA-Z]*)", connector)
+
+    if match is None:
+        raise click.BadParameter(f"Invalid connector name {connector}")
+
+    module_name = match.group(1)
+    cls_name = match.group(2)
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError:
+        raise click.BadParameter(f"Module {module_name} not found")
+
+    connector_cls = getattr(module, cls_name, None)
+
+    if connector_cls is None:
+        raise click.BadParameter(
+            f"Could not import {cls_name} from {module_name}"
+        )
+
+    return connector_cls
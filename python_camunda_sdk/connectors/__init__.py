@@ -1,21 +1,36 @@
 from .config import (
+    CacheConfig,
+    ProfileConfig,
+    RateLimitConfig,
+    RetryPolicy,
     ConnectorConfig,
     OutboundConnectorConfig,
+    BatchConnectorConfig,
     InboundConnectorConfig,
 )
 
-from .connector import ConnectorMetaclass, Connector
+from .connector import ConnectorMetaclass, Connector, JobDeadlineExceeded
 
 from .outbound import OutboundConnector
 
-from .inbound import InboundConnector
+from .batch import BatchOutboundConnector
+
+from .inbound import InboundConnector, InboundRegistry
 
 __all__ = [
+    "CacheConfig",
+    "ProfileConfig",
+    "RateLimitConfig",
+    "RetryPolicy",
     "ConnectorConfig",
     "OutboundConnectorConfig",
+    "BatchConnectorConfig",
     "InboundConnectorConfig",
     "ConnectorMetaclass",
     "Connector",
+    "JobDeadlineExceeded",
     "OutboundConnector",
+    "BatchOutboundConnector",
     "InboundConnector",
+    "InboundRegistry",
 ]
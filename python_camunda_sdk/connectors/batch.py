@@ -0,0 +1,169 @@
+from typing import Any, ClassVar, Dict, List, Optional, get_args, get_origin
+from concurrent.futures import Executor
+
+import asyncio
+import functools
+import inspect
+
+from pyzeebe import Job
+
+from python_camunda_sdk.connectors.batching import Batcher
+from python_camunda_sdk.connectors.config import BatchConnectorConfig
+from python_camunda_sdk.connectors.outbound import OutboundConnector
+from python_camunda_sdk.serialization import Serializer
+
+
+def _run_batch_in_process(
+    connector_cls: type, connectors: List["BatchOutboundConnector"]
+) -> List[Any]:
+    """Runs `run_batch` of a connector class inside a worker process of a
+    process pool.
+
+    Arguments:
+        connector_cls: The connector class.
+        connectors: Validated connector instances, pickled over from the
+            runtime process.
+    """
+    if inspect.iscoroutinefunction(connector_cls.run_batch):
+        return asyncio.run(connector_cls.run_batch(connectors))
+    return connector_cls.run_batch(connectors)
+
+
+class BatchOutboundConnector(
+    OutboundConnector, base_config_cls=BatchConnectorConfig, abstract=True
+):
+    """Base class for outbound connectors that process the jobs in
+    batches.
+
+    Instead of `run()`, subclasses define a `run_batch()` class method that
+    receives the validated connectors of up to `batch_size` jobs collected
+    over `batch_max_wait` seconds. It returns the results in the same
+    order, annotated as a list of the result type. A result that is an
+    exception fails its job only.
+
+    ``` py
+    class InsertConnector(BatchOutboundConnector):
+        name: str
+
+        @classmethod
+        async def run_batch(
+            cls, connectors: List["InsertConnector"]
+        ) -> List[int]:
+            return await db.insert_many([c.name for c in connectors])
+
+        class ConnectorConfig:
+            name = "insert"
+            type = "insert"
+            batch_size = 500
+    ```
+    """
+
+    _batchers: ClassVar[Dict[Optional[Executor], Batcher]]
+
+    @classmethod
+    def _check_run_method(cls) -> None:
+        if cls.run_batch.__func__ is BatchOutboundConnector.run_batch.__func__:
+            raise AttributeError(
+                "Batch connector must have a run_batch(cls, connectors)"
+                f" class method defined. {cls} appears to have none"
+            )
+
+    @classmethod
+    def _check_return_annotation(cls) -> None:
+        signature = inspect.signature(cls.run_batch)
+        return_annotation = signature.return_annotation
+
+        if get_origin(return_annotation) is not list:
+            raise AttributeError(
+                "Batch connector must annotate run_batch() with"
+                f" -> List[...]. {cls} returns {return_annotation}"
+            )
+
+        cls._check_return_type(get_args(return_annotation)[0])
+
+    @classmethod
+    async def run_batch(
+        cls, connectors: List["BatchOutboundConnector"]
+    ) -> List[Any]:
+        """The main connector method that must be overridden by
+        subclasses.
+
+        Arguments:
+            connectors: Validated connectors of the jobs in the batch.
+
+        Returns:
+            A result or an exception for every connector, in the same
+            order.
+        """
+        raise NotImplementedError
+
+    async def run(self) -> Any:
+        """Runs `run_batch` for this connector alone."""
+        (result,) = await self._flush(None, [self])
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    @classmethod
+    def _get_batcher(cls, executor: Optional[Executor] = None) -> Batcher:
+        """Returns the batcher that collects the jobs of the connector for
+        an executor.
+        """
+        if "_batchers" not in cls.__dict__:
+            cls._batchers = {}
+
+        if executor not in cls._batchers:
+            cls._batchers[executor] = Batcher(
+                functools.partial(cls._flush, executor),
+                max_size=cls.config.batch_size,
+                max_wait=cls.config.batch_max_wait,
+            )
+        return cls._batchers[executor]
+
+    @classmethod
+    async def _flush(
+        cls,
+        executor: Optional[Executor],
+        connectors: List["BatchOutboundConnector"],
+    ) -> List[Any]:
+        await cls._wait_for_rate_limit()
+
+        loop = asyncio.get_running_loop()
+
+        with cls._run_latency.time():
+            if cls.config.execution_mode == "process":
+                return await loop.run_in_executor(
+                    executor, _run_batch_in_process, cls, connectors
+                )
+            elif inspect.iscoroutinefunction(cls.run_batch):
+                return await cls.run_batch(connectors)
+            else:
+                return await loop.run_in_executor(
+                    executor, cls.run_batch, connectors
+                )
+
+    async def _execute(
+        self,
+        job: Job,
+        executor: Optional[Executor] = None,
+        serializer: Optional[Serializer] = None,
+    ) -> Optional[dict]:
+        """Adds the connector to the current batch and maps its result once
+        the batch has run. A failed job is added to a later batch if the
+        connector has a retry policy.
+
+        Arguments:
+            job: An instance of a job.
+            executor: Executor for a synchronous or process `run_batch`.
+            serializer: If set, the result is encoded to JSON right away.
+
+        Raises:
+            JobDeadlineExceeded: If the batch does not finish before the
+                job deadline.
+            Exception: The error of the batch or of this job.
+        """
+        batcher = self._get_batcher(executor)
+        ret_value = await self._await_before_deadline(
+            job, self._retry(job, functools.partial(batcher.submit, self))
+        )
+        return self._map_result(job, ret_value, serializer)
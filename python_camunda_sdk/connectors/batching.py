@@ -0,0 +1,91 @@
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+import asyncio
+
+
+class Batcher:
+    """Collects submitted items and hands them over to a flush coroutine in
+    batches.
+
+    A batch is flushed once it holds `max_size` items or `max_wait` seconds
+    after its first item was submitted, whichever comes first.
+
+    Arguments:
+        flush: Coroutine function that receives a list of items and returns
+            a list of results in the same order. A result that is an
+            exception is raised to the submitter of that item only.
+        max_size: Maximum number of items in a batch.
+        max_wait: Maximum time in seconds an item waits for its batch.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_size: int = 100,
+        max_wait: float = 0.01,
+    ):
+        self._flush = flush
+        self._max_size = max_size
+        self._max_wait = max_wait
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Adds an item to the current batch.
+
+        Arguments:
+            item: Item to process.
+
+        Returns:
+            The result for the item once its batch is flushed.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush_pending)
+
+        return await future
+
+    def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self._flush([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Expected {len(batch)} results, got {len(results)}"
+                )
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Flushes the pending items and waits for all batches to finish."""
+        self._flush_pending()
+
+        if self._flushes:
+            await asyncio.wait(set(self._flushes))
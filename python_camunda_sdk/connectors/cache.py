@@ -0,0 +1,207 @@
+from typing import Any, Awaitable, Callable, Dict, Union
+
+import asyncio
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import TypeAdapter
+
+from python_camunda_sdk.connectors.config import CacheConfig
+
+MISS = object()
+"""Returned by the caches for missing and expired keys."""
+
+
+class MemoryCache:
+    """In-process LRU cache with a time to live.
+
+    Arguments:
+        max_size: Maximum number of entries.
+        ttl: Time to live of an entry in seconds.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+
+    async def get(self, key: str) -> Any:
+        """Returns the value for the key or `MISS`."""
+        entry = self._entries.get(key, None)
+        if entry is None:
+            return MISS
+
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return MISS
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Stores a value for the key."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class SQLiteCache:
+    """Cache in an SQLite database that can be shared by several worker
+    processes on the same host.
+
+    Values are stored JSON encoded. Once the namespace grows past
+    `max_size`, the entries closest to expiry are evicted. The database is
+    accessed from a dedicated thread, so that waiting for its lock does not
+    block the event loop.
+
+    Arguments:
+        path: Path of the database file.
+        namespace: Namespace of the keys, e.g. the connector type.
+        adapter: Type adapter that encodes and decodes the values.
+        max_size: Maximum number of entries in the namespace.
+        ttl: Time to live of an entry in seconds.
+    """
+
+    prune_interval = 100
+    """Number of writes between evictions."""
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str,
+        adapter: TypeAdapter,
+        max_size: int,
+        ttl: float,
+    ):
+        self.namespace = namespace
+        self.adapter = adapter
+        self.max_size = max_size
+        self.ttl = ttl
+        self._writes = 0
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"cache-{namespace}"
+        )
+        self._connection = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS connector_cache ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value BLOB NOT NULL,"
+            " expires REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+
+    async def get(self, key: str) -> Any:
+        """Returns the value for the key or `MISS`."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get, key
+        )
+
+    async def set(self, key: str, value: Any) -> None:
+        """Stores a value for the key."""
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._set, key, value
+        )
+
+    async def prune(self) -> None:
+        """Deletes the expired entries and the entries beyond
+        `max_size`.
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._prune
+        )
+
+    def _get(self, key: str) -> Any:
+        row = self._connection.execute(
+            "SELECT value FROM connector_cache"
+            " WHERE namespace = ? AND key = ? AND expires >= ?",
+            (self.namespace, key, time.time()),
+        ).fetchone()
+        if row is None:
+            return MISS
+        return self.adapter.validate_json(row[0])
+
+    def _set(self, key: str, value: Any) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO connector_cache VALUES (?, ?, ?, ?)",
+            (
+                self.namespace,
+                key,
+                self.adapter.dump_json(value),
+                time.time() + self.ttl,
+            ),
+        )
+
+        self._writes += 1
+        if self._writes % self.prune_interval == 0:
+            self._prune()
+
+    def _prune(self) -> None:
+        self._connection.execute(
+            "DELETE FROM connector_cache WHERE namespace = ? AND ("
+            " expires < ? OR key NOT IN ("
+            "  SELECT key FROM connector_cache WHERE namespace = ?"
+            "  ORDER BY expires DESC LIMIT ?))",
+            (self.namespace, time.time(), self.namespace, self.max_size),
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self._connection.close()
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers with the same
+    key.
+
+    A caller that is cancelled does not cancel the call for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._calls
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Awaits the in-flight call for the key, or starts `call` if there
+        is none.
+
+        Arguments:
+            key: Key of the call.
+            call: Function that starts the call.
+
+        Returns:
+            The result of the call.
+        """
+        future = self._calls.get(key, None)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(future)
+
+
+def create_cache(
+    config: CacheConfig, namespace: str, adapter: TypeAdapter
+) -> Union[MemoryCache, SQLiteCache]:
+    """Creates the cache described by a config.
+
+    Arguments:
+        config: Cache config.
+        namespace: Namespace of the keys in a shared cache.
+        adapter: Type adapter of the cached values.
+    """
+    if config.backend == "sqlite":
+        return SQLiteCache(
+            config.path, namespace, adapter, config.max_size, config.ttl
+        )
+    return MemoryCache(config.max_size, config.ttl)
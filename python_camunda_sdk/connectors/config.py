@@ -1,6 +1,113 @@
-from typing import Optional
+from typing import Literal, Optional, Tuple, Type
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
+
+
+class CacheConfig(BaseModel):
+    """Result cache configuration.
+
+    Attributes:
+        max_size: Maximum number of cached results.
+        ttl: Time to live of a cached result in seconds.
+        backend: `memory` caches results in the worker process. `sqlite`
+            caches them in an SQLite database at `path`, which several
+            worker processes can share.
+        path: Path of the SQLite database.
+    """
+
+    max_size: int = Field(default=1024, gt=0)
+    ttl: float = Field(default=60.0, gt=0)
+    backend: Literal["memory", "sqlite"] = "memory"
+    path: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _check_path(self) -> "CacheConfig":
+        if self.backend == "sqlite" and self.path is None:
+            raise ValueError("The sqlite cache backend requires a path")
+        return self
+
+
+class ProfileConfig(BaseModel):
+    """Sampling profiler configuration.
+
+    Profiled jobs are sampled every `interval` seconds while their `run()`
+    executes, and their stacks are appended in the collapsed format of
+    flamegraph tools to `<directory>/<connector type>.collapsed`.
+
+    Attributes:
+        directory: Directory of the profiles.
+        sample_rate: Share of the jobs that are profiled.
+        latency_threshold: If set, every job is sampled and the profiles
+            of the jobs that take at least this many seconds are kept as
+            well.
+        interval: Time in seconds between stack samples.
+        max_bytes: Size of a profile file after which it is rotated.
+        backup_count: Number of rotated files that are kept.
+    """
+
+    directory: str
+    sample_rate: float = Field(default=0.01, ge=0, le=1)
+    latency_threshold: Optional[float] = Field(default=None, ge=0)
+    interval: float = Field(default=0.005, gt=0)
+    max_bytes: int = Field(default=10 * 1024 * 1024, gt=0)
+    backup_count: int = Field(default=3, ge=0)
+
+
+class RateLimitConfig(BaseModel):
+    """Token-bucket rate limit of the `run()` calls of a connector.
+
+    Attributes:
+        rate: Number of calls per second.
+        burst: Number of calls that can be made at once after the
+            connector has been idle.
+        key: Name of the bucket. Connectors with the same key share the
+            limit, e.g. all connectors calling one downstream host, and
+            must set the same `rate` and `burst`. Defaults to the
+            connector type.
+        backend: `memory` keeps the bucket in the worker process.
+            `sqlite` keeps it in an SQLite database at `path`, so that
+            several worker processes share the limit.
+        path: Path of the SQLite database.
+    """
+
+    rate: float = Field(gt=0)
+    burst: int = Field(default=1, gt=0)
+    key: Optional[str] = None
+    backend: Literal["memory", "sqlite"] = "memory"
+    path: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _check_path(self) -> "RateLimitConfig":
+        if self.backend == "sqlite" and self.path is None:
+            raise ValueError("The sqlite rate limit backend requires a path")
+        return self
+
+
+class RetryPolicy(BaseModel):
+    """Policy for retrying a failed `run()` in the worker before the job
+    is failed back to the engine.
+
+    The delay before retry `n` is `initial_backoff * multiplier ** (n - 1)`,
+    capped at `max_backoff` and reduced by a random fraction of up to
+    `jitter`. A `BusinessError` is never retried.
+
+    Attributes:
+        attempts: Maximum number of `run()` calls per job, including the
+            first one.
+        initial_backoff: Delay before the first retry in seconds.
+        max_backoff: Maximum delay between retries in seconds.
+        multiplier: Factor by which the delay grows with every retry.
+        jitter: Maximum fraction by which a delay is randomly reduced, so
+            that jobs failed together are not retried together.
+        retry_on: Exception types that are retried.
+    """
+
+    attempts: int = Field(default=3, ge=1)
+    initial_backoff: float = Field(default=0.1, ge=0)
+    max_backoff: float = Field(default=10.0, ge=0)
+    multiplier: float = Field(default=2.0, ge=1)
+    jitter: float = Field(default=0.5, ge=0, le=1)
+    retry_on: Tuple[Type[Exception], ...] = (Exception,)
 
 
 class ConnectorConfig(BaseModel):
@@ -12,11 +119,55 @@ class ConnectorConfig(BaseModel):
         type: Type of the connector. This will correspond to the type of
             the service task that will be calling the connector.
         timeout: Timeout for the connector.
+        max_workers: Size of a dedicated pool for the `run()` method of
+            this connector. If not set, the runtime's shared pool is used.
+        execution_mode: Where the `run()` method is executed. `thread`
+            runs synchronous methods in a thread pool, `process` runs
+            both synchronous and asynchronous methods in a process pool,
+            which suits CPU-bound connectors.
+        max_concurrency: Maximum number of jobs of this connector that are
+            executed at the same time. Also limits the number of jobs
+            activated by the runtime, so that a slow connector does not
+            take capacity from the others.
+        trusted_input: Construct the connector from the job variables
+            without validating them. Only use it if the process always
+            supplies variables of the declared types.
+        cache: Caches the results of `run()` by the values of the
+            connector fields. Only use it for idempotent connectors.
+        coalesce: Concurrent jobs with equal connector fields share one
+            in-flight `run()` and each receive its result. Only use it for
+            idempotent connectors.
+        deadline_margin: If set, `run()` is abandoned this many seconds
+            before the job deadline, since the engine hands the job to
+            another worker once its lock expires. Coroutines are cancelled,
+            executor calls are left to finish in the background.
+        report_deadline: Fail the job as soon as its `run()` is abandoned,
+            so that it is retried right away instead of after the lock
+            expires. Uses up a retry.
+        retry: Retries a failed `run()` in the worker, which is faster
+            than failing the job and waiting for it to be activated again.
+            Retries stop once the job deadline would be passed.
+        rate_limit: Limits the rate of `run()` calls. Calls over the
+            limit wait for a token, and the runtime activates no more
+            jobs than there are tokens available.
+        profile: Profiles the `run()` of a share of the jobs, or of the
+            slow ones, with a sampling profiler.
     """
 
     name: str
     type: str
     timeout: Optional[int] = 10
+    max_workers: Optional[int] = None
+    execution_mode: Literal["thread", "process"] = "thread"
+    max_concurrency: Optional[int] = Field(default=None, gt=0)
+    trusted_input: bool = False
+    cache: Optional[CacheConfig] = None
+    coalesce: bool = False
+    deadline_margin: Optional[float] = Field(default=None, ge=0)
+    report_deadline: bool = True
+    retry: Optional[RetryPolicy] = None
+    rate_limit: Optional[RateLimitConfig] = None
+    profile: Optional[ProfileConfig] = None
 
 
 class OutboundConnectorConfig(ConnectorConfig):
@@ -25,6 +176,28 @@ class OutboundConnectorConfig(ConnectorConfig):
     pass
 
 
+class BatchConnectorConfig(OutboundConnectorConfig):
+    """Batch outbound connector configuration.
+
+    Result caching, coalescing and profiling work on single `run()` calls
+    and are not supported for batches.
+
+    Attributes:
+        batch_size: Maximum number of jobs in a batch.
+        batch_max_wait: Maximum time in seconds a job waits for its batch.
+    """
+
+    batch_size: int = Field(default=100, gt=0)
+    batch_max_wait: float = Field(default=0.01, ge=0)
+
+    @model_validator(mode="after")
+    def _check_unsupported(self) -> "BatchConnectorConfig":
+        for option in ("cache", "coalesce", "profile"):
+            if getattr(self, option):
+                raise ValueError(f"Batch connectors do not support {option}")
+        return self
+
+
 class InboundConnectorConfig(ConnectorConfig):
     """Inbound connector configuration."""
 
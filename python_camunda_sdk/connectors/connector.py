@@ -1,19 +1,98 @@
-from typing import Optional, Union, get_args
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+)
 from types import NoneType
 
 from abc import abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
 
+import asyncio
+import functools
 import inspect
+import random
+import sys
+import time
 
 from loguru import logger
 
-from pydantic import BaseModel
+from pydantic import AliasChoices, AliasPath, BaseModel, TypeAdapter
 from pydantic._internal._model_construction import ModelMetaclass
+from pydantic.fields import FieldInfo
 
 from pyzeebe import Job
+from pyzeebe.errors import BusinessError
 
+from python_camunda_sdk import metrics, tracing
+from python_camunda_sdk.serialization import RawJSON, Serializer
 from python_camunda_sdk.types import SimpleTypes
 from python_camunda_sdk.connectors.config import ConnectorConfig
+from python_camunda_sdk.connectors.cache import (
+    MISS,
+    SingleFlight,
+    create_cache,
+)
+from python_camunda_sdk.connectors.profiling import Profiler, current_profile
+from python_camunda_sdk.connectors.ratelimit import (
+    TokenBucket,
+    get_token_bucket,
+)
+
+
+_NO_VARIABLES = "_camunda_connector_no_variables"
+"""Fetched by connectors without fields. Zeebe sends the whole variable
+scope for an empty fetch list, but skips names that are not in it."""
+
+
+def _variable_keys(
+    field_name: str, field: FieldInfo, populate_by_name: bool
+) -> Tuple[Tuple[str, ...], bool]:
+    """Returns the names of the variables a field is validated from, and
+    whether the field is read from a nested value of a variable.
+    """
+    alias = field.validation_alias
+    if alias is None:
+        choices = [field.alias or field_name]
+    elif isinstance(alias, AliasChoices):
+        choices = alias.choices
+    else:
+        choices = [alias]
+
+    keys = []
+    nested = False
+    for choice in choices:
+        if isinstance(choice, AliasPath):
+            nested = True
+            choice = choice.path[0]
+        if choice not in keys:
+            keys.append(choice)
+
+    if populate_by_name and field_name not in keys:
+        keys.append(field_name)
+    return tuple(keys), nested
+
+
+class JobDeadlineExceeded(Exception):
+    """Raised when `run()` is abandoned shortly before the job deadline.
+
+    Arguments:
+        job_key: Key of the job.
+        margin: Margin in seconds before the deadline.
+    """
+
+    def __init__(self, job_key: int, margin: float):
+        super().__init__(
+            f"Abandoned job {job_key} {margin} seconds before its deadline"
+        )
+        self.job_key = job_key
 
 
 class ConnectorMetaclass(ModelMetaclass):
@@ -28,18 +107,23 @@ class ConnectorMetaclass(ModelMetaclass):
         cls_name,
         bases,
         namespace,
-        base_config_cls=ConnectorConfig,
+        base_config_cls=None,
+        abstract=False,
         **kwargs,
     ):
         cls = super().__new__(mcs, cls_name, bases, namespace, **kwargs)
 
-        cls._base_config_cls = base_config_cls
+        if base_config_cls is not None:
+            cls._base_config_cls = base_config_cls
+        elif not hasattr(cls, "_base_config_cls"):
+            cls._base_config_cls = ConnectorConfig
 
-        if bases != (BaseModel,) and bases != (Connector,):
+        if not abstract and bases != (BaseModel,) and bases != (Connector,):
             cls._generate_config()
             cls._check_run_method()
             cls._check_return_annotation()
             cls._extra_pre_init_checks()
+            cls._compile()
 
         return cls
 
@@ -86,6 +170,9 @@ class ConnectorMetaclass(ModelMetaclass):
                 f" {cls} return nothing."
             )
 
+        cls._check_return_type(return_annotation)
+
+    def _check_return_type(cls, return_annotation: type) -> None:
         if (
             return_annotation != NoneType
             and not issubclass(return_annotation, BaseModel)
@@ -99,6 +186,37 @@ class ConnectorMetaclass(ModelMetaclass):
     def _extra_pre_init_checks(cls) -> None:
         pass
 
+    def _compile(cls) -> None:
+        """Precomputes what every job of the connector needs, so that it is
+        not derived again per job.
+        """
+        cls._is_coroutine = inspect.iscoroutinefunction(cls.run)
+        cls._return_adapter = TypeAdapter(cls._return_type)
+        populate_by_name = cls.model_config.get("populate_by_name", False)
+        input_fields = []
+        cls._has_nested_input = False
+        for field_name, field in cls.model_fields.items():
+            keys, nested = _variable_keys(field_name, field, populate_by_name)
+            input_fields.append((keys, field_name, field.is_required(), field))
+            cls._has_nested_input |= nested
+        cls._input_fields = tuple(input_fields)
+        cls._run_latency = metrics.RUN_LATENCY.labels(cls.config.type)
+
+
+def _run_in_process(
+    connector: "Connector",
+) -> Optional[Union[BaseModel, SimpleTypes]]:
+    """Runs connector `run` method inside a worker process of a process
+    pool.
+
+    Arguments:
+        connector: A validated connector instance, pickled over from the
+            runtime process.
+    """
+    if connector._is_coroutine:
+        return asyncio.run(connector.run())
+    return connector.run()
+
 
 class Connector(BaseModel, metaclass=ConnectorMetaclass):
     """Connector base class.
@@ -115,24 +233,429 @@ class Connector(BaseModel, metaclass=ConnectorMetaclass):
         config (ConnectorConfig): Configuration of the connector.
     """
 
+    _resources: ClassVar[Any] = None
+
+    @property
+    def resources(self) -> Any:
+        """Resources created by
+        [setup][python_camunda_sdk.connectors.connector.Connector.setup].
+
+        !!! warning
+            Resources are not available to connectors with
+            `execution_mode="process"`, since they live in the runtime
+            process.
+        """
+        return type(self)._resources
+
+    @classmethod
+    async def setup(cls) -> Any:
+        """Creates resources shared by all jobs of the connector, e.g. an
+        HTTP client with keep-alive or a database pool.
+
+        Called once by the runtime before it starts working. The returned
+        value is available to every instance as `self.resources`.
+
+        ``` py
+        class FetchConnector(OutboundConnector):
+            url: str
+
+            @classmethod
+            async def setup(cls) -> httpx.AsyncClient:
+                return httpx.AsyncClient()
+
+            @classmethod
+            async def teardown(cls, resources: httpx.AsyncClient):
+                await resources.aclose()
+
+            async def run(self) -> str:
+                response = await self.resources.get(self.url)
+                return response.text
+        ```
+        """
+        return None
+
+    @classmethod
+    async def teardown(cls, resources: Any) -> None:
+        """Releases the resources created by `setup`.
+
+        Called once by the runtime when it stops.
+
+        Arguments:
+            resources: The value returned by `setup`.
+        """
+        pass
+
+    @classmethod
+    async def _start(cls) -> None:
+        cls._resources = await cls.setup()
+
+    @classmethod
+    async def _stop(cls) -> None:
+        resources, cls._resources = cls._resources, None
+        await cls.teardown(resources)
+
+    @classmethod
+    def _input_variables(cls) -> List[str]:
+        """Returns the names of the process variables used by the
+        connector.
+        """
+        return list(
+            dict.fromkeys(
+                key for keys, *_ in cls._input_fields for key in keys
+            )
+        )
+
+    @classmethod
+    def _variables_to_fetch(cls) -> List[str]:
+        """Returns the names of the process variables used by the
+        connector, so that the rest of the variable scope is not
+        transferred with the jobs.
+        """
+        return cls._input_variables() or [_NO_VARIABLES]
+
+    @classmethod
+    def _from_variables(cls, variables: Dict) -> "Connector":
+        """Creates a connector from the variables of a job.
+
+        The variables are validated, unless the connector is configured
+        with `trusted_input`. Trusted variables are set as they are, which
+        skips the validation of large nested values. If a required variable
+        is missing, or a field is read through an `AliasPath`, the variables
+        are validated anyway.
+
+        Arguments:
+            variables: Variables of the job.
+
+        Raises:
+            ValidationError: If the variables are invalid.
+        """
+        if not cls.config.trusted_input or cls._has_nested_input:
+            return cls(**variables)
+
+        values = {}
+        fields_set = set()
+        for keys, field_name, required, field in cls._input_fields:
+            key = next((key for key in keys if key in variables), None)
+            if key is not None:
+                values[field_name] = variables[key]
+                fields_set.add(field_name)
+            elif required:
+                return cls(**variables)
+            else:
+                values[field_name] = field.get_default(
+                    call_default_factory=True
+                )
+
+        # Same as `model_construct`, without resolving the fields per job.
+        connector = cls.__new__(cls)
+        object.__setattr__(connector, "__dict__", values)
+        object.__setattr__(connector, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(connector, "__pydantic_extra__", None)
+        object.__setattr__(connector, "__pydantic_private__", None)
+        if cls.__pydantic_post_init__:
+            connector.model_post_init(None)
+        return connector
+
+    @classmethod
+    def _create_concurrency_limit(cls) -> Optional[asyncio.Semaphore]:
+        """Creates a semaphore that enforces `max_concurrency` of the
+        connector.
+
+        Returns:
+            A semaphore or `None` if concurrency is not limited.
+        """
+        if cls.config.max_concurrency is None:
+            return None
+        return asyncio.Semaphore(cls.config.max_concurrency)
+
+    @classmethod
+    def _get_cache(cls) -> Any:
+        """Returns the result cache of the connector, creating it on first
+        use so that no database is opened when the class is defined.
+        """
+        if "_cache" not in cls.__dict__:
+            cls._cache = create_cache(
+                cls.config.cache, cls.config.type, cls._return_adapter
+            )
+            cls._cache_hits = metrics.CACHE_HITS.labels(cls.config.type)
+            cls._cache_misses = metrics.CACHE_MISSES.labels(cls.config.type)
+        return cls._cache
+
+    @classmethod
+    def _get_token_bucket(cls) -> Optional[TokenBucket]:
+        """Returns the token bucket of the rate limit of the connector, or
+        `None` if it is not rate limited.
+        """
+        if cls.config.rate_limit is None:
+            return None
+        if "_token_bucket" not in cls.__dict__:
+            cls._token_bucket = get_token_bucket(
+                cls.config.rate_limit, cls.config.type
+            )
+            cls._rate_limit_wait = metrics.RATE_LIMIT_WAIT.labels(
+                cls.config.type
+            )
+        return cls._token_bucket
+
+    @classmethod
+    async def _wait_for_rate_limit(cls) -> None:
+        """Waits until the rate limit of the connector allows a `run()`
+        call.
+        """
+        token_bucket = cls._get_token_bucket()
+        if token_bucket is not None:
+            cls._rate_limit_wait.observe(await token_bucket.acquire())
+
+    @classmethod
+    def _get_profiler(cls) -> Optional[Profiler]:
+        """Returns the profiler of the connector, or `None` if it is not
+        profiled.
+        """
+        if cls.config.profile is None:
+            return None
+        if "_profiler" not in cls.__dict__:
+            cls._profiler = Profiler(cls.config.profile, cls.config.type)
+        return cls._profiler
+
+    @classmethod
+    def _warn_not_in_process(cls) -> None:
+        """Warns once that a connector in process mode is run without a
+        process pool.
+        """
+        if "_warned_not_in_process" not in cls.__dict__:
+            cls._warned_not_in_process = True
+            logger.warning(
+                f"{cls.config.name} has execution_mode process but was not"
+                " given a process pool, running it in the default thread"
+                " pool of the loop instead"
+            )
+
+    async def _retry(self, job: Job, call: Callable[[], Awaitable]) -> Any:
+        """Awaits a call, retrying it according to the retry policy of the
+        connector.
+
+        A retry is skipped if its backoff would end after the job deadline.
+
+        Arguments:
+            job: An instance of a job.
+            call: Function that starts the call.
+
+        Raises:
+            Exception: The error of the last attempt.
+        """
+        policy = self.config.retry
+        if policy is None:
+            return await call()
+
+        deadline = getattr(job, "deadline", None)
+        if deadline:
+            deadline = deadline / 1000 - (self.config.deadline_margin or 0)
+
+        attempt = 1
+        while True:
+            try:
+                return await call()
+            except BusinessError:
+                raise
+            except policy.retry_on as e:
+                if attempt >= policy.attempts:
+                    raise
+
+                backoff = min(
+                    policy.initial_backoff
+                    * policy.multiplier ** (attempt - 1),
+                    policy.max_backoff,
+                )
+                backoff *= 1 - policy.jitter * random.random()
+                if deadline and time.time() + backoff >= deadline:
+                    raise
+
+                logger.warning(
+                    f"Retrying job {getattr(job, 'key', None)} of"
+                    f" {self.config.type} in {backoff:.3f} seconds after"
+                    f" attempt {attempt}: {e!r}"
+                )
+                metrics.RUN_RETRIES.labels(self.config.type).inc()
+                await asyncio.sleep(backoff)
+                attempt += 1
+
+    async def _run(
+        self, job: Job, executor: Optional[Executor] = None
+    ) -> Optional[Union[BaseModel, SimpleTypes]]:
+        """Runs the `run` method where the connector is configured to,
+        retrying it on failure if the connector has a retry policy.
+        """
+        return await self._retry(
+            job, functools.partial(self._run_once, job, executor)
+        )
+
+    async def _run_once(
+        self, job: Job, executor: Optional[Executor] = None
+    ) -> Optional[Union[BaseModel, SimpleTypes]]:
+        """Runs the `run` method once the rate limit allows it."""
+        await self._wait_for_rate_limit()
+
+        loop = asyncio.get_running_loop()
+        profile = current_profile.get()
+
+        run_span = tracing.job_span("camunda.run", job, self.config.type)
+        with run_span, self._run_latency.time():
+            if self.config.execution_mode == "process":
+                if not isinstance(executor, ProcessPoolExecutor):
+                    self._warn_not_in_process()
+                return await loop.run_in_executor(
+                    executor, _run_in_process, self
+                )
+            elif self._is_coroutine:
+                if profile is None:
+                    return await self.run()
+                with profile.track(sys._getframe()):
+                    return await self.run()
+            elif profile is None:
+                return await loop.run_in_executor(executor, self.run)
+            else:
+                return await loop.run_in_executor(
+                    executor, functools.partial(profile.call, self.run)
+                )
+
+    @classmethod
+    def _get_single_flight(cls) -> SingleFlight:
+        """Returns the in-flight `run()` calls of the connector."""
+        if "_single_flight" not in cls.__dict__:
+            cls._single_flight = SingleFlight()
+            cls._jobs_coalesced = metrics.JOBS_COALESCED.labels(
+                cls.config.type
+            )
+        return cls._single_flight
+
+    async def _run_cached(
+        self, key: str, job: Job, executor: Optional[Executor] = None
+    ) -> Optional[Union[BaseModel, SimpleTypes]]:
+        """Returns the cached result for the values of the connector
+        fields, or runs the connector and caches its result.
+
+        Arguments:
+            key: The values of the connector fields.
+        """
+        if self.config.cache is None:
+            return await self._run(job, executor)
+
+        cache = self._get_cache()
+
+        ret_value = await cache.get(key)
+        if ret_value is not MISS:
+            self._cache_hits.inc()
+            return ret_value
+
+        self._cache_misses.inc()
+        ret_value = await self._run(job, executor)
+        if isinstance(ret_value, self._return_type):
+            await cache.set(key, ret_value)
+        return ret_value
+
+    async def _run_coalesced(
+        self, key: str, job: Job, executor: Optional[Executor] = None
+    ) -> Optional[Union[BaseModel, SimpleTypes]]:
+        """Awaits the in-flight `run()` of a job with equal connector
+        fields, or starts one.
+
+        Arguments:
+            key: The values of the connector fields.
+        """
+        single_flight = self._get_single_flight()
+        if key in single_flight:
+            self._jobs_coalesced.inc()
+        return await single_flight.run(
+            key, functools.partial(self._run_cached, key, job, executor)
+        )
+
     @logger.catch(reraise=True, message="Failed to execute connector method")
     async def _execute(
-        self, job: Job
+        self,
+        job: Job,
+        executor: Optional[Executor] = None,
+        serializer: Optional[Serializer] = None,
     ) -> Optional[Union[BaseModel, SimpleTypes]]:
         """Execute connector `run` method while passing the connector config.
 
+        Synchronous `run` methods are offloaded to `executor` so that they
+        do not block the event loop. If the connector is configured with
+        `execution_mode="process"`, the connector is pickled and `run` is
+        executed in `executor`, which must be a process pool.
+
         Arguments:
             job: An instance of a job.
+            executor: Executor for the `run` method. If not set, the default
+                executor of the loop is used.
+            serializer: If set, the result is encoded to JSON right away
+                with the type adapter of the return type.
 
         Raises:
             ValueError: If type of the returned value does not match the
                 type-hint.
         """
-        if inspect.iscoroutinefunction(self.run):
-            ret_value = await self.run()
+        if self.config.coalesce:
+            key = self.model_dump_json()
+            call = self._run_coalesced(key, job, executor)
+        elif self.config.cache is not None:
+            key = self.model_dump_json()
+            call = self._run_cached(key, job, executor)
         else:
-            ret_value = self.run()
+            call = self._run(job, executor)
+
+        profiler = self._get_profiler()
+        if profiler is None:
+            ret_value = await self._await_before_deadline(job, call)
+        else:
+            with profiler.profile(job):
+                ret_value = await self._await_before_deadline(job, call)
+
+        return self._map_result(job, ret_value, serializer)
+
+    async def _await_before_deadline(self, job: Job, call: Awaitable) -> Any:
+        """Awaits a call, abandoning it `deadline_margin` seconds before the
+        deadline of the job.
+
+        Arguments:
+            job: An instance of a job.
+            call: The call.
+
+        Raises:
+            JobDeadlineExceeded: If the call is abandoned.
+        """
+        margin = self.config.deadline_margin
+        deadline = getattr(job, "deadline", None)
+        if margin is None or not deadline:
+            return await call
+
+        timeout = deadline / 1000 - margin - time.time()
+        try:
+            return await asyncio.wait_for(call, max(timeout, 0))
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Job {job.key} of {self.config.type} overran its deadline"
+            )
+            raise JobDeadlineExceeded(job.key, margin) from None
+
+    def _map_result(
+        self,
+        job: Job,
+        ret_value: Optional[Union[BaseModel, SimpleTypes]],
+        serializer: Optional[Serializer] = None,
+    ) -> Optional[dict]:
+        """Maps the value returned by `run` to the `resultVariable` of the
+        job.
+
+        Arguments:
+            job: An instance of a job.
+            ret_value: The value returned by `run`.
+            serializer: If set, the result is encoded to JSON right away
+                with the type adapter of the return type.
 
+        Raises:
+            ValueError: If type of the returned value does not match the
+                type-hint.
+        """
         if not isinstance(ret_value, self._return_type):
             raise ValueError(
                 "Mismatch between return annotation and returned value in"
@@ -143,12 +666,20 @@ class Connector(BaseModel, metaclass=ConnectorMetaclass):
         return_variable_name = job.custom_headers.get("resultVariable", None)
 
         if return_variable_name is not None:
-            return_value = None
-
-            if isinstance(ret_value, BaseModel):
-                return_value = ret_value.model_dump()
-            else:
-                return_value = ret_value
+            with tracing.job_span("camunda.serialize", job, self.config.type):
+                if serializer is not None:
+                    return_value = serializer.encode_result(
+                        self._return_adapter, ret_value
+                    )
+                else:
+                    return_value = self._return_adapter.dump_python(ret_value)
+
+            if metrics.is_exposed():
+                if isinstance(return_value, RawJSON):
+                    size = len(return_value.data)
+                else:
+                    size = len(self._return_adapter.dump_json(ret_value))
+                metrics.RESULT_SIZE.labels(self.config.type).observe(size)
 
             return {return_variable_name: return_value}
 
@@ -1,5 +1,6 @@
-from typing import Union, Optional
+from typing import List, Set, Union, Optional
 from collections.abc import Coroutine
+from concurrent.futures import Executor
 import asyncio
 
 from loguru import logger
@@ -8,58 +9,217 @@ from pyzeebe import Job, ZeebeClient
 
 from pydantic import BaseModel, ValidationError
 
+from python_camunda_sdk import metrics, tracing
 from python_camunda_sdk.connectors.config import InboundConnectorConfig
 from python_camunda_sdk.connectors import Connector
+from python_camunda_sdk.serialization import Serializer
 from python_camunda_sdk.types import SimpleTypes
 
 
+class InboundRegistry:
+    """Keeps references to the in-flight executions of inbound connectors.
+
+    Inbound connectors complete their job straight away and execute in the
+    background. The registry keeps these executions from being garbage
+    collected, bounds their number and drains them on shutdown.
+
+    Arguments:
+        max_in_flight: Maximum number of in-flight executions. Once reached,
+            new executions wait for a free slot, which keeps their jobs
+            active and pushes back on job activation.
+    """
+
+    def __init__(self, max_in_flight: Optional[int] = None):
+        self._tasks: Set[asyncio.Task] = set()
+        self._max_in_flight = max_in_flight
+
+        if max_in_flight is None:
+            self._slots = None
+        else:
+            self._slots = asyncio.Semaphore(max_in_flight)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of in-flight executions."""
+        return len(self._tasks)
+
+    @property
+    def available(self) -> Optional[int]:
+        """Number of free slots or `None` if the registry is unbounded."""
+        if self._max_in_flight is None:
+            return None
+        return max(self._max_in_flight - self.in_flight, 0)
+
+    async def spawn(self, coro: Coroutine) -> asyncio.Task:
+        """Schedules an execution once a slot is free.
+
+        Arguments:
+            coro: Execution coroutine.
+
+        Returns:
+            A task of the execution.
+        """
+        if self._slots is not None:
+            try:
+                await self._slots.acquire()
+            except BaseException:
+                coro.close()
+                raise
+
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._discard)
+        return task
+
+    def _discard(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+
+        if self._slots is not None:
+            self._slots.release()
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Waits for the in-flight executions to finish.
+
+        Arguments:
+            timeout: Time in seconds after which the remaining executions
+                are cancelled. Waits indefinitely if not set.
+        """
+        if not self._tasks:
+            return
+
+        logger.info(f"Waiting for {self.in_flight} inbound executions")
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+
+        if pending:
+            logger.warning(f"Cancelling {len(pending)} inbound executions")
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
+    def cancel(self) -> None:
+        """Cancels the in-flight executions."""
+        for task in self._tasks:
+            task.cancel()
+
+
 class InboundConnector(Connector, base_config_cls=InboundConnectorConfig):
     """Inbound connector base class."""
 
+    @classmethod
+    def _input_variables(cls) -> List[str]:
+        variables = super()._input_variables()
+        for config_variable in ("correlation_key", "message_name"):
+            if config_variable not in variables:
+                variables.append(config_variable)
+        return variables
+
     async def _execute(
         self,
         job: Job,
         client: ZeebeClient,
         correlation_key: str,
         message_name: str,
+        executor: Optional[Executor] = None,
+        serializer: Optional[Serializer] = None,
     ):
-        variables = await super()._execute(job=job)
-        await client.publish_message(
-            name=message_name,
-            correlation_key=correlation_key,
-            variables=variables,
+        variables = await super()._execute(
+            job=job, executor=executor, serializer=serializer
         )
+        publish_latency = metrics.PUBLISH_LATENCY.labels(self.config.type)
+        publish_span = tracing.job_span(
+            "camunda.publish", job, self.config.type
+        )
+        with publish_span, publish_latency.time():
+            await client.publish_message(
+                name=message_name,
+                correlation_key=correlation_key,
+                variables=variables,
+            )
 
     @classmethod
     def to_task(
-        cls, client: ZeebeClient
+        cls,
+        client: ZeebeClient,
+        executor: Optional[Executor] = None,
+        registry: Optional[InboundRegistry] = None,
+        serializer: Optional[Serializer] = None,
     ) -> Coroutine[..., Optional[Union[BaseModel, SimpleTypes]]]:
         """Converts connector class into a pyzeebe task function.
 
+        Arguments:
+            client: Zeebe client.
+            executor: Executor for a synchronous `run` method.
+            registry: Registry of in-flight executions. If not set, a
+                registry is created for the task.
+            serializer: If set, results are published JSON encoded as
+                [RawJSON][python_camunda_sdk.serialization.RawJSON], which
+                requires a client that publishes with the same serializer.
+
         Returns:
             A coroutine that validates arguments and executes the connector
                 logic.
         """
 
+        semaphore = cls._create_concurrency_limit()
+
+        if registry is None:
+            registry = InboundRegistry()
+
+        connector_type = cls.config.type
+        jobs_completed = metrics.JOBS_COMPLETED.labels(connector_type)
+        jobs_failed = metrics.JOBS_FAILED.labels(connector_type)
+        jobs_in_flight = metrics.JOBS_IN_FLIGHT.labels(connector_type)
+        validation_failures = metrics.VALIDATION_FAILURES.labels(
+            connector_type
+        )
+
         async def task(
             job: Job, correlation_key: str, message_name: str, **kwargs
         ) -> Union[BaseModel, SimpleTypes]:
             try:
-                connector = cls(correlation_key=correlation_key, **kwargs)
+                with tracing.job_span("camunda.validate", job, connector_type):
+                    connector = cls._from_variables(
+                        {"correlation_key": correlation_key, **kwargs}
+                    )
             except ValidationError as e:
+                validation_failures.inc()
+                jobs_failed.inc()
                 logger.exception(
                     "Failed to validate arguments for " f"{cls.config.name}"
                 )
                 raise e
 
-            loop = asyncio.get_event_loop()
-            loop.create_task(
-                connector._execute(
-                    job=job,
-                    client=client,
-                    correlation_key=correlation_key,
-                    message_name=message_name,
+            if semaphore is not None:
+                await semaphore.acquire()
+
+            try:
+                execution = await registry.spawn(
+                    connector._execute(
+                        job=job,
+                        client=client,
+                        correlation_key=correlation_key,
+                        message_name=message_name,
+                        executor=executor,
+                        serializer=serializer,
+                    )
                 )
-            )
+            except BaseException:
+                if semaphore is not None:
+                    semaphore.release()
+                raise
+
+            jobs_in_flight.inc()
+
+            def finished(execution: asyncio.Task) -> None:
+                jobs_in_flight.dec()
+                if semaphore is not None:
+                    semaphore.release()
+
+                if execution.cancelled() or execution.exception():
+                    jobs_failed.inc()
+                else:
+                    jobs_completed.inc()
+
+            execution.add_done_callback(finished)
 
         return task
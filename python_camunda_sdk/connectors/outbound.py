@@ -1,5 +1,7 @@
 from typing import Union, Optional
 from collections.abc import Coroutine
+from concurrent.futures import Executor
+from contextlib import nullcontext
 
 from loguru import logger
 
@@ -8,7 +10,9 @@ from pydantic import ValidationError
 
 from pyzeebe import Job, ZeebeClient
 
+from python_camunda_sdk import metrics, tracing
 from python_camunda_sdk.connectors import OutboundConnectorConfig, Connector
+from python_camunda_sdk.serialization import Serializer
 from python_camunda_sdk.types import SimpleTypes
 
 
@@ -17,25 +21,61 @@ class OutboundConnector(Connector, base_config_cls=OutboundConnectorConfig):
 
     @classmethod
     def to_task(
-        cls, client: ZeebeClient
+        cls,
+        client: ZeebeClient,
+        executor: Optional[Executor] = None,
+        serializer: Optional[Serializer] = None,
     ) -> Coroutine[..., Optional[Union[BaseModel, SimpleTypes]]]:
         """Converts connector class into a pyzeebe task function.
 
+        Arguments:
+            client: Zeebe client.
+            executor: Executor for a synchronous `run` method.
+            serializer: If set, results are returned JSON encoded as
+                [RawJSON][python_camunda_sdk.serialization.RawJSON], which
+                requires a worker that completes jobs with the same
+                serializer.
+
         Returns:
             A coroutine that validates arguments and executes the connector
                 logic.
         """
 
+        semaphore = cls._create_concurrency_limit()
+
+        connector_type = cls.config.type
+        jobs_completed = metrics.JOBS_COMPLETED.labels(connector_type)
+        jobs_failed = metrics.JOBS_FAILED.labels(connector_type)
+        jobs_in_flight = metrics.JOBS_IN_FLIGHT.labels(connector_type)
+        validation_failures = metrics.VALIDATION_FAILURES.labels(
+            connector_type
+        )
+
         async def task(job: Job, **kwargs) -> Union[BaseModel, SimpleTypes]:
             try:
-                connector = cls(**kwargs)
+                with tracing.job_span("camunda.validate", job, connector_type):
+                    connector = cls._from_variables(kwargs)
             except ValidationError as e:
+                validation_failures.inc()
+                jobs_failed.inc()
                 logger.exception(
                     "Failed to validate arguments for " f"{cls.config.name}"
                 )
                 raise e
 
-            ret = await connector._execute(job=job)
+            jobs_in_flight.inc()
+            try:
+                async with semaphore or nullcontext():
+                    ret = await connector._execute(
+                        job=job, executor=executor, serializer=serializer
+                    )
+            except Exception:
+                jobs_failed.inc()
+                raise
+            finally:
+                jobs_in_flight.dec()
+
+            jobs_completed.inc()
             return ret
 
         return task
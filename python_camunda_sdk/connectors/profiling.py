@@ -0,0 +1,246 @@
+from typing import Any, Callable, Dict, Optional
+
+import collections
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import FrameType
+
+from loguru import logger
+
+from python_camunda_sdk.connectors.config import ProfileConfig
+
+current_profile: ContextVar[Optional["Profile"]] = ContextVar(
+    "camunda_profile", default=None
+)
+"""Profile of the job handled in the current context."""
+
+
+def _collapse(
+    frame: Optional[FrameType], root: Optional[FrameType]
+) -> Optional[str]:
+    """Returns a stack in the collapsed format of flamegraph tools, from
+    `root` to `frame`, or `None` if `root` is not on the stack.
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            f"{code.co_name} ({os.path.basename(code.co_filename)}"
+            f":{frame.f_lineno})"
+        )
+        if frame is root:
+            break
+        frame = frame.f_back
+    else:
+        if root is not None:
+            return None
+
+    return ";".join(reversed(names))
+
+
+class Profile:
+    """Stack samples of one job.
+
+    The threads that run the job register with the frame their part of
+    the job starts at. Only the stack from that frame down is sampled, so
+    other tasks interleaved on the event loop are left out.
+
+    Arguments:
+        job: The profiled job.
+    """
+
+    def __init__(self, job: Any):
+        self.job = job
+        self.stacks: Dict[str, int] = collections.Counter()
+        self._threads: Dict[int, Optional[FrameType]] = {}
+
+    @contextmanager
+    def track(self, root: Optional[FrameType] = None):
+        """Samples the current thread while in the block.
+
+        Arguments:
+            root: Frame the job starts at. The whole stack is sampled if
+                not set.
+        """
+        thread_id = threading.get_ident()
+        self._threads[thread_id] = root
+        try:
+            yield
+        finally:
+            del self._threads[thread_id]
+
+    def call(self, function: Callable[[], Any]) -> Any:
+        """Calls a function, sampling the thread it runs on. Used to
+        profile calls made on an executor.
+        """
+        with self.track():
+            return function()
+
+    def sample(self, frames: Dict[int, FrameType]) -> None:
+        """Records the stacks of the tracked threads.
+
+        Arguments:
+            frames: Current frames by thread id.
+        """
+        for thread_id, root in list(self._threads.items()):
+            stack = _collapse(frames.get(thread_id, None), root)
+            if stack is not None:
+                self.stacks[stack] += 1
+
+    def collapsed(self) -> str:
+        """Returns the samples in the collapsed stack format."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.items()
+        )
+
+
+class StackSampler:
+    """Samples the stacks of the active profiles from a daemon thread.
+
+    Arguments:
+        interval: Time in seconds between samples.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._profiles = set()
+        self._lock = threading.Lock()
+        self._active = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles.add(profile)
+            self._active.set()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="connector-profiler", daemon=True
+                )
+                self._thread.start()
+
+    def remove(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles.discard(profile)
+            if not self._profiles:
+                self._active.clear()
+
+    def _run(self) -> None:
+        while True:
+            self._active.wait()
+            time.sleep(self.interval)
+
+            frames = sys._current_frames()
+            with self._lock:
+                profiles = list(self._profiles)
+            for profile in profiles:
+                profile.sample(frames)
+            del frames
+
+
+_samplers: Dict[float, StackSampler] = {}
+
+
+class Profiler:
+    """Profiles a share of the jobs of a connector type and writes their
+    collapsed stacks to `<directory>/<type>.collapsed`.
+
+    The file is rotated once it would grow past `max_bytes`. Profiles are
+    written from a dedicated thread, so that the file IO does not block the
+    event loop.
+
+    Arguments:
+        config: Profiling config.
+        connector_type: Type of the connector.
+    """
+
+    def __init__(self, config: ProfileConfig, connector_type: str):
+        self.config = config
+        self.connector_type = connector_type
+        self.path = os.path.join(
+            config.directory, f"{connector_type}.collapsed"
+        )
+
+        if config.interval not in _samplers:
+            _samplers[config.interval] = StackSampler(config.interval)
+        self._sampler = _samplers[config.interval]
+
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"profile-{connector_type}"
+        )
+        self._last_write: Optional[Future] = None
+
+    @contextmanager
+    def profile(self, job: Any):
+        """Profiles a job while in the block if it is sampled or if the
+        profiler keeps slow jobs.
+
+        Arguments:
+            job: An instance of a job.
+        """
+        sampled = random.random() < self.config.sample_rate
+        if not sampled and self.config.latency_threshold is None:
+            yield
+            return
+
+        profile = Profile(job)
+        token = current_profile.set(profile)
+        self._sampler.add(profile)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._sampler.remove(profile)
+            current_profile.reset(token)
+
+            threshold = self.config.latency_threshold
+            if sampled or (threshold is not None and duration >= threshold):
+                self._last_write = self._writer.submit(
+                    self._write, profile, duration
+                )
+
+    def flush(self) -> None:
+        """Waits for the profiles that are being written."""
+        if self._last_write is not None:
+            self._last_write.result()
+
+    def _write(self, profile: Profile, duration: float) -> None:
+        data = profile.collapsed()
+        if not data:
+            return
+
+        try:
+            os.makedirs(self.config.directory, exist_ok=True)
+            if (
+                os.path.exists(self.path)
+                and os.path.getsize(self.path) + len(data)
+                > self.config.max_bytes
+            ):
+                self._rotate()
+            with open(self.path, "a") as f:
+                f.write(data)
+        except OSError:
+            logger.exception(f"Failed to write profile to {self.path}")
+            return
+
+        logger.debug(
+            f"Profiled job {getattr(profile.job, 'key', None)} of"
+            f" {self.connector_type} ({duration:.3f} seconds)"
+        )
+
+    def _rotate(self) -> None:
+        for i in range(self.config.backup_count - 1, 0, -1):
+            source = f"{self.path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{i + 1}")
+
+        if self.config.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
@@ -0,0 +1,208 @@
+from typing import Dict, Optional, Tuple, Union
+
+import asyncio
+import math
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from python_camunda_sdk.connectors.config import RateLimitConfig
+
+
+class TokenBucket:
+    """In-process token bucket.
+
+    Callers reserve a token even if none is available and wait until it
+    has been refilled, so waiting callers are served in order.
+
+    Arguments:
+        rate: Tokens added per second.
+        burst: Capacity of the bucket.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._updated) * self.rate, self.burst
+        )
+        self._updated = now
+        return self._tokens
+
+    def reserve(self) -> float:
+        """Takes a token.
+
+        Returns:
+            The time in seconds until the token is available.
+        """
+        self._tokens = self._refill() - 1
+        return max(-self._tokens / self.rate, 0.0)
+
+    def available(self) -> int:
+        """Returns the number of tokens that can be taken without
+        waiting.
+        """
+        return max(math.floor(self._refill()), 0)
+
+    async def acquire(self) -> float:
+        """Waits for a token.
+
+        Returns:
+            The time in seconds spent waiting.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """Token bucket in an SQLite database that is shared by several worker
+    processes on the same host.
+
+    The database is accessed from a dedicated thread, so that waiting for
+    its lock does not block the event loop. `available()` returns a value
+    that is refreshed in the background at most every `available_ttl`
+    seconds.
+
+    Arguments:
+        path: Path of the database file.
+        key: Name of the bucket.
+        rate: Tokens added per second.
+        burst: Capacity of the bucket.
+        available_ttl: Time in seconds `available()` is cached for.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        key: str,
+        rate: float,
+        burst: int,
+        available_ttl: float = 0.1,
+    ):
+        self.key = key
+        self.rate = rate
+        self.burst = burst
+        self.available_ttl = available_ttl
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"rate-limit-{key}"
+        )
+        self._available = burst
+        self._available_at = float("-inf")
+        self._refresh: Optional[Future] = None
+
+        self._connection = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS connector_rate_limit ("
+            " key TEXT PRIMARY KEY,"
+            " tokens REAL NOT NULL,"
+            " updated REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "INSERT OR IGNORE INTO connector_rate_limit VALUES (?, ?, ?)",
+            (key, float(burst), time.time()),
+        )
+
+    def _refill(self) -> float:
+        tokens, updated = self._connection.execute(
+            "SELECT tokens, updated FROM connector_rate_limit WHERE key = ?",
+            (self.key,),
+        ).fetchone()
+        return min(tokens + (time.time() - updated) * self.rate, self.burst)
+
+    def reserve(self) -> float:
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            tokens = self._refill() - 1
+            self._connection.execute(
+                "UPDATE connector_rate_limit SET tokens = ?, updated = ?"
+                " WHERE key = ?",
+                (tokens, time.time(), self.key),
+            )
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+        return max(-tokens / self.rate, 0.0)
+
+    def _read_available(self) -> int:
+        return max(math.floor(self._refill()), 0)
+
+    def _set_available(self, future: Future) -> None:
+        self._refresh = None
+        if future.exception() is None:
+            self._available = future.result()
+            self._available_at = time.monotonic()
+
+    def available(self) -> int:
+        """Returns the number of tokens that could be taken without
+        waiting when it was last read from the database.
+        """
+        if (
+            self._refresh is None
+            and time.monotonic() - self._available_at >= self.available_ttl
+        ):
+            self._refresh = self._executor.submit(self._read_available)
+            self._refresh.add_done_callback(self._set_available)
+        return self._available
+
+    async def acquire(self) -> float:
+        loop = asyncio.get_running_loop()
+        delay = await loop.run_in_executor(self._executor, self.reserve)
+        self._available = max(self._available - 1, 0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self._connection.close()
+
+
+_buckets: Dict[Tuple, TokenBucket] = {}
+
+
+def get_token_bucket(
+    config: RateLimitConfig, default_key: str
+) -> Union[TokenBucket, SQLiteTokenBucket]:
+    """Returns the token bucket described by a config. Connectors with the
+    same bucket key share one bucket.
+
+    Arguments:
+        config: Rate limit config.
+        default_key: Key of the bucket if the config sets none.
+
+    Raises:
+        ValueError: If the bucket is shared with a connector that set a
+            different rate or burst.
+    """
+    key = config.key or default_key
+    bucket_id = (config.backend, config.path, key)
+
+    if bucket_id not in _buckets:
+        if config.backend == "sqlite":
+            bucket = SQLiteTokenBucket(
+                config.path, key, config.rate, config.burst
+            )
+        else:
+            bucket = TokenBucket(config.rate, config.burst)
+        _buckets[bucket_id] = bucket
+
+    bucket = _buckets[bucket_id]
+    if (bucket.rate, bucket.burst) != (config.rate, config.burst):
+        raise ValueError(
+            f"Rate limit {key} is already used with rate {bucket.rate} and"
+            f" burst {bucket.burst}, not rate {config.rate} and burst"
+            f" {config.burst}"
+        )
+    return bucket
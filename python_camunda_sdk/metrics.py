@@ -0,0 +1,236 @@
+from typing import Any, Sequence
+
+from contextlib import contextmanager
+
+from loguru import logger
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover
+    prometheus_client = None
+
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+SIZE_BUCKETS = tuple(64 * 4**i for i in range(10))
+
+REGISTRY = (
+    prometheus_client.CollectorRegistry()
+    if prometheus_client is not None
+    else None
+)
+"""Registry of the connector metrics, `None` if `prometheus-client` is
+not installed."""
+
+_exposed = False
+
+
+class _NoopMetric:
+    """Stands in for the metrics if `prometheus-client` is not
+    installed.
+    """
+
+    def labels(self, *values: str) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def dec(self, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def observe(self, value: float) -> None:
+        pass
+
+    @contextmanager
+    def time(self):
+        yield
+
+
+def _metric(
+    kind: str,
+    name: str,
+    documentation: str,
+    label_names: Sequence[str] = (),
+    **kwargs,
+) -> Any:
+    if prometheus_client is None:
+        return _NoopMetric()
+    return getattr(prometheus_client, kind)(
+        name, documentation, label_names, registry=REGISTRY, **kwargs
+    )
+
+
+JOBS_ACTIVATED = _metric(
+    "Counter",
+    "camunda_connector_jobs_activated",
+    "Jobs activated for the connector.",
+    ["connector_type"],
+)
+JOBS_COMPLETED = _metric(
+    "Counter",
+    "camunda_connector_jobs_completed",
+    "Jobs executed successfully.",
+    ["connector_type"],
+)
+JOBS_FAILED = _metric(
+    "Counter",
+    "camunda_connector_jobs_failed",
+    "Jobs that raised an error.",
+    ["connector_type"],
+)
+VALIDATION_FAILURES = _metric(
+    "Counter",
+    "camunda_connector_validation_failures",
+    "Jobs with variables that failed validation.",
+    ["connector_type"],
+)
+JOBS_IN_FLIGHT = _metric(
+    "Gauge",
+    "camunda_connector_jobs_in_flight",
+    "Jobs that are currently executed.",
+    ["connector_type"],
+)
+RUN_LATENCY = _metric(
+    "Histogram",
+    "camunda_connector_run_seconds",
+    "Duration of the run() method.",
+    ["connector_type"],
+    buckets=LATENCY_BUCKETS,
+)
+JOB_LATENCY = _metric(
+    "Histogram",
+    "camunda_connector_job_seconds",
+    "Duration of a job from its activation until it is completed.",
+    ["connector_type"],
+    buckets=LATENCY_BUCKETS,
+)
+PUBLISH_LATENCY = _metric(
+    "Histogram",
+    "camunda_connector_publish_seconds",
+    "Duration of publishing the message of an inbound connector.",
+    ["connector_type"],
+    buckets=LATENCY_BUCKETS,
+)
+RESULT_SIZE = _metric(
+    "Histogram",
+    "camunda_connector_result_bytes",
+    "Size of the JSON encoded results.",
+    ["connector_type"],
+    buckets=SIZE_BUCKETS,
+)
+CACHE_HITS = _metric(
+    "Counter",
+    "camunda_connector_cache_hits",
+    "Results served from the result cache.",
+    ["connector_type"],
+)
+CACHE_MISSES = _metric(
+    "Counter",
+    "camunda_connector_cache_misses",
+    "Results missing from the result cache.",
+    ["connector_type"],
+)
+JOBS_COALESCED = _metric(
+    "Counter",
+    "camunda_connector_jobs_coalesced",
+    "Jobs that shared the run() of a concurrent identical job.",
+    ["connector_type"],
+)
+
+RUN_RETRIES = _metric(
+    "Counter",
+    "camunda_connector_run_retries",
+    "Failed run() calls that were retried in the worker.",
+    ["connector_type"],
+)
+
+EVENT_LOOP_LAG = _metric(
+    "Histogram",
+    "camunda_event_loop_lag_seconds",
+    "Delay of the event loop in waking up a timer.",
+    buckets=LATENCY_BUCKETS,
+)
+EVENT_LOOP_BLOCKED = _metric(
+    "Counter",
+    "camunda_event_loop_blocked",
+    "Times the event loop was blocked for longer than the threshold.",
+    ["connector_type"],
+)
+
+RATE_LIMIT_WAIT = _metric(
+    "Histogram",
+    "camunda_connector_rate_limit_wait_seconds",
+    "Time run() calls waited for the rate limit.",
+    ["connector_type"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def is_exposed() -> bool:
+    """Returns whether a metrics server is running, so that metrics that
+    are costly to measure can be skipped otherwise.
+    """
+    return _exposed
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> Any:
+    """Starts an HTTP server thread that exposes the metrics on
+    `/metrics`.
+
+    Arguments:
+        port: Port of the server.
+        host: Interface of the server.
+
+    Returns:
+        The server. Pass it to [stop_metrics_server]
+            [python_camunda_sdk.metrics.stop_metrics_server] to stop
+            exposing the metrics.
+
+    Raises:
+        ImportError: If `prometheus-client` is not installed.
+    """
+    global _exposed
+
+    if prometheus_client is None:
+        raise ImportError(
+            "Metrics require prometheus-client, install"
+            " python-camunda-sdk[prometheus]"
+        )
+    server, _ = prometheus_client.start_http_server(
+        port, addr=host, registry=REGISTRY
+    )
+    _exposed = True
+    logger.info(f"Exposing metrics on http://{host}:{port}/metrics")
+    return server
+
+
+def stop_metrics_server(server: Any) -> None:
+    """Stops a server started by [start_metrics_server]
+    [python_camunda_sdk.metrics.start_metrics_server].
+
+    Arguments:
+        server: The server.
+    """
+    global _exposed
+
+    server.shutdown()
+    server.server_close()
+    _exposed = False
@@ -2,10 +2,22 @@ from .config import ConnectionConfig, CloudConfig, InsecureConfig, SecureConfig
 
 from .runtime import CamundaRuntime
 
+from .publisher import MessagePublisher
+
+from .watchdog import LoopWatchdog
+
+from .supervisor import CamundaSupervisor
+
+from .cli import cli
+
 __all__ = [
     "ConnectionConfig",
     "CloudConfig",
     "InsecureConfig",
     "SecureConfig",
     "CamundaRuntime",
+    "MessagePublisher",
+    "LoopWatchdog",
+    "CamundaSupervisor",
+    "cli",
 ]
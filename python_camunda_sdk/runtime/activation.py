@@ -0,0 +1,148 @@
+from typing import Any, Callable, Dict, List, Optional
+
+import threading
+from collections import defaultdict
+from concurrent.futures import (
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+)
+
+CapacitySource = Callable[[], Optional[int]]
+
+
+class _InFlightMixin:
+    """Counts the calls submitted to an executor that are not done yet."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.in_flight = 0
+        self._in_flight_lock = threading.Lock()
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        future = super().submit(fn, *args, **kwargs)
+        with self._in_flight_lock:
+            self.in_flight += 1
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future) -> None:
+        with self._in_flight_lock:
+            self.in_flight -= 1
+
+
+class CountingThreadPoolExecutor(_InFlightMixin, ThreadPoolExecutor):
+    """Thread pool that counts its in-flight calls."""
+
+
+class CountingProcessPoolExecutor(_InFlightMixin, ProcessPoolExecutor):
+    """Process pool that counts its in-flight calls."""
+
+
+def executor_capacity(executor: Executor) -> Optional[int]:
+    """Returns the number of jobs an executor can take without queueing
+    them behind the jobs already submitted.
+
+    Arguments:
+        executor: A [CountingThreadPoolExecutor]
+            [python_camunda_sdk.runtime.activation.CountingThreadPoolExecutor]
+            or a [CountingProcessPoolExecutor]
+            [python_camunda_sdk.runtime.activation.CountingProcessPoolExecutor].
+
+    Returns:
+        The number of idle workers, or `None` if the executor does not
+        count its in-flight calls.
+    """
+    in_flight: Any = getattr(executor, "in_flight", None)
+    if in_flight is None:
+        return None
+    return max(executor._max_workers - in_flight, 0)
+
+
+class ActivationController:
+    """Decides how many jobs the runtime activates and how often it polls.
+
+    Every activation request is sized from the free capacity of the task,
+    which is the smallest of the pyzeebe limit and the registered
+    capacity sources (e.g. free slots of an executor).
+
+    Polls that return no jobs back off exponentially up to
+    `max_poll_delay`. Polls that fill the request reset the delay, so the
+    poll rate ramps up under load.
+
+    Arguments:
+        max_poll_delay: Maximum delay in seconds between polls of an idle
+            task. Set to 0 to disable the back-off.
+        initial_poll_delay: Delay in seconds after the first empty poll.
+        backoff_factor: Factor the delay grows by with every empty poll.
+        busy_delay: Delay in seconds before checking capacity again when
+            a task has no free capacity.
+    """
+
+    def __init__(
+        self,
+        max_poll_delay: float = 0.0,
+        initial_poll_delay: float = 0.1,
+        backoff_factor: float = 2.0,
+        busy_delay: float = 0.05,
+    ):
+        self.max_poll_delay = max_poll_delay
+        self.initial_poll_delay = initial_poll_delay
+        self.backoff_factor = backoff_factor
+        self.busy_delay = busy_delay
+
+        self._sources: Dict[str, List[CapacitySource]] = defaultdict(list)
+        self._delays: Dict[str, float] = defaultdict(float)
+
+    def add_capacity_source(
+        self, task_type: str, source: CapacitySource
+    ) -> None:
+        """Registers a source of free capacity for a task.
+
+        Arguments:
+            task_type: Type of the task.
+            source: A callable returning the number of jobs the task can
+                take, or `None` if it is not limited.
+        """
+        self._sources[task_type].append(source)
+
+    def capacity(self, task_type: str, limit: int) -> int:
+        """Returns the number of jobs to activate for a task.
+
+        Arguments:
+            task_type: Type of the task.
+            limit: Limit of the task in pyzeebe.
+        """
+        for source in self._sources.get(task_type, []):
+            free = source()
+            if free is not None:
+                limit = min(limit, free)
+        return limit
+
+    def record_poll(self, task_type: str, requested: int, activated: int):
+        """Adjusts the poll delay of a task after a poll.
+
+        Arguments:
+            task_type: Type of the task.
+            requested: Number of jobs requested.
+            activated: Number of jobs activated.
+        """
+        delay = self._delays[task_type]
+
+        if activated == 0:
+            delay = max(delay * self.backoff_factor, self.initial_poll_delay)
+        elif activated >= requested:
+            delay = 0.0
+        else:
+            delay = delay / self.backoff_factor
+
+        self._delays[task_type] = min(delay, self.max_poll_delay)
+
+    def poll_delay(self, task_type: str) -> float:
+        """Returns the delay in seconds before the next poll of a task.
+
+        Arguments:
+            task_type: Type of the task.
+        """
+        return self._delays[task_type]
@@ -0,0 +1,127 @@
+from typing import Any, Callable, List, Optional, Union
+
+import asyncio
+import itertools
+
+import grpc
+
+from grpc import ssl_channel_credentials
+
+from pyzeebe import (
+    create_insecure_channel,
+    create_camunda_cloud_channel,
+    create_secure_channel,
+)
+
+from python_camunda_sdk.runtime.config import (
+    ConnectionConfig,
+    CloudConfig,
+    SecureConfig,
+    InsecureConfig,
+)
+
+
+class _RoundRobinCallable:
+    """Multi-callable that spreads the calls over the multi-callables of
+    several channels.
+    """
+
+    def __init__(self, callables: List[Callable]):
+        self._callables = itertools.cycle(callables)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return next(self._callables)(*args, **kwargs)
+
+
+class ChannelPool:
+    """Spreads the calls of the runtime over several gRPC channels, each
+    with its own connection to the gateway.
+
+    Can be used in place of a `grpc.aio.Channel` by the pyzeebe worker and
+    client.
+
+    Arguments:
+        channels: The channels of the pool.
+    """
+
+    def __init__(self, channels: List[grpc.aio.Channel]):
+        self.channels = channels
+
+    def _multi_callable(self, kind: str, *args, **kwargs):
+        return _RoundRobinCallable(
+            [
+                getattr(channel, kind)(*args, **kwargs)
+                for channel in self.channels
+            ]
+        )
+
+    def unary_unary(self, *args, **kwargs) -> _RoundRobinCallable:
+        return self._multi_callable("unary_unary", *args, **kwargs)
+
+    def unary_stream(self, *args, **kwargs) -> _RoundRobinCallable:
+        return self._multi_callable("unary_stream", *args, **kwargs)
+
+    def stream_unary(self, *args, **kwargs) -> _RoundRobinCallable:
+        return self._multi_callable("stream_unary", *args, **kwargs)
+
+    def stream_stream(self, *args, **kwargs) -> _RoundRobinCallable:
+        return self._multi_callable("stream_stream", *args, **kwargs)
+
+    async def close(self, grace: Optional[float] = None) -> None:
+        await asyncio.gather(
+            *[channel.close(grace) for channel in self.channels]
+        )
+
+
+def _create_single_channel(config: ConnectionConfig) -> grpc.aio.Channel:
+    channel_options = config.channel_options()
+
+    if isinstance(config, CloudConfig):
+        return create_camunda_cloud_channel(
+            client_id=config.client_id,
+            client_secret=config.client_secret,
+            cluster_id=config.cluster_id,
+            region=config.region,
+            channel_options=channel_options,
+        )
+    elif isinstance(config, SecureConfig):
+        return create_secure_channel(
+            hostname=config.hostname,
+            port=config.port,
+            channel_options=channel_options,
+            channel_credentials=ssl_channel_credentials(
+                root_certificates=config.root_certificates,
+                private_key=config.private_key,
+                certificate_chain=config.certificate_chain,
+            ),
+        )
+    elif isinstance(config, InsecureConfig):
+        return create_insecure_channel(
+            hostname=config.hostname,
+            port=config.port,
+            channel_options=channel_options,
+        )
+    raise TypeError(f"Unsupported config type {type(config)}")
+
+
+def create_channel(
+    config: ConnectionConfig,
+) -> Union[grpc.aio.Channel, ChannelPool]:
+    """Creates the channel to the gateway described by a connection config.
+
+    Arguments:
+        config: Connection config.
+
+    Returns:
+        A channel, or a [ChannelPool]
+            [python_camunda_sdk.runtime.channel.ChannelPool] if
+            `channel_pool_size` is greater than one.
+    """
+    if config.channel_pool_size == 1:
+        return _create_single_channel(config)
+    return ChannelPool(
+        [
+            _create_single_channel(config)
+            for _ in range(config.channel_pool_size)
+        ]
+    )
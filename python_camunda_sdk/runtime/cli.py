@@ -0,0 +1,72 @@
+from python_camunda_sdk.connectors import InboundConnector, OutboundConnector
+from python_camunda_sdk.runtime.supervisor import CamundaSupervisor
+from python_camunda_sdk.cli import import_connector
+import click
+
+
+def parse_pin(pin):
+    connector_type, _, indices = pin.partition("=")
+
+    try:
+        return connector_type, [int(index) for index in indices.split(",")]
+    except ValueError:
+        raise click.BadParameter(f"Invalid pin {pin}")
+
+
+@click.command()
+@click.argument("connectors", type=str, nargs=-1, required=True)
+@click.option(
+    "-p",
+    "--processes",
+    type=int,
+    default=None,
+    help="Number of worker processes. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--pin",
+    "pins",
+    type=str,
+    multiple=True,
+    help="Pin a connector type to workers, e.g. my_connector=0,1",
+)
+@click.option(
+    "--max-jobs",
+    type=int,
+    default=None,
+    help="Number of jobs after which a worker is recycled.",
+)
+def cli(connectors, processes, pins, max_jobs):
+    """
+    Runs CONNECTORS in several worker processes.
+
+    CONNECTORS must be full class names including the module name,
+    e.g. mymodule.submodule.MyConnector.
+
+    Connection is configured with the environmental variables.
+    """
+    outbound_connectors = []
+    inbound_connectors = []
+
+    for connector in connectors:
+        connector_cls = import_connector(connector)
+        if not isinstance(connector_cls, type):
+            raise click.BadParameter(f"{connector} is not a connector")
+        elif issubclass(connector_cls, OutboundConnector):
+            outbound_connectors.append(connector_cls)
+        elif issubclass(connector_cls, InboundConnector):
+            inbound_connectors.append(connector_cls)
+        else:
+            raise click.BadParameter(f"{connector} is not a connector")
+
+    supervisor = CamundaSupervisor(
+        outbound_connectors=outbound_connectors,
+        inbound_connectors=inbound_connectors,
+        processes=processes,
+        pins=dict(parse_pin(pin) for pin in pins),
+        max_jobs=max_jobs,
+    )
+    supervisor.start()
+
+
+if __name__ == "__main__":
+    cli()
@@ -1,5 +1,7 @@
 import os
-from typing import Optional
+from typing import Any, Dict, Literal, Optional
+
+import grpc
 
 from pydantic import BaseModel, Field
 
@@ -7,9 +9,105 @@ from loguru import logger
 
 
 class ConnectionConfig(BaseModel):
-    """Base class for connection configuration."""
+    """Base class for connection configuration.
+
+    The gRPC settings apply to every channel of the runtime.
+
+    Attributes:
+        keepalive_time_ms: `CAMUNDA_GRPC_KEEPALIVE_TIME_MS`. Time between
+            keepalive pings.
+        keepalive_timeout_ms: `CAMUNDA_GRPC_KEEPALIVE_TIMEOUT_MS`. Time to
+            wait for a ping to be acknowledged before the connection is
+            closed.
+        keepalive_permit_without_calls:
+            `CAMUNDA_GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS`. Keep pinging
+            while there are no calls, so that idle load balancers do not
+            drop the connection.
+        compression: `CAMUNDA_GRPC_COMPRESSION`. Compression of the
+            requests, e.g. `gzip` for large variable payloads.
+        max_send_message_length: `CAMUNDA_GRPC_MAX_SEND_MESSAGE_LENGTH`.
+            Maximum size of a request in bytes.
+        max_receive_message_length:
+            `CAMUNDA_GRPC_MAX_RECEIVE_MESSAGE_LENGTH`. Maximum size of a
+            response in bytes, e.g. of a batch of activated jobs.
+        channel_pool_size: `CAMUNDA_GRPC_CHANNEL_POOL_SIZE`. Number of
+            channels, each with its own connection, that the calls are
+            spread over.
+    """
+
+    keepalive_time_ms: int = Field(
+        default=45_000,
+        gt=0,
+        json_schema_extra={
+            "env_var": "CAMUNDA_GRPC_KEEPALIVE_TIME_MS"
+        }
+    )
+    keepalive_timeout_ms: Optional[int] = Field(
+        default=None,
+        gt=0,
+        json_schema_extra={
+            "env_var": "CAMUNDA_GRPC_KEEPALIVE_TIMEOUT_MS"
+        }
+    )
+    keepalive_permit_without_calls: bool = Field(
+        default=False,
+        json_schema_extra={
+            "env_var": "CAMUNDA_GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS"
+        }
+    )
+    compression: Literal["none", "gzip", "deflate"] = Field(
+        default="none",
+        json_schema_extra={
+            "env_var": "CAMUNDA_GRPC_COMPRESSION"
+        }
+    )
+    max_send_message_length: Optional[int] = Field(
+        default=None,
+        json_schema_extra={
+            "env_var": "CAMUNDA_GRPC_MAX_SEND_MESSAGE_LENGTH"
+        }
+    )
+    max_receive_message_length: Optional[int] = Field(
+        default=None,
+        json_schema_extra={
+            "env_var": "CAMUNDA_GRPC_MAX_RECEIVE_MESSAGE_LENGTH"
+        }
+    )
+    channel_pool_size: int = Field(
+        default=1,
+        ge=1,
+        json_schema_extra={
+            "env_var": "CAMUNDA_GRPC_CHANNEL_POOL_SIZE"
+        }
+    )
 
-    pass
+    def channel_options(self) -> Dict[str, Any]:
+        """Returns the gRPC channel arguments of the config."""
+        options = {"grpc.keepalive_time_ms": self.keepalive_time_ms}
+
+        if self.keepalive_timeout_ms is not None:
+            options["grpc.keepalive_timeout_ms"] = self.keepalive_timeout_ms
+        if self.keepalive_permit_without_calls:
+            options["grpc.keepalive_permit_without_calls"] = 1
+            options["grpc.http2.max_pings_without_data"] = 0
+        if self.compression != "none":
+            options["grpc.default_compression_algorithm"] = int(
+                getattr(grpc.Compression, self.compression.capitalize())
+            )
+        if self.max_send_message_length is not None:
+            options["grpc.max_send_message_length"] = (
+                self.max_send_message_length
+            )
+        if self.max_receive_message_length is not None:
+            options["grpc.max_receive_message_length"] = (
+                self.max_receive_message_length
+            )
+        if self.channel_pool_size > 1:
+            # Channels to the same target share their connections unless
+            # each has its own subchannel pool.
+            options["grpc.use_local_subchannel_pool"] = 1
+
+        return options
 
 
 class CloudConfig(ConnectionConfig):
@@ -119,6 +217,8 @@ def generate_config_from_env() -> ConnectionConfig:
     data = {}
     for field_name, field in config_cls.model_fields.items():
         env_var = field.json_schema_extra["env_var"]
-        data[field_name] = os.environ.get(env_var, None)
+        value = os.environ.get(env_var, None)
+        if value is not None:
+            data[field_name] = value
 
     return config_cls(**data)
@@ -0,0 +1,104 @@
+from typing import Dict, Optional
+
+import asyncio
+
+from loguru import logger
+
+from pyzeebe import ZeebeClient
+from pyzeebe.errors import ZeebeBackPressureError, ZeebeGatewayUnavailableError
+
+
+class MessagePublisher:
+    """Publishes messages of the inbound connectors with a bounded number
+    of concurrent calls.
+
+    Zeebe has no batch publish call, so every message is still published
+    with its own `PublishMessage` call. The publisher only limits how many
+    of these calls share the gRPC channel of the client at a time, so that
+    a burst of inbound executions does not flood the gateway. Every
+    message is retried on back pressure and gateway unavailability, and
+    its own error is raised to its publisher.
+
+    Has the same `publish_message` signature as `ZeebeClient`, so it can be
+    passed to [InboundConnector.to_task]
+    [python_camunda_sdk.connectors.inbound.InboundConnector.to_task]
+    as a client.
+
+    Arguments:
+        client: Zeebe client.
+        max_concurrency: Maximum number of concurrent publish calls.
+        max_retries: Number of retries of a message on transient errors.
+        retry_delay: Delay in seconds between the retries.
+    """
+
+    def __init__(
+        self,
+        client: ZeebeClient,
+        max_concurrency: int = 32,
+        max_retries: int = 3,
+        retry_delay: float = 0.1,
+    ):
+        self._client = client
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def publish_message(
+        self,
+        name: str,
+        correlation_key: str,
+        variables: Optional[Dict] = None,
+        time_to_live_in_milliseconds: int = 60000,
+        message_id: Optional[str] = None,
+    ) -> None:
+        """Publishes a message once fewer than `max_concurrency` calls are
+        in flight.
+
+        Returns once the message is published.
+
+        Raises:
+            Exception: The error of the publish call of this message.
+        """
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            async with self._semaphore:
+                await self._publish(
+                    {
+                        "name": name,
+                        "correlation_key": correlation_key,
+                        "variables": variables,
+                        "time_to_live_in_milliseconds": (
+                            time_to_live_in_milliseconds
+                        ),
+                        "message_id": message_id,
+                    }
+                )
+        finally:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._idle.set()
+
+    async def _publish(self, message: Dict) -> None:
+        for attempt in range(self._max_retries + 1):
+            try:
+                return await self._client.publish_message(**message)
+            except (
+                ZeebeBackPressureError,
+                ZeebeGatewayUnavailableError,
+            ) as e:
+                if attempt == self._max_retries:
+                    raise
+                logger.warning(
+                    f"Failed to publish {message['name']} ({e!r}),"
+                    f" retrying in {self._retry_delay} seconds"
+                )
+                await asyncio.sleep(self._retry_delay)
+
+    async def close(self) -> None:
+        """Waits for the messages that are being published."""
+        await self._idle.wait()
@@ -1,26 +1,47 @@
-from typing import List, Type, Optional, Union
+from typing import Any, Dict, List, Tuple, Type, Optional, Union
+from concurrent.futures import Executor
 
-from grpc import ssl_channel_credentials
+import functools
+import multiprocessing
+import signal
 
 import asyncio
 
 from pyzeebe import (
-    ZeebeWorker,
+    Job,
+    default_exception_handler,
     ZeebeClient,
-    create_insecure_channel,
-    create_camunda_cloud_channel,
-    create_secure_channel,
 )
 
 from loguru import logger
 
-from python_camunda_sdk.connectors import OutboundConnector, InboundConnector
+from python_camunda_sdk.metrics import (
+    start_metrics_server,
+    stop_metrics_server,
+)
+from python_camunda_sdk.tracing import enable_tracing
+from python_camunda_sdk.serialization import Serializer, default_serializer
+from python_camunda_sdk.connectors import (
+    ConnectorConfig,
+    OutboundConnector,
+    BatchOutboundConnector,
+    InboundConnector,
+    InboundRegistry,
+    JobDeadlineExceeded,
+)
 
+from python_camunda_sdk.runtime.channel import create_channel
+from python_camunda_sdk.runtime.publisher import MessagePublisher
+from python_camunda_sdk.runtime.worker import RuntimeAdapter, RuntimeWorker
+from python_camunda_sdk.runtime.watchdog import LoopWatchdog
+from python_camunda_sdk.runtime.activation import (
+    ActivationController,
+    CountingProcessPoolExecutor,
+    CountingThreadPoolExecutor,
+    executor_capacity,
+)
 from python_camunda_sdk.runtime.config import (
     ConnectionConfig,
-    CloudConfig,
-    SecureConfig,
-    InsecureConfig,
     generate_config_from_env,
 )
 
@@ -37,6 +58,49 @@ class CamundaRuntime:
         config: Connection config.
         outbound_connectors: A list of outbound connector classes.
         inbound_connectors: A list of the inbound connector classes.
+        max_workers: Size of the thread pool shared by the connectors with
+            a synchronous `run()` method. Connectors can request a
+            dedicated pool with `max_workers` in their config.
+        max_processes: Size of the process pool shared by the connectors
+            with `execution_mode="process"`. Defaults to the number of
+            CPUs.
+        max_jobs: Number of jobs after which the runtime stops. Used by
+            [CamundaSupervisor]
+            [python_camunda_sdk.runtime.supervisor.CamundaSupervisor]
+            to recycle worker processes.
+        max_inbound_in_flight: Maximum number of in-flight inbound
+            connector executions. Once reached, inbound jobs wait for a
+            free slot before they are completed.
+        shutdown_timeout: Time in seconds to wait for running jobs and
+            in-flight inbound executions when the runtime stops, counted
+            once from the stop. Jobs that are still running are then
+            cancelled and failed, so that another worker picks them up.
+        publish_concurrency: If set, messages of the inbound connectors
+            are published by a [MessagePublisher]
+            [python_camunda_sdk.runtime.publisher.MessagePublisher] with
+            at most this many concurrent publish calls.
+        stream_jobs: Receive jobs through job streaming instead of
+            long-polling. Falls back to polling if the gateway does not
+            support job streaming.
+        max_poll_delay: Maximum delay in seconds between polls of an idle
+            connector. Polls back off exponentially up to this delay while
+            they return no jobs and ramp up again under load. Disabled by
+            default.
+        metrics_port: If set, exposes Prometheus metrics of the connectors
+            on `/metrics` of this port. Requires `prometheus-client`.
+        metrics_host: Interface of the metrics server.
+        tracing: Emit OpenTelemetry spans for the handled jobs with the
+            global tracer provider. Requires `opentelemetry-api`.
+        serializer: Serializer of the job variables, connector results and
+            message variables. Defaults to orjson if it is installed.
+        handle_signals: Stop the runtime gracefully on SIGTERM and SIGINT
+            when it is started with
+            [start][python_camunda_sdk.runtime.runtime.CamundaRuntime.start].
+            A second signal cancels the running jobs right away.
+        loop_lag_threshold: If set, a
+            [LoopWatchdog][python_camunda_sdk.runtime.watchdog.LoopWatchdog]
+            logs the job and a stack sample whenever the event loop is
+            blocked for longer than this many seconds.
     """
 
     def __init__(
@@ -44,6 +108,20 @@ class CamundaRuntime:
         config: Optional[ConnectionConfig] = None,
         outbound_connectors: List[Type[OutboundConnector]] = [],
         inbound_connectors: List[Type[InboundConnector]] = [],
+        max_workers: Optional[int] = None,
+        max_processes: Optional[int] = None,
+        max_jobs: Optional[int] = None,
+        max_inbound_in_flight: Optional[int] = None,
+        shutdown_timeout: float = 30.0,
+        publish_concurrency: Optional[int] = None,
+        stream_jobs: bool = False,
+        max_poll_delay: float = 0.0,
+        metrics_port: Optional[int] = None,
+        metrics_host: str = "0.0.0.0",
+        tracing: bool = False,
+        serializer: Optional[Serializer] = None,
+        handle_signals: bool = True,
+        loop_lag_threshold: Optional[float] = None,
     ):
         if config is None:
             self._config = generate_config_from_env()
@@ -54,27 +132,105 @@ class CamundaRuntime:
 
         self._inbound_connectors = inbound_connectors
 
+        self._max_workers = max_workers
+        self._max_processes = max_processes
+        self._executors: Dict[Tuple[str, Optional[str]], Executor] = {}
+
+        self._max_jobs = max_jobs
+        self._jobs_handled = 0
+        self._stopping: Optional[asyncio.Task] = None
+        self._stop_deadline: Optional[float] = None
+
+        self._inbound_registry = InboundRegistry(
+            max_in_flight=max_inbound_in_flight
+        )
+        self._shutdown_timeout = shutdown_timeout
+        self._handle_signals = handle_signals
+
+        self._publish_concurrency = publish_concurrency
+        self._publisher: Optional[MessagePublisher] = None
+
+        self._stream_jobs = stream_jobs
+        self._controller = ActivationController(max_poll_delay=max_poll_delay)
+
+        self._metrics_port = metrics_port
+        self._metrics_host = metrics_host
+
+        if tracing:
+            enable_tracing()
+
+        self._serializer = serializer or default_serializer()
+
+        self._watchdog: Optional[LoopWatchdog] = None
+        if loop_lag_threshold is not None:
+            self._watchdog = LoopWatchdog(threshold=loop_lag_threshold)
+
+    @property
+    def inbound_in_flight(self) -> int:
+        """Number of in-flight inbound connector executions."""
+        return self._inbound_registry.in_flight
+
     @logger.catch(message="Failed to connect to Zebee", reraise=True)
     def _connect(self):
-        if isinstance(self._config, CloudConfig):
-            channel = create_camunda_cloud_channel(**self._config.model_dump())
-        elif isinstance(self._config, InsecureConfig):
-            channel = create_insecure_channel(**self._config.model_dump())
-        elif isinstance(self._config, SecureConfig):
-            channel = create_secure_channel(
-                hostname=self._config.hostname,
-                port=self._config.port,
-                channel_credentials=ssl_channel_credentials(
-                    root_certificates=self._config.root_certificates,
-                    private_key=self._config.private_key,
-                    certificate_chain=self._config.certificate_chain,
-                ),
+        channel = create_channel(self._config)
+
+        self._channel = channel
+        self._worker = RuntimeWorker(
+            channel,
+            stream_jobs=self._stream_jobs,
+            controller=self._controller,
+            serializer=self._serializer,
+        )
+        self._client = ZeebeClient(channel)
+        self._client.zeebe_adapter = RuntimeAdapter(
+            channel,
+            self._client.zeebe_adapter._max_connection_retries,
+            serializer=self._serializer,
+        )
+
+        if self._publish_concurrency is not None:
+            self._publisher = MessagePublisher(
+                self._client, max_concurrency=self._publish_concurrency
             )
+
+    def _get_executor(self, config: ConnectorConfig) -> Executor:
+        """Returns an executor for the `run()` method of a connector.
+
+        Process pools use the `spawn` start method, since the gRPC channel
+        of the runtime is not fork-safe.
+
+        Args:
+            config: Connector config.
+        """
+        if config.max_workers is not None:
+            key = (config.execution_mode, config.type)
+            max_workers = config.max_workers
         else:
-            raise TypeError(f"Unsupported config type {type(self._config)}")
+            key = (config.execution_mode, None)
+            if config.execution_mode == "process":
+                max_workers = self._max_processes
+            else:
+                max_workers = self._max_workers
 
-        self._worker = ZeebeWorker(channel)
-        self._client = ZeebeClient(channel)
+        if key not in self._executors:
+            if config.execution_mode == "process":
+                executor = CountingProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                executor = CountingThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=f"connector-{key[1] or 'shared'}",
+                )
+            self._executors[key] = executor
+
+        return self._executors[key]
+
+    def _shutdown_executors(self) -> None:
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors = {}
 
     @logger.catch(message="Failed to load connector")
     def _load_connector(
@@ -87,17 +243,194 @@ class CamundaRuntime:
         """
         config = connector_cls.config
 
+        limits = {}
+        if config.max_concurrency is not None:
+            limits["max_jobs_to_activate"] = config.max_concurrency
+            limits["max_running_jobs"] = config.max_concurrency
+        elif issubclass(connector_cls, BatchOutboundConnector):
+            # Let a full batch be activated and running at once.
+            batch_limit = max(config.batch_size, 32)
+            limits["max_jobs_to_activate"] = batch_limit
+            limits["max_running_jobs"] = batch_limit
+
         task_wrapper = self._worker.task(
             task_type=config.type,
             timeout_ms=config.timeout * 1000,
+            variables_to_fetch=connector_cls._variables_to_fetch(),
+            exception_handler=functools.partial(
+                self._handle_exception, config
+            ),
             before=[],
-            after=[],
+            after=[self._count_job],
+            **limits,
+        )
+
+        executor = self._get_executor(config)
+        uses_executor = (
+            config.execution_mode == "process"
+            or not connector_cls._is_coroutine
+        )
+        if uses_executor:
+            self._controller.add_capacity_source(
+                config.type, functools.partial(executor_capacity, executor)
+            )
+
+        token_bucket = connector_cls._get_token_bucket()
+        if token_bucket is not None:
+            self._controller.add_capacity_source(
+                config.type, token_bucket.available
+            )
+
+        task_kwargs = {
+            "client": self._client,
+            "executor": executor,
+            "serializer": self._serializer,
+        }
+        if issubclass(connector_cls, InboundConnector):
+            task_kwargs["registry"] = self._inbound_registry
+            self._controller.add_capacity_source(
+                config.type, lambda: self._inbound_registry.available
+            )
+            if self._publisher is not None:
+                task_kwargs["client"] = self._publisher
+
+        task_wrapper(connector_cls.to_task(**task_kwargs))
+
+    async def _handle_exception(
+        self, config: ConnectorConfig, exception: Exception, job: Job
+    ) -> None:
+        """Reports a failed job, unless it overran its deadline and the
+        connector does not report those.
+        """
+        if (
+            isinstance(exception, JobDeadlineExceeded)
+            and not config.report_deadline
+        ):
+            return
+        await default_exception_handler(exception, job)
+
+    async def _count_job(self, job: Job) -> Job:
+        """Counts handled jobs and stops the runtime once `max_jobs` is
+        reached.
+        """
+        self._jobs_handled += 1
+
+        if (
+            self._max_jobs is not None
+            and self._jobs_handled >= self._max_jobs
+            and self._stopping is None
+        ):
+            logger.info(f"Handled {self._jobs_handled} jobs, stopping")
+            self._request_stop()
+
+        return job
+
+    def _request_stop(self) -> asyncio.Task:
+        """Starts stopping the worker unless it is already stopping.
+
+        Returns:
+            The task that stops the worker.
+        """
+        if self._stopping is None:
+            loop = asyncio.get_running_loop()
+            self._stop_deadline = loop.time() + self._shutdown_timeout
+            self._stopping = loop.create_task(
+                self._worker.stop(timeout=self._shutdown_timeout)
+            )
+        return self._stopping
+
+    def _remaining_shutdown_time(self) -> float:
+        """Returns the time in seconds left of the `shutdown_timeout`
+        that started with the stop.
+        """
+        if self._stop_deadline is None:
+            return self._shutdown_timeout
+        return max(
+            self._stop_deadline - asyncio.get_running_loop().time(), 0.0
         )
-        task_wrapper(connector_cls.to_task(client=self._client))
 
-    async def main(self):
+    def _on_signal(self, signum: int) -> None:
+        """Stops the runtime gracefully on the first signal and cancels
+        the running jobs and inbound executions on the next one.
+        """
+        name = signal.Signals(signum).name
+        if self._stopping is None:
+            logger.info(f"Received {name}, stopping")
+            self._request_stop()
+        else:
+            logger.warning(f"Received {name} again, cancelling running jobs")
+            self._stop_deadline = asyncio.get_running_loop().time()
+            self._worker.force_stop()
+            self._inbound_registry.cancel()
+
+    def _add_signal_handlers(self) -> Dict[int, Any]:
+        """Stops the runtime on SIGTERM and SIGINT.
+
+        Returns:
+            The previous handlers of the handled signals.
+        """
+        loop = asyncio.get_running_loop()
+        previous = {}
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            # Handlers added to the loop are not visible to the signal
+            # module, which only sees a no-op.
+            handler = getattr(loop, "_signal_handlers", {}).get(signum)
+            if handler is None:
+                handler = signal.getsignal(signum)
+            try:
+                loop.add_signal_handler(signum, self._on_signal, signum)
+            except (NotImplementedError, RuntimeError, ValueError):
+                # Not supported on Windows or outside the main thread.
+                logger.debug(f"Cannot handle {signum.name}")
+                continue
+            previous[signum] = handler
+        return previous
+
+    def _restore_signal_handlers(self, previous: Dict[int, Any]) -> None:
+        """Restores the handlers replaced by `_add_signal_handlers`."""
+        loop = asyncio.get_running_loop()
+        for signum, handler in previous.items():
+            loop.remove_signal_handler(signum)
+            if isinstance(handler, asyncio.Handle):
+                loop.add_signal_handler(
+                    signum, handler._callback, *handler._args
+                )
+            elif handler is not None:
+                signal.signal(signum, handler)
+
+    async def stop(self):
+        """Stops activating jobs and waits up to `shutdown_timeout` for the
+        running jobs to finish. Jobs that do not finish in time are failed
+        without using up a retry. In-flight inbound executions are drained
+        by [main][python_camunda_sdk.runtime.runtime.CamundaRuntime.main]
+        once the worker has stopped, within what is left of the timeout.
+        """
+        await asyncio.shield(self._request_stop())
+
+    async def _stop_connectors(
+        self,
+        connectors: List[Type[Union[OutboundConnector, InboundConnector]]],
+    ) -> None:
+        """Tears down the resources of the connectors in reverse order of
+        their setup.
+        """
+        for connector_cls in reversed(connectors):
+            try:
+                await connector_cls._stop()
+            except Exception:
+                logger.exception(
+                    f"Failed to tear down {connector_cls.config.name}"
+                )
+
+    async def main(self, handle_signals: bool = False):
         """Main asyncronous method of the runtime. Use it if you want to
         run the runtime inside your async loop.
+
+        Arguments:
+            handle_signals: Stop the runtime on SIGTERM and SIGINT. Off by
+                default, so that the signal handlers of your application
+                are left alone. The previous handlers are restored once
+                the runtime has stopped.
         """
         self._connect()
 
@@ -110,12 +443,49 @@ class CamundaRuntime:
             )
             self._load_connector(connector_cls)
 
-        logger.info("Starting runtime")
-        await self._worker.work()
+        metrics_server = None
+        if self._metrics_port is not None:
+            metrics_server = start_metrics_server(
+                self._metrics_port, host=self._metrics_host
+            )
+
+        if self._watchdog is not None:
+            await self._watchdog.start()
+
+        previous_handlers = {}
+        if handle_signals:
+            previous_handlers = self._add_signal_handlers()
+
+        started = []
+        try:
+            for connector_cls in connectors:
+                await connector_cls._start()
+                started.append(connector_cls)
+
+            logger.info("Starting runtime")
+            await self._worker.work()
+            if self._stopping is not None:
+                await self._stopping
+            await self._inbound_registry.drain(
+                timeout=self._remaining_shutdown_time()
+            )
+            if self._publisher is not None:
+                await self._publisher.close()
+        finally:
+            await self._stop_connectors(started)
+            self._shutdown_executors()
+            if self._watchdog is not None:
+                await self._watchdog.stop()
+            if metrics_server is not None:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, stop_metrics_server, metrics_server
+                )
+            self._restore_signal_handlers(previous_handlers)
+            await self._channel.close()
 
     def start(self):
         """Syncronous method to start the runtime. Will run in the main
         asycn loop.
         """
         loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.main())
+        loop.run_until_complete(self.main(handle_signals=self._handle_signals))
@@ -0,0 +1,273 @@
+from typing import Any, Dict, List, Optional, Type, Union
+
+import os
+import multiprocessing
+import signal
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+
+import time
+
+from loguru import logger
+
+from python_camunda_sdk.connectors import OutboundConnector, InboundConnector
+
+from python_camunda_sdk.runtime.config import (
+    ConnectionConfig,
+    generate_config_from_env,
+)
+from python_camunda_sdk.runtime.runtime import CamundaRuntime
+
+
+def _run_worker(
+    index: int,
+    config: ConnectionConfig,
+    outbound_connectors: List[Type[OutboundConnector]],
+    inbound_connectors: List[Type[InboundConnector]],
+    runtime_kwargs: Dict[str, Any],
+) -> None:
+    """Entry point of a worker process.
+
+    Every worker creates its own runtime and therefore its own gRPC
+    channel and pyzeebe worker.
+    """
+    # Forked workers inherit the SIGTERM handler of the supervisor.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    logger.info(f"Starting worker {index} (pid {os.getpid()})")
+    runtime = CamundaRuntime(
+        config=config,
+        outbound_connectors=outbound_connectors,
+        inbound_connectors=inbound_connectors,
+        **runtime_kwargs,
+    )
+    runtime.start()
+
+
+class _Terminated(Exception):
+    """Raised in the supervisor when it receives SIGTERM."""
+
+
+class CamundaSupervisor:
+    """Runs connectors in several worker processes, each with its own
+    [CamundaRuntime][python_camunda_sdk.runtime.runtime.CamundaRuntime].
+
+    Worker processes that crash are restarted. Workers can be recycled
+    after a number of handled jobs by setting `max_jobs`.
+
+    On SIGTERM or `KeyboardInterrupt` the workers are terminated, which
+    makes them drain their running jobs and inbound executions. Workers
+    that are still alive after their `shutdown_timeout` plus
+    `kill_margin` are killed.
+
+    !!! tip
+        If `config` is not supplied will attempt to
+            generate from the environmental variables.
+
+    Example:
+        ```py
+        supervisor = CamundaSupervisor(
+            config=config,
+            outbound_connectors=[LogConnector, RenderConnector],
+            processes=4,
+            pins={"render": [2, 3]},
+            max_jobs=10000,
+        )
+        supervisor.start()
+        ```
+        Will start 4 workers. `render` jobs are handled by workers 2 and 3
+        only, `log` jobs are handled by all of them.
+
+    Arguments:
+        config: Connection config.
+        outbound_connectors: A list of outbound connector classes.
+        inbound_connectors: A list of the inbound connector classes.
+        processes: Number of worker processes. Defaults to the number of
+            CPUs.
+        pins: Mapping of connector types to the indices of the workers that
+            handle them. Connectors that are not pinned are handled by all
+            workers.
+        max_jobs: Number of jobs after which a worker is recycled.
+        restart_delay: Delay in seconds before restarting a crashed worker.
+        **runtime_kwargs: Extra arguments passed to every
+            [CamundaRuntime][python_camunda_sdk.runtime.runtime.CamundaRuntime].
+            Every worker serves its own metrics, so worker `i` listens on
+            `metrics_port + i`.
+
+    Raises:
+        ValueError: If a connector is pinned to a non-existent worker.
+    """
+
+    kill_margin = 5.0
+    """Time in seconds added to the drain time of the workers before they
+    are killed."""
+
+    def __init__(
+        self,
+        config: Optional[ConnectionConfig] = None,
+        outbound_connectors: List[Type[OutboundConnector]] = [],
+        inbound_connectors: List[Type[InboundConnector]] = [],
+        processes: Optional[int] = None,
+        pins: Dict[str, List[int]] = {},
+        max_jobs: Optional[int] = None,
+        restart_delay: float = 1.0,
+        **runtime_kwargs,
+    ):
+        if config is None:
+            self._config = generate_config_from_env()
+        else:
+            self._config = config
+
+        self._outbound_connectors = outbound_connectors
+        self._inbound_connectors = inbound_connectors
+
+        self._processes = processes or os.cpu_count() or 1
+
+        for connector_type, indices in pins.items():
+            for index in indices:
+                if not 0 <= index < self._processes:
+                    raise ValueError(
+                        f"Connector {connector_type} is pinned to worker"
+                        f" {index}, but there are only {self._processes}"
+                        " workers"
+                    )
+        self._pins = pins
+
+        self._restart_delay = restart_delay
+        self._runtime_kwargs = {"max_jobs": max_jobs, **runtime_kwargs}
+
+        self._workers: Dict[int, BaseProcess] = {}
+        self._context = multiprocessing.get_context()
+
+    def _is_assigned(
+        self,
+        connector_cls: Type[Union[OutboundConnector, InboundConnector]],
+        index: int,
+    ) -> bool:
+        indices = self._pins.get(connector_cls.config.type, None)
+        return indices is None or index in indices
+
+    def _connectors_for(self, index: int) -> Dict[str, list]:
+        """Returns the connectors handled by a worker.
+
+        Args:
+            index: Index of the worker.
+        """
+        return {
+            "outbound_connectors": [
+                connector_cls
+                for connector_cls in self._outbound_connectors
+                if self._is_assigned(connector_cls, index)
+            ],
+            "inbound_connectors": [
+                connector_cls
+                for connector_cls in self._inbound_connectors
+                if self._is_assigned(connector_cls, index)
+            ],
+        }
+
+    def _runtime_kwargs_for(self, index: int) -> Dict[str, Any]:
+        """Returns the arguments of the runtime of a worker.
+
+        Args:
+            index: Index of the worker.
+        """
+        runtime_kwargs = dict(self._runtime_kwargs)
+        if runtime_kwargs.get("metrics_port", None) is not None:
+            runtime_kwargs["metrics_port"] += index
+        return runtime_kwargs
+
+    def _spawn(self, index: int) -> BaseProcess:
+        connectors = self._connectors_for(index)
+        process = self._context.Process(
+            target=_run_worker,
+            name=f"camunda-worker-{index}",
+            args=(
+                index,
+                self._config,
+                connectors["outbound_connectors"],
+                connectors["inbound_connectors"],
+                self._runtime_kwargs_for(index),
+            ),
+        )
+        process.start()
+        self._workers[index] = process
+        return process
+
+    def _restart_exited(self) -> None:
+        for index, process in list(self._workers.items()):
+            if process.is_alive():
+                continue
+
+            if process.exitcode == 0:
+                logger.info(f"Worker {index} finished, recycling")
+            else:
+                logger.warning(
+                    f"Worker {index} exited with code {process.exitcode},"
+                    " restarting"
+                )
+                time.sleep(self._restart_delay)
+
+            process.close()
+            self._spawn(index)
+
+    def _kill_timeout(self) -> float:
+        """Returns the time in seconds to wait for the workers to exit
+        before killing them.
+        """
+        shutdown_timeout = self._runtime_kwargs.get("shutdown_timeout", 30.0)
+        return shutdown_timeout + self.kill_margin
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Terminates all worker processes.
+
+        Args:
+            timeout: Time in seconds to wait for the workers to exit before
+                killing them. Defaults to the time the workers may take to
+                drain plus `kill_margin`.
+        """
+        if timeout is None:
+            timeout = self._kill_timeout()
+        workers, self._workers = self._workers, {}
+
+        for process in workers.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + timeout
+        for process in workers.values():
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+    def _on_sigterm(self, signum: int, frame: Any) -> None:
+        raise _Terminated()
+
+    def start(self) -> None:
+        """Starts the worker processes and supervises them until
+        interrupted or terminated.
+        """
+        for index in range(self._processes):
+            connectors = self._connectors_for(index)
+            if not any(connectors.values()):
+                logger.warning(f"No connectors assigned to worker {index}")
+                continue
+            self._spawn(index)
+
+        if not self._workers:
+            raise ValueError("No workers to supervise")
+
+        logger.info(f"Supervising {len(self._workers)} workers")
+        previous_handler = signal.signal(signal.SIGTERM, self._on_sigterm)
+        try:
+            while True:
+                wait([worker.sentinel for worker in self._workers.values()])
+                self._restart_exited()
+        except (KeyboardInterrupt, _Terminated):
+            logger.info("Stopping workers")
+        finally:
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            try:
+                self.stop()
+            finally:
+                signal.signal(signal.SIGTERM, previous_handler)
@@ -0,0 +1,123 @@
+from typing import Optional
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+
+from loguru import logger
+
+from python_camunda_sdk import metrics
+
+
+def _find_job(frame: Optional[FrameType]) -> Optional[object]:
+    """Returns the job handled by the innermost frame of a stack that has a
+    `job` local, or `None` if no frame handles a job.
+    """
+    while frame is not None:
+        job = frame.f_locals.get("job", None)
+        if hasattr(job, "key") and hasattr(job, "type"):
+            return job
+        frame = frame.f_back
+    return None
+
+
+class LoopWatchdog:
+    """Measures the lag of the event loop and reports what blocks it.
+
+    A heartbeat coroutine measures how late the loop wakes it up and
+    exports the lag as `camunda_event_loop_lag_seconds`. A thread checks
+    the heartbeat and, once the loop has been blocked for longer than
+    `threshold`, logs the connector type and key of the job that was
+    running, along with a stack sample of the loop thread.
+
+    Arguments:
+        threshold: Time in seconds the loop may be blocked before it is
+            reported.
+        interval: Time in seconds between heartbeats.
+        stack_limit: Maximum number of frames in the stack sample.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        interval: float = 0.1,
+        stack_limit: int = 20,
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self.stack_limit = stack_limit
+
+        self._beat = 0.0
+        self._reported = False
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    async def start(self) -> None:
+        """Starts watching the running loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+
+        self._heartbeat_task = asyncio.get_running_loop().create_task(
+            self._heartbeat()
+        )
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stops the heartbeat and the watchdog thread."""
+        self._stopped.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+        if self._thread is not None:
+            self._thread.join()
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            metrics.EVENT_LOOP_LAG.observe(
+                max(loop.time() - start - self.interval, 0.0)
+            )
+            self._beat = time.monotonic()
+            self._reported = False
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            blocked = time.monotonic() - self._beat - self.interval
+            if blocked > self.threshold and not self._reported:
+                self._reported = True
+                self._report(blocked)
+
+    def _report(self, blocked: float) -> None:
+        """Logs what the loop thread is running."""
+        frame = sys._current_frames().get(self._loop_thread_id, None)
+        if frame is None:
+            return
+
+        stack = "".join(traceback.format_stack(frame, limit=self.stack_limit))
+        job = _find_job(frame)
+        if job is None:
+            connector_type = "unknown"
+            culprit = "outside of a job"
+        else:
+            connector_type = job.type
+            culprit = f"by job {job.key} of {job.type}"
+
+        metrics.EVENT_LOOP_BLOCKED.labels(connector_type).inc()
+        logger.warning(
+            f"Event loop blocked for {blocked:.3f} seconds {culprit}:\n"
+            f"{stack}"
+        )
@@ -0,0 +1,530 @@
+from typing import Dict, List, Optional
+
+import asyncio
+import time
+
+import grpc
+
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+from loguru import logger
+
+from pyzeebe import Job, ZeebeWorker
+from pyzeebe.errors import (
+    JobAlreadyDeactivatedError,
+    JobNotFoundError,
+    MessageAlreadyExistsError,
+)
+from pyzeebe.grpc_internals.grpc_utils import is_error_status
+from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
+from pyzeebe.job.job_status import JobStatus
+from pyzeebe.task.task import Task
+from pyzeebe.worker.job_executor import JobExecutor, create_job_callback
+from pyzeebe.worker.job_poller import JobPoller
+from pyzeebe.worker.task_state import TaskState
+
+from zeebe_grpc.gateway_pb2 import (
+    ActivatedJob,
+    CompleteJobRequest,
+    PublishMessageRequest,
+)
+
+from python_camunda_sdk import metrics, tracing
+from python_camunda_sdk.serialization import Serializer, default_serializer
+from python_camunda_sdk.runtime.activation import ActivationController
+
+
+STREAM_ACTIVATED_JOBS = "/gateway_protocol.Gateway/StreamActivatedJobs"
+
+
+def _create_stream_request_cls() -> type:
+    """Builds the `StreamActivatedJobsRequest` message, which is missing
+    from the protocol bundled with pyzeebe.
+    """
+    field = descriptor_pb2.FieldDescriptorProto
+
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="python_camunda_sdk/stream_activated_jobs.proto",
+        package="gateway_protocol",
+        syntax="proto3",
+    )
+    message_proto = file_proto.message_type.add(
+        name="StreamActivatedJobsRequest"
+    )
+    for number, name, field_type, label in [
+        (1, "type", field.TYPE_STRING, field.LABEL_OPTIONAL),
+        (2, "worker", field.TYPE_STRING, field.LABEL_OPTIONAL),
+        (3, "timeout", field.TYPE_INT64, field.LABEL_OPTIONAL),
+        (5, "fetchVariable", field.TYPE_STRING, field.LABEL_REPEATED),
+        (6, "tenantIds", field.TYPE_STRING, field.LABEL_REPEATED),
+    ]:
+        message_proto.field.add(
+            name=name, number=number, type=field_type, label=label
+        )
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    descriptor = pool.FindMessageTypeByName(
+        "gateway_protocol.StreamActivatedJobsRequest"
+    )
+
+    if hasattr(message_factory, "GetMessageClass"):
+        return message_factory.GetMessageClass(descriptor)
+    return message_factory.MessageFactory(pool).GetPrototype(descriptor)
+
+
+StreamActivatedJobsRequest = _create_stream_request_cls()
+
+
+class RuntimeAdapter(ZeebeAdapter):
+    """Zeebe adapter that encodes and decodes variables with a
+    [Serializer][python_camunda_sdk.serialization.Serializer] and traces
+    the job completion calls.
+
+    Arguments:
+        serializer: Serializer of the variables. Defaults to
+            [default_serializer]
+            [python_camunda_sdk.serialization.default_serializer].
+        **kwargs: Arguments of the pyzeebe `ZeebeAdapter`.
+    """
+
+    def __init__(
+        self, *args, serializer: Optional[Serializer] = None, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.serializer = serializer or default_serializer()
+
+    def _create_job_from_raw_job(self, response) -> Job:
+        return Job(
+            key=response.key,
+            _type=response.type,
+            process_instance_key=response.processInstanceKey,
+            bpmn_process_id=response.bpmnProcessId,
+            process_definition_version=response.processDefinitionVersion,
+            process_definition_key=response.processDefinitionKey,
+            element_id=response.elementId,
+            element_instance_key=response.elementInstanceKey,
+            custom_headers=self.serializer.loads(response.customHeaders),
+            worker=response.worker,
+            retries=response.retries,
+            deadline=response.deadline,
+            variables=self.serializer.loads(response.variables),
+            zeebe_adapter=self,
+        )
+
+    async def complete_job(self, job_key: int, variables: Dict):
+        with tracing.span("camunda.complete"):
+            try:
+                return await self._gateway_stub.CompleteJob(
+                    CompleteJobRequest(
+                        jobKey=job_key,
+                        variables=self.serializer.dumps_variables(variables),
+                    )
+                )
+            except grpc.aio.AioRpcError as grpc_error:
+                if is_error_status(grpc_error, grpc.StatusCode.NOT_FOUND):
+                    raise JobNotFoundError(job_key=job_key) from grpc_error
+                elif is_error_status(
+                    grpc_error, grpc.StatusCode.FAILED_PRECONDITION
+                ):
+                    raise JobAlreadyDeactivatedError(
+                        job_key=job_key
+                    ) from grpc_error
+                await self._handle_grpc_error(grpc_error)
+
+    async def fail_job(self, job_key: int, retries: int, message: str):
+        with tracing.span("camunda.fail"):
+            return await super().fail_job(job_key, retries, message)
+
+    async def throw_error(
+        self, job_key: int, message: str, error_code: str = ""
+    ):
+        with tracing.span("camunda.throw_error"):
+            return await super().throw_error(job_key, message, error_code)
+
+    async def publish_message(
+        self,
+        name: str,
+        correlation_key: str,
+        time_to_live_in_milliseconds: int,
+        variables: Dict,
+        message_id: Optional[str] = None,
+    ):
+        try:
+            return await self._gateway_stub.PublishMessage(
+                PublishMessageRequest(
+                    name=name,
+                    correlationKey=correlation_key,
+                    messageId=message_id,
+                    timeToLive=time_to_live_in_milliseconds,
+                    variables=self.serializer.dumps_variables(variables),
+                )
+            )
+        except grpc.aio.AioRpcError as grpc_error:
+            if is_error_status(grpc_error, grpc.StatusCode.ALREADY_EXISTS):
+                raise MessageAlreadyExistsError() from grpc_error
+            await self._handle_grpc_error(grpc_error)
+
+
+class RuntimeJobExecutor(JobExecutor):
+    """Job executor that wraps every job in a `camunda.job` span and keeps
+    track of the running jobs, so that they can be drained on shutdown.
+
+    Records the time from the activation of a job until it is completed
+    in `camunda_connector_job_seconds`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.running: Dict[asyncio.Task, Job] = {}
+        self._job_latency = metrics.JOB_LATENCY.labels(self.task.type)
+
+    async def execute(self) -> None:
+        while self.should_execute():
+            job = await self.get_next_job()
+            task = self.loop.create_task(self.execute_one_job(job))
+            self.running[task] = job
+            task.add_done_callback(create_job_callback(self, job))
+            task.add_done_callback(self._discard)
+
+    def _discard(self, task: asyncio.Task) -> None:
+        self.running.pop(task, None)
+
+    async def execute_one_job(self, job: Job) -> None:
+        with tracing.job_span("camunda.job", job, self.task.type):
+            await super().execute_one_job(job)
+
+        if job.status == JobStatus.Completed:
+            activated_at = self.task_state.activated_at.get(job.key)
+            if activated_at is not None:
+                self._job_latency.observe(time.perf_counter() - activated_at)
+
+    def take_queued(self) -> List[Job]:
+        """Removes the jobs that have not been started from the queue.
+
+        Returns:
+            The removed jobs.
+        """
+        jobs = []
+        while not self.jobs.empty():
+            job = self.jobs.get_nowait()
+            self.jobs.task_done()
+            self.task_state.remove(job)
+            jobs.append(job)
+        return jobs
+
+
+class CountingTaskState(TaskState):
+    """Task state that also counts all jobs activated for the task and
+    records when the active jobs were activated.
+
+    Arguments:
+        task_type: Type of the task, used as label of the metrics.
+    """
+
+    def __init__(self, task_type: str):
+        super().__init__()
+        self.activated = 0
+        self.activated_at: Dict[int, float] = {}
+        self._jobs_activated = metrics.JOBS_ACTIVATED.labels(task_type)
+
+    def add(self, job: Job) -> None:
+        super().add(job)
+        self.activated += 1
+        self.activated_at[job.key] = time.perf_counter()
+        self._jobs_activated.inc()
+
+    def remove(self, job: Job) -> None:
+        super().remove(job)
+        self.activated_at.pop(job.key, None)
+
+
+class RuntimeJobPoller(JobPoller):
+    """Job poller that sizes activation requests and paces polls with an
+    [ActivationController]
+    [python_camunda_sdk.runtime.activation.ActivationController].
+
+    Arguments:
+        controller: Activation controller.
+        **kwargs: Arguments of the pyzeebe `JobPoller`.
+    """
+
+    def __init__(self, *args, controller: ActivationController, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.controller = controller
+
+    def calculate_max_jobs_to_activate(self) -> int:
+        return self.controller.capacity(
+            self.task.type, super().calculate_max_jobs_to_activate()
+        )
+
+    async def activate_max_jobs(self):
+        max_jobs = self.calculate_max_jobs_to_activate()
+        if max_jobs <= 0:
+            await asyncio.sleep(self.controller.busy_delay)
+            return
+
+        activated = self.task_state.activated
+        await self.poll_once()
+        self.controller.record_poll(
+            self.task.type, max_jobs, self.task_state.activated - activated
+        )
+
+        delay = self.controller.poll_delay(self.task.type)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class StreamingJobPoller(RuntimeJobPoller):
+    """Job poller that receives jobs pushed by the gateway through
+    `StreamActivatedJobs`.
+
+    Jobs that were activatable before the stream was opened are not
+    pushed, so the poller also polls every `backup_poll_interval` seconds.
+    If the gateway does not support job streaming, the poller falls back
+    to polling.
+
+    Arguments:
+        backup_poll_interval: Interval in seconds between backup polls.
+        **kwargs: Arguments of the
+            [RuntimeJobPoller][python_camunda_sdk.runtime.worker.RuntimeJobPoller].
+    """
+
+    def __init__(self, *args, backup_poll_interval: float = 30.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.backup_poll_interval = backup_poll_interval
+
+    async def poll(self):
+        backup = asyncio.get_running_loop().create_task(self._backup_poll())
+        backup.add_done_callback(self._log_backup_error)
+        try:
+            await self._stream()
+        except grpc.aio.AioRpcError as e:
+            if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+            logger.warning(
+                "Gateway does not support job streaming, polling"
+                f" {self.task.type} jobs instead"
+            )
+        finally:
+            backup.cancel()
+
+        await super().poll()
+
+    async def _backup_poll(self):
+        while self.should_poll():
+            await self.activate_max_jobs()
+            await asyncio.sleep(self.backup_poll_interval)
+
+    def _log_backup_error(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.opt(exception=task.exception()).error(
+                f"Backup poll of {self.task.type} jobs failed"
+            )
+
+    async def _stream(self):
+        open_stream = self.zeebe_adapter._channel.unary_stream(
+            STREAM_ACTIVATED_JOBS,
+            request_serializer=StreamActivatedJobsRequest.SerializeToString,
+            response_deserializer=ActivatedJob.FromString,
+        )
+        request = StreamActivatedJobsRequest(
+            type=self.task.type,
+            worker=self.worker_name,
+            timeout=self.task.config.timeout_ms,
+            fetchVariable=self.task.config.variables_to_fetch,
+        )
+
+        while self.should_poll():
+            call = open_stream(request)
+            try:
+                await self._receive(call)
+                reason = "was closed by the gateway"
+            except grpc.aio.AioRpcError as e:
+                if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                reason = f"failed ({e.code()})"
+            finally:
+                call.cancel()
+
+            if self.should_poll():
+                logger.warning(
+                    f"Job stream for {self.task.type} {reason},"
+                    f" reopening in {self.poll_retry_delay} seconds"
+                )
+                await asyncio.sleep(self.poll_retry_delay)
+
+    async def _receive(self, call):
+        while self.should_poll():
+            # Not reading from the stream while at capacity lets gRPC flow
+            # control push back on the gateway.
+            while self.calculate_max_jobs_to_activate() <= 0:
+                await asyncio.sleep(self.controller.busy_delay)
+
+            raw_job = await call.read()
+            if raw_job is grpc.aio.EOF:
+                return
+
+            job = self.zeebe_adapter._create_job_from_raw_job(raw_job)
+            self.task_state.add(job)
+            await self.queue.put(job)
+
+
+class RuntimeWorker(ZeebeWorker):
+    """pyzeebe worker used by the runtime.
+
+    Arguments:
+        stream_jobs: Receive jobs through job streaming instead of polling
+            where the gateway supports it.
+        backup_poll_interval: Interval in seconds between backup polls
+            when jobs are streamed.
+        controller: Activation controller. A controller without poll
+            back-off is used if not set.
+        serializer: Serializer of the job variables.
+        **kwargs: Arguments of the pyzeebe `ZeebeWorker`.
+    """
+
+    def __init__(
+        self,
+        *args,
+        stream_jobs: bool = False,
+        backup_poll_interval: float = 30.0,
+        controller: Optional[ActivationController] = None,
+        serializer: Optional[Serializer] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.zeebe_adapter = RuntimeAdapter(
+            self.zeebe_adapter._channel,
+            self.zeebe_adapter._max_connection_retries,
+            serializer=serializer,
+        )
+        self.stream_jobs = stream_jobs
+        self.backup_poll_interval = backup_poll_interval
+        self.controller = controller or ActivationController()
+        self._stopped = False
+
+    def _create_poller(
+        self, task: Task, jobs_queue: asyncio.Queue, task_state: TaskState
+    ) -> JobPoller:
+        args = (
+            self.zeebe_adapter,
+            task,
+            jobs_queue,
+            self.name,
+            self.request_timeout,
+            task_state,
+            self.poll_retry_delay,
+        )
+        if self.stream_jobs:
+            return StreamingJobPoller(
+                *args,
+                controller=self.controller,
+                backup_poll_interval=self.backup_poll_interval,
+            )
+        return RuntimeJobPoller(*args, controller=self.controller)
+
+    async def work(self) -> None:
+        self._job_executors, self._job_pollers = [], []
+
+        if self._stopped:
+            # Stopped before it started, e.g. during the connector setup.
+            logger.info("Zeebe worker was stopped")
+            return
+
+        for task in self.tasks:
+            jobs_queue: asyncio.Queue = asyncio.Queue()
+            task_state = CountingTaskState(task.type)
+
+            self._job_pollers.append(
+                self._create_poller(task, jobs_queue, task_state)
+            )
+            self._job_executors.append(
+                RuntimeJobExecutor(task, jobs_queue, task_state)
+            )
+
+        coroutines: List = [poller.poll() for poller in self._job_pollers]
+        coroutines += [executor.execute() for executor in self._job_executors]
+
+        self._work_task = asyncio.gather(*coroutines)
+
+        try:
+            await self._work_task
+        except asyncio.CancelledError:
+            logger.info("Zeebe worker was stopped")
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops activating jobs and drains the running ones.
+
+        Jobs that were activated but not started are failed right away,
+        while the running ones are drained.
+        Jobs still running after `timeout` are cancelled and failed. The
+        jobs are failed with their retries unchanged, so that the engine
+        hands them to another worker straight away instead of waiting for
+        their timeout.
+
+        Arguments:
+            timeout: Time in seconds to wait for the running jobs. Waits
+                indefinitely if not set.
+        """
+        self._stopped = True
+        if self._work_task is not None:
+            self._work_task.cancel()
+        for poller in self._job_pollers:
+            poller.stop_event.set()
+        for executor in self._job_executors:
+            executor.stop_event.set()
+
+        queued = [
+            job
+            for executor in self._job_executors
+            for job in executor.take_queued()
+        ]
+        if queued:
+            logger.info(f"Failing {len(queued)} queued jobs")
+        released = asyncio.gather(*[self._release(job) for job in queued])
+
+        running = {
+            task: job
+            for executor in self._job_executors
+            for task, job in executor.running.items()
+        }
+        unfinished = []
+        if running:
+            logger.info(f"Waiting for {len(running)} running jobs")
+            _, pending = await asyncio.wait(set(running), timeout=timeout)
+
+            if pending:
+                logger.warning(f"Cancelling {len(pending)} running jobs")
+                for task in pending:
+                    task.cancel()
+                await asyncio.wait(pending)
+            unfinished += [
+                job for task, job in running.items() if task.cancelled()
+            ]
+
+        for executor in self._job_executors:
+            unfinished += executor.take_queued()
+
+        if unfinished:
+            logger.info(f"Failing {len(unfinished)} unfinished jobs")
+            await asyncio.gather(*[self._release(job) for job in unfinished])
+        await released
+
+    def force_stop(self) -> None:
+        """Cancels the running jobs without waiting for the timeout of a
+        [stop][python_camunda_sdk.runtime.worker.RuntimeWorker.stop] in
+        progress, which then fails them.
+        """
+        for executor in self._job_executors:
+            for task in executor.running:
+                task.cancel()
+
+    async def _release(self, job: Job) -> None:
+        """Fails a job without using up a retry."""
+        try:
+            await self.zeebe_adapter.fail_job(
+                job.key, job.retries, "Worker is shutting down"
+            )
+        except Exception:
+            logger.exception(f"Failed to release job {job.key}")
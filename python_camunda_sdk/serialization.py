@@ -0,0 +1,99 @@
+from typing import Any, Dict, Union
+
+import json
+
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class RawJSON:
+    """A JSON encoded value that is embedded into the variables as it is.
+
+    Arguments:
+        data: The encoded value.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+class Serializer:
+    """Encodes and decodes job variables and connector results.
+
+    Subclasses implement `loads` and `dumps`.
+    """
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decodes a JSON document."""
+        raise NotImplementedError
+
+    def dumps(self, value: Any) -> bytes:
+        """Encodes a value to JSON."""
+        raise NotImplementedError
+
+    def dumps_variables(self, variables: Dict[str, Any]) -> str:
+        """Encodes the variables of a job or a message.
+
+        [RawJSON][python_camunda_sdk.serialization.RawJSON] values are
+        embedded without encoding them again.
+
+        Arguments:
+            variables: Variables by name.
+        """
+        items = [
+            self.dumps(name)
+            + b":"
+            + (value.data if isinstance(value, RawJSON) else self.dumps(value))
+            for name, value in variables.items()
+        ]
+        return (b"{" + b",".join(items) + b"}").decode()
+
+    def encode_result(self, adapter: TypeAdapter, value: Any) -> RawJSON:
+        """Encodes the result of a connector.
+
+        Arguments:
+            adapter: Type adapter of the return type of the connector.
+            value: The result.
+        """
+        return RawJSON(adapter.dump_json(value))
+
+
+class JSONSerializer(Serializer):
+    """Serializer based on the standard library `json`."""
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value).encode()
+
+
+class OrjsonSerializer(Serializer):
+    """Serializer based on `orjson`."""
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonSerializer requires orjson")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+
+def default_serializer() -> Serializer:
+    """Returns an
+    [OrjsonSerializer][python_camunda_sdk.serialization.OrjsonSerializer]
+    if orjson is installed, otherwise a
+    [JSONSerializer][python_camunda_sdk.serialization.JSONSerializer].
+    """
+    if orjson is not None:
+        return OrjsonSerializer()
+    return JSONSerializer()
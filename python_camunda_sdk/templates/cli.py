@@ -1,7 +1,6 @@
 from python_camunda_sdk.templates import generate_template
-import importlib
+from python_camunda_sdk.cli import import_connector
 import click
-import re
 import json
 
 
@@ -19,24 +18,7 @@ def cli(connector, filename):
     if not filename.endswith(".json"):
         raise click.FileError(filename, "FILENAME must be a .json file")
 
-    match = re.search("([a-zA-Z_\.]*)\.([a-zA-Z]*)", connector)
-
-    if match is None:
-        raise click.BadParameter("Invalid connector name")
-
-    module_name = match.group(1)
-    cls_name = match.group(2)
-    try:
-        module = importlib.import_module(module_name)
-    except ModuleNotFoundError:
-        raise click.BadParameter(f"Module {module_name} not found")
-
-    connector_cls = getattr(module, cls_name, None)
-
-    if connector_cls is None:
-        raise click.BadParameter(
-            f"Could not import {cls_name} from {module_name}"
-        )
+    connector_cls = import_connector(connector)
 
     template = generate_template(connector_cls)
     with open(filename, "w") as f:
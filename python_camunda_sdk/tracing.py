@@ -0,0 +1,100 @@
+from typing import ContextManager, Dict, Optional
+
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None
+
+_NOOP = nullcontext()
+
+_tracer = None
+
+_job_attributes: ContextVar[Dict] = ContextVar(
+    "camunda_job_attributes", default={}
+)
+
+
+def enable_tracing(tracer_provider: Optional[object] = None) -> None:
+    """Enables OpenTelemetry spans for the handled jobs.
+
+    Every job gets a span with child spans for validation, `run()`,
+    serialization of the result and completion or message publishing.
+    The spans carry the job key, the process instance key and the
+    connector type.
+
+    Arguments:
+        tracer_provider: OpenTelemetry tracer provider. The global one is
+            used if not set.
+
+    Raises:
+        ImportError: If `opentelemetry-api` is not installed.
+    """
+    global _tracer
+
+    if trace is None:
+        raise ImportError(
+            "Tracing requires opentelemetry-api, install"
+            " python-camunda-sdk[tracing]"
+        )
+    _tracer = trace.get_tracer(
+        "python_camunda_sdk", tracer_provider=tracer_provider
+    )
+
+
+def disable_tracing() -> None:
+    """Disables the spans."""
+    global _tracer
+    _tracer = None
+
+
+def _attributes(job, connector_type: str) -> Dict:
+    attributes = {"camunda.connector.type": connector_type}
+    key = getattr(job, "key", None)
+    if key is not None:
+        attributes["camunda.job.key"] = key
+    process_instance_key = getattr(job, "process_instance_key", None)
+    if process_instance_key is not None:
+        attributes["camunda.process_instance.key"] = process_instance_key
+    return attributes
+
+
+@contextmanager
+def _start_job_span(name: str, attributes: Dict):
+    token = _job_attributes.set(attributes)
+    try:
+        with _tracer.start_as_current_span(name, attributes=attributes) as s:
+            yield s
+    finally:
+        _job_attributes.reset(token)
+
+
+def job_span(name: str, job, connector_type: str) -> ContextManager:
+    """Returns a span for a stage of a job, or a no-op context manager if
+    tracing is disabled.
+
+    Arguments:
+        name: Name of the span.
+        job: The job.
+        connector_type: Type of the connector handling the job.
+    """
+    if _tracer is None:
+        return _NOOP
+    return _start_job_span(name, _attributes(job, connector_type))
+
+
+def span(name: str) -> ContextManager:
+    """Returns a span with the attributes of the job of the enclosing
+    [job_span][python_camunda_sdk.tracing.job_span], or a no-op context
+    manager if tracing is disabled.
+
+    Arguments:
+        name: Name of the span.
+    """
+    if _tracer is None:
+        return _NOOP
+    return _tracer.start_as_current_span(
+        name, attributes=_job_attributes.get()
+    )
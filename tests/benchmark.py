@@ -0,0 +1,280 @@
+"""Measures the per-job overhead of the connector task handlers and the
+end-to-end throughput of the runtime against an in-process gateway.
+
+Run from the tests directory:
+
+    python benchmark.py
+
+Save the results of a release and compare later runs against them to
+catch performance regressions:
+
+    python benchmark.py --save baseline.json
+    python benchmark.py --compare baseline.json --tolerance 0.2
+"""
+from typing import Dict, List
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+from loguru import logger
+from pydantic import BaseModel
+
+from python_camunda_sdk import (
+    CamundaRuntime,
+    InboundConnector,
+    InsecureConfig,
+    OutboundConnector,
+)
+
+from gateway import FakeGateway
+from util import DummyJob
+
+
+class Order(BaseModel):
+    id: int
+    quantity: int
+
+
+class OrderConnector(OutboundConnector):
+    order_id: int
+    customer: str
+    items: List[Dict[str, int]]
+    express: bool = False
+
+    async def run(self) -> Order:
+        return Order(
+            id=self.order_id,
+            quantity=sum(item["quantity"] for item in self.items),
+        )
+
+    class ConnectorConfig:
+        name = "order"
+        type = "order"
+
+
+class TrustedOrderConnector(OrderConnector):
+    class ConnectorConfig:
+        name = "trusted_order"
+        type = "trusted_order"
+        trusted_input = True
+
+
+class SyncOrderConnector(OrderConnector):
+    def run(self) -> Order:
+        return Order(
+            id=self.order_id,
+            quantity=sum(item["quantity"] for item in self.items),
+        )
+
+    class ConnectorConfig:
+        name = "sync_order"
+        type = "sync_order"
+
+
+class OrderEventConnector(InboundConnector):
+    order_id: int
+    customer: str
+    items: List[Dict[str, int]]
+
+    async def run(self) -> Order:
+        return Order(
+            id=self.order_id,
+            quantity=sum(item["quantity"] for item in self.items),
+        )
+
+    class ConnectorConfig:
+        name = "order_event"
+        type = "order_event"
+
+
+class Document(BaseModel):
+    id: int
+    rows: List[Dict[str, str]]
+
+
+class DocumentConnector(OutboundConnector):
+    id: int
+    rows: List[Dict[str, str]]
+
+    async def run(self) -> Document:
+        return Document(id=self.id, rows=self.rows)
+
+    class ConnectorConfig:
+        name = "document"
+        type = "document"
+
+
+VARIABLES = {
+    "order_id": 1,
+    "customer": "customer",
+    "items": [{"sku": i, "quantity": 2} for i in range(20)],
+}
+
+DOCUMENT = {
+    "id": 1,
+    "rows": [{"key": f"key-{i}", "value": "x" * 200} for i in range(500)],
+}
+
+
+async def measure(connector_cls, jobs: int = 5000) -> float:
+    """Returns the mean overhead of a job in microseconds."""
+    task = connector_cls.to_task(client=None)
+    job = DummyJob(result_variable="order")
+
+    for _ in range(jobs // 10):
+        await task(job=job, **VARIABLES)
+
+    start = time.perf_counter()
+    for _ in range(jobs):
+        await task(job=job, **VARIABLES)
+    return (time.perf_counter() - start) / jobs * 1e6
+
+
+async def measure_runtime(
+    connector_cls, variables: Dict, jobs: int = 1000, **runtime_kwargs
+) -> Dict[str, float]:
+    """Runs jobs through `CamundaRuntime.main` and an in-process gateway.
+
+    The latency of a job lasts from its creation until it is completed or,
+    for inbound connectors, until its message is published.
+
+    Returns:
+        Jobs per second and the 50th and 99th latency percentiles in
+            milliseconds.
+    """
+    inbound = issubclass(connector_cls, InboundConnector)
+
+    gateway = await FakeGateway().start()
+    runtime = CamundaRuntime(
+        config=InsecureConfig(hostname="127.0.0.1", port=gateway.port),
+        outbound_connectors=[] if inbound else [connector_cls],
+        inbound_connectors=[connector_cls] if inbound else [],
+        **runtime_kwargs,
+    )
+    main = asyncio.get_running_loop().create_task(runtime.main())
+
+    created = {}
+    try:
+        await asyncio.sleep(0.2)
+        start = time.perf_counter()
+        for i in range(jobs):
+            job_variables = dict(variables)
+            if inbound:
+                job_variables["message_name"] = "order_event"
+                job_variables["correlation_key"] = str(i)
+            key = await gateway.add_job(
+                connector_cls.config.type,
+                variables=job_variables,
+                custom_headers={"resultVariable": "result"},
+            )
+            created[str(i) if inbound else key] = time.perf_counter()
+
+        if inbound:
+            await gateway.wait_published(jobs, timeout=120)
+            finished = {
+                message["correlation_key"]: message["published"]
+                for message in gateway.messages
+            }
+        else:
+            await gateway.wait_finished(jobs, timeout=120)
+            finished = gateway.finished_at
+    finally:
+        await runtime.stop()
+        await main
+        await gateway.stop()
+
+    latencies = [(finished[key] - created[key]) * 1e3 for key in created]
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "jobs_per_second": jobs / (max(finished.values()) - start),
+        "p50_ms": percentiles[49],
+        "p99_ms": percentiles[98],
+    }
+
+
+SCENARIOS = {
+    "async": (OrderConnector, VARIABLES),
+    "sync": (SyncOrderConnector, VARIABLES),
+    "inbound": (OrderEventConnector, VARIABLES),
+    "large_payload": (DocumentConnector, DOCUMENT),
+}
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Returns the regressions of the results against a baseline.
+
+    Arguments:
+        results: Results by scenario.
+        baseline: Baseline results by scenario.
+        tolerance: Allowed relative regression, e.g. 0.2 for 20%.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric, value in result.items():
+            expected = baseline[name][metric]
+            if metric == "jobs_per_second":
+                regressed = value < expected * (1 - tolerance)
+            else:
+                regressed = value > expected * (1 + tolerance)
+            if regressed:
+                regressions.append(
+                    f"{name} {metric}: {value:.1f} (baseline {expected:.1f})"
+                )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    logger.remove()
+
+    results = {}
+    for connector_cls in (OrderConnector, TrustedOrderConnector):
+        overhead = min(
+            [await measure(connector_cls) for _ in range(args.rounds)]
+        )
+        print(f"{connector_cls.__name__}: {overhead:.1f} us/job")
+        results[connector_cls.__name__] = {"overhead_us": overhead}
+
+    for name, (connector_cls, variables) in SCENARIOS.items():
+        result = await measure_runtime(
+            connector_cls, variables, jobs=args.jobs
+        )
+        print(
+            f"{name}: {result['jobs_per_second']:.0f} jobs/s,"
+            f" p50 {result['p50_ms']:.1f} ms, p99 {result['p99_ms']:.1f} ms"
+        )
+        results[name] = result
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--save", help="Write the results to a JSON file")
+    parser.add_argument("--compare", help="Compare with saved results")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,207 @@
+import asyncio
+import itertools
+import json
+import time
+
+import grpc
+
+from zeebe_grpc import gateway_pb2
+from zeebe_grpc.gateway_pb2_grpc import (
+    GatewayServicer,
+    add_GatewayServicer_to_server,
+)
+
+from python_camunda_sdk.runtime.worker import StreamActivatedJobsRequest
+
+
+class FakeGateway(GatewayServicer):
+    """In-process Zeebe gateway that hands out jobs added with `add_job`
+    and records their completions, failures and published messages.
+    """
+
+    def __init__(
+        self, streaming=True, long_poll_timeout=0.1, end_streams=False
+    ):
+        self.streaming = streaming
+        self.end_streams = end_streams
+        self.long_poll_timeout = long_poll_timeout
+
+        self.keys = itertools.count(1)
+        self.jobs = {}
+        self.job_added = asyncio.Condition()
+        self.completed = {}
+        self.failed = {}
+        self.finished_at = {}
+        self.retries = {}
+        self.errors = {}
+        self.messages = []
+        self.activations = []
+        self.streamed = []
+        self.streams_opened = 0
+        self.finished = asyncio.Condition()
+        self.published = asyncio.Condition()
+
+    async def start(self):
+        self.server = grpc.aio.server()
+        add_GatewayServicer_to_server(self, self.server)
+        if self.streaming:
+            self.server.add_generic_rpc_handlers(
+                [
+                    grpc.method_handlers_generic_handler(
+                        "gateway_protocol.Gateway",
+                        {
+                            "StreamActivatedJobs": (
+                                grpc.unary_stream_rpc_method_handler(
+                                    self.StreamActivatedJobs,
+                                    request_deserializer=(
+                                        StreamActivatedJobsRequest.FromString
+                                    ),
+                                    response_serializer=(
+                                        gateway_pb2.ActivatedJob.SerializeToString
+                                    ),
+                                )
+                            )
+                        },
+                    )
+                ]
+            )
+        self.port = self.server.add_insecure_port("127.0.0.1:0")
+        await self.server.start()
+        return self
+
+    async def stop(self):
+        await self.server.stop(0)
+        await asyncio.sleep(0.01)
+
+    async def add_job(self, task_type, variables=None, custom_headers=None):
+        key = next(self.keys)
+        self.jobs[key] = {
+            "type": task_type,
+            "variables": variables or {},
+            "custom_headers": custom_headers or {},
+            "created": time.perf_counter(),
+            "activated": False,
+        }
+        async with self.job_added:
+            self.job_added.notify_all()
+        return key
+
+    async def wait_finished(self, count, timeout=5):
+        async with self.finished:
+            await asyncio.wait_for(
+                self.finished.wait_for(
+                    lambda: len(self.completed) + len(self.failed) >= count
+                ),
+                timeout,
+            )
+
+    async def wait_published(self, count, timeout=5):
+        async with self.published:
+            await asyncio.wait_for(
+                self.published.wait_for(lambda: len(self.messages) >= count),
+                timeout,
+            )
+
+    def _take_jobs(self, task_type, worker, timeout, fetch, max_jobs):
+        jobs = []
+        for key, job in self.jobs.items():
+            if len(jobs) >= max_jobs:
+                break
+            if job["type"] != task_type or job["activated"]:
+                continue
+
+            job["activated"] = True
+            self.activations.append(key)
+            variables = job["variables"]
+            if fetch:
+                variables = {
+                    name: value
+                    for name, value in variables.items()
+                    if name in fetch
+                }
+            jobs.append(
+                gateway_pb2.ActivatedJob(
+                    key=key,
+                    type=task_type,
+                    processInstanceKey=key,
+                    worker=worker,
+                    retries=3,
+                    deadline=int(time.time() * 1000) + timeout,
+                    customHeaders=json.dumps(job["custom_headers"]),
+                    variables=json.dumps(variables),
+                )
+            )
+        return jobs
+
+    async def ActivateJobs(self, request, context):
+        try:
+            async with self.job_added:
+                await asyncio.wait_for(
+                    self.job_added.wait_for(
+                        lambda: any(
+                            job["type"] == request.type
+                            and not job["activated"]
+                            for job in self.jobs.values()
+                        )
+                    ),
+                    self.long_poll_timeout,
+                )
+        except asyncio.TimeoutError:
+            pass
+        jobs = self._take_jobs(
+            request.type,
+            request.worker,
+            request.timeout,
+            list(request.fetchVariable),
+            request.maxJobsToActivate,
+        )
+        yield gateway_pb2.ActivateJobsResponse(jobs=jobs)
+
+    async def StreamActivatedJobs(self, request, context):
+        self.streams_opened += 1
+        while not self.end_streams:
+            async with self.job_added:
+                await self.job_added.wait()
+            for job in self._take_jobs(
+                request.type,
+                request.worker,
+                request.timeout,
+                list(request.fetchVariable),
+                1000,
+            ):
+                self.streamed.append(job.key)
+                yield job
+
+    async def _finish(self, records, key, value):
+        records[key] = value
+        self.finished_at[key] = time.perf_counter()
+        async with self.finished:
+            self.finished.notify_all()
+
+    async def CompleteJob(self, request, context):
+        await self._finish(
+            self.completed, request.jobKey, json.loads(request.variables)
+        )
+        return gateway_pb2.CompleteJobResponse()
+
+    async def FailJob(self, request, context):
+        self.retries[request.jobKey] = request.retries
+        await self._finish(self.failed, request.jobKey, request.errorMessage)
+        return gateway_pb2.FailJobResponse()
+
+    async def ThrowError(self, request, context):
+        await self._finish(self.failed, request.jobKey, request.errorMessage)
+        return gateway_pb2.ThrowErrorResponse()
+
+    async def PublishMessage(self, request, context):
+        self.messages.append(
+            {
+                "name": request.name,
+                "correlation_key": request.correlationKey,
+                "variables": json.loads(request.variables),
+                "published": time.perf_counter(),
+            }
+        )
+        async with self.published:
+            self.published.notify_all()
+        return gateway_pb2.PublishMessageResponse(key=len(self.messages))
@@ -0,0 +1,137 @@
+import asyncio
+from typing import List
+from unittest import TestCase
+
+from pydantic import ValidationError
+
+from python_camunda_sdk import BatchOutboundConnector
+from python_camunda_sdk.connectors import (
+    BatchConnectorConfig,
+    CacheConfig,
+    RetryPolicy,
+)
+
+from util import async_test, DummyJob
+
+
+class InsertConnector(BatchOutboundConnector):
+    name: str
+
+    @classmethod
+    async def run_batch(cls, connectors: List["InsertConnector"]) -> List[int]:
+        cls.batches.append([connector.name for connector in connectors])
+        return [
+            ValueError("empty name") if not connector.name else index
+            for index, connector in enumerate(connectors)
+        ]
+
+    class ConnectorConfig:
+        name = "insert"
+        type = "insert"
+        batch_size = 3
+        batch_max_wait = 0.01
+
+
+class SyncInsertConnector(BatchOutboundConnector):
+    name: str
+
+    @classmethod
+    def run_batch(cls, connectors: List["SyncInsertConnector"]) -> List[str]:
+        return [connector.name.upper() for connector in connectors]
+
+    class ConnectorConfig:
+        name = "sync_insert"
+        type = "sync_insert"
+
+
+class FlakyInsertConnector(BatchOutboundConnector):
+    name: str
+
+    @classmethod
+    async def run_batch(
+        cls, connectors: List["FlakyInsertConnector"]
+    ) -> List[str]:
+        cls.calls += 1
+        if cls.calls == 1:
+            raise ConnectionError("database unavailable")
+        return [connector.name for connector in connectors]
+
+    class ConnectorConfig:
+        name = "flaky_insert"
+        type = "flaky_insert"
+        retry = RetryPolicy(attempts=2, initial_backoff=0, jitter=0)
+
+
+class TestBatchOutbound(TestCase):
+    def test_config(self):
+        self.assertEqual(InsertConnector.config.batch_size, 3)
+        self.assertEqual(InsertConnector._return_type, int)
+
+    def test_unsupported_options(self):
+        for options in (
+            {"cache": CacheConfig()},
+            {"coalesce": True},
+            {"profile": {"directory": "profiles"}},
+        ):
+            with self.assertRaises(ValidationError):
+                BatchConnectorConfig(name="batch", type="batch", **options)
+
+    def test_missing_run_batch(self):
+        with self.assertRaises(AttributeError):
+
+            class DummyConnector(BatchOutboundConnector):
+                class ConnectorConfig:
+                    name = "dummy"
+                    type = "dummy"
+
+    def test_bad_return_annotation(self):
+        with self.assertRaises(AttributeError):
+
+            class DummyConnector(BatchOutboundConnector):
+                @classmethod
+                async def run_batch(cls, connectors) -> int:
+                    return 1
+
+                class ConnectorConfig:
+                    name = "dummy"
+                    type = "dummy"
+
+    @async_test
+    async def test_batches(self):
+        InsertConnector.batches = []
+        task = InsertConnector.to_task(client=None)
+
+        results = await asyncio.gather(
+            *[
+                task(job=DummyJob(result_variable="row"), name=name)
+                for name in ["a", "b", "", "c"]
+            ],
+            return_exceptions=True,
+        )
+
+        self.assertEqual(InsertConnector.batches, [["a", "b", ""], ["c"]])
+        self.assertEqual(results[0], {"row": 0})
+        self.assertEqual(results[1], {"row": 1})
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(results[3], {"row": 0})
+
+    @async_test
+    async def test_sync_run_batch(self):
+        task = SyncInsertConnector.to_task(client=None)
+
+        results = await asyncio.gather(
+            task(job=DummyJob(result_variable="ret"), name="a"),
+            task(job=DummyJob(result_variable="ret"), name="b"),
+        )
+
+        self.assertEqual(results, [{"ret": "A"}, {"ret": "B"}])
+
+    @async_test
+    async def test_retry(self):
+        FlakyInsertConnector.calls = 0
+        task = FlakyInsertConnector.to_task(client=None)
+
+        result = await task(job=DummyJob(result_variable="ret"), name="a")
+
+        self.assertEqual(result, {"ret": "a"})
+        self.assertEqual(FlakyInsertConnector.calls, 2)
@@ -0,0 +1,50 @@
+import asyncio
+
+from unittest import TestCase
+
+from python_camunda_sdk.connectors.batching import Batcher
+
+from util import async_test
+
+
+class TestBatcher(TestCase):
+    @async_test
+    async def test_max_size(self):
+        batches = []
+
+        async def flush(items):
+            batches.append(items)
+            return [item * 2 for item in items]
+
+        batcher = Batcher(flush, max_size=2, max_wait=10)
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(4)])
+
+        self.assertEqual(results, [0, 2, 4, 6])
+        self.assertEqual(batches, [[0, 1], [2, 3]])
+
+    @async_test
+    async def test_max_wait(self):
+        batches = []
+
+        async def flush(items):
+            batches.append(items)
+            return items
+
+        batcher = Batcher(flush, max_size=10, max_wait=0.01)
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(3)])
+
+        self.assertEqual(results, [0, 1, 2])
+        self.assertEqual(batches, [[0, 1, 2]])
+
+    @async_test
+    async def test_item_error(self):
+        async def flush(items):
+            return [ValueError(item) if item else item for item in items]
+
+        batcher = Batcher(flush, max_size=2)
+        results = await asyncio.gather(
+            batcher.submit(0), batcher.submit(1), return_exceptions=True
+        )
+
+        self.assertEqual(results[0], 0)
+        self.assertIsInstance(results[1], ValueError)
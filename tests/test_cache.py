@@ -0,0 +1,196 @@
+import asyncio
+import functools
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from python_camunda_sdk import OutboundConnector
+from python_camunda_sdk.connectors import CacheConfig
+from python_camunda_sdk.connectors.cache import (
+    MISS,
+    MemoryCache,
+    SingleFlight,
+    SQLiteCache,
+)
+
+from util import async_test, metric_value, requires_prometheus, DummyJob
+
+
+class Rate(BaseModel):
+    currency: str
+    rate: float
+
+
+class RateConnector(OutboundConnector):
+    currency: str
+
+    async def run(self) -> Rate:
+        RateConnector.runs += 1
+        return Rate(currency=self.currency, rate=1.5)
+
+    class ConnectorConfig:
+        name = "rate"
+        type = "rate"
+        cache = CacheConfig(max_size=10, ttl=60)
+
+
+class TestCache(TestCase):
+    @async_test
+    async def test_memory_lru(self):
+        cache = MemoryCache(max_size=2, ttl=60)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        self.assertEqual(await cache.get("a"), 1)
+        self.assertIs(await cache.get("b"), MISS)
+        self.assertEqual(await cache.get("c"), 3)
+
+    @async_test
+    async def test_memory_ttl(self):
+        cache = MemoryCache(max_size=2, ttl=0.01)
+        await cache.set("a", 1)
+        time.sleep(0.02)
+
+        self.assertIs(await cache.get("a"), MISS)
+
+    @async_test
+    async def test_sqlite_shared(self):
+        adapter = TypeAdapter(Rate)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite3")
+            writer = SQLiteCache(path, "rate", adapter, max_size=2, ttl=60)
+            reader = SQLiteCache(path, "rate", adapter, max_size=2, ttl=60)
+            other = SQLiteCache(path, "other", adapter, max_size=2, ttl=60)
+
+            await writer.set("a", Rate(currency="EUR", rate=1.0))
+            await writer.set("b", Rate(currency="USD", rate=2.0))
+            await writer.set("c", Rate(currency="GBP", rate=3.0))
+            await writer.prune()
+
+            self.assertEqual(
+                await reader.get("c"), Rate(currency="GBP", rate=3.0)
+            )
+            self.assertIs(await reader.get("a"), MISS)
+            self.assertIs(await other.get("c"), MISS)
+
+            for cache in (writer, reader, other):
+                cache.close()
+
+    def test_sqlite_requires_path(self):
+        with self.assertRaises(ValidationError):
+            CacheConfig(backend="sqlite")
+
+    @requires_prometheus
+    @async_test
+    async def test_cached_connector(self):
+        RateConnector.runs = 0
+        hits = metric_value(
+            "camunda_connector_cache_hits_total", connector_type="rate"
+        )
+        misses = metric_value(
+            "camunda_connector_cache_misses_total", connector_type="rate"
+        )
+        task = RateConnector.to_task(client=None)
+
+        for currency in ("EUR", "EUR", "USD", "EUR"):
+            ret = await task(
+                job=DummyJob(result_variable="ret"), currency=currency
+            )
+            self.assertEqual(ret["ret"], {"currency": currency, "rate": 1.5})
+
+        self.assertEqual(RateConnector.runs, 2)
+        self.assertEqual(
+            metric_value(
+                "camunda_connector_cache_hits_total", connector_type="rate"
+            ),
+            hits + 2,
+        )
+        self.assertEqual(
+            metric_value(
+                "camunda_connector_cache_misses_total", connector_type="rate"
+            ),
+            misses + 2,
+        )
+
+
+class LookupConnector(OutboundConnector):
+    key: str
+
+    async def run(self) -> str:
+        LookupConnector.runs += 1
+        await asyncio.sleep(0.01)
+        if self.key == "bad":
+            raise ValueError("bad key")
+        return self.key.upper()
+
+    class ConnectorConfig:
+        name = "lookup"
+        type = "lookup"
+        coalesce = True
+
+
+class TestSingleFlight(TestCase):
+    @requires_prometheus
+    @async_test
+    async def test_coalesced_connector(self):
+        LookupConnector.runs = 0
+        coalesced = metric_value(
+            "camunda_connector_jobs_coalesced_total", connector_type="lookup"
+        )
+        task = LookupConnector.to_task(client=None)
+
+        results = await asyncio.gather(
+            *[
+                task(job=DummyJob(result_variable=f"ret{i}"), key=key)
+                for i, key in enumerate(["a", "a", "a", "b"])
+            ]
+        )
+
+        self.assertEqual(
+            results,
+            [{"ret0": "A"}, {"ret1": "A"}, {"ret2": "A"}, {"ret3": "B"}],
+        )
+        self.assertEqual(LookupConnector.runs, 2)
+        self.assertEqual(
+            metric_value(
+                "camunda_connector_jobs_coalesced_total",
+                connector_type="lookup",
+            ),
+            coalesced + 2,
+        )
+
+        await task(job=DummyJob(result_variable="ret"), key="a")
+        self.assertEqual(LookupConnector.runs, 3)
+
+    @async_test
+    async def test_shared_error(self):
+        LookupConnector.runs = 0
+        task = LookupConnector.to_task(client=None)
+
+        results = await asyncio.gather(
+            task(job=DummyJob(result_variable="ret"), key="bad"),
+            task(job=DummyJob(result_variable="ret"), key="bad"),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(LookupConnector.runs, 1)
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+    @async_test
+    async def test_cancelled_caller(self):
+        single_flight = SingleFlight()
+        call = functools.partial(asyncio.sleep, 0.01, "done")
+
+        first = asyncio.ensure_future(single_flight.run("key", call))
+        second = asyncio.ensure_future(single_flight.run("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, "done")
+        self.assertNotIn("key", single_flight)
@@ -5,6 +5,7 @@ from pydantic import ValidationError
 from unittest import TestCase
 
 from python_camunda_sdk import InboundConnector
+from python_camunda_sdk.connectors import InboundRegistry
 
 from util import async_test, DummyJob, DummyClient
 
@@ -59,6 +60,12 @@ class TestInboundConnector(TestCase):
         self.assertEqual(client.correlation_key, "key_x")
         self.assertEqual(client.variables, {"ret": 2})
 
+    def test_variables_to_fetch(self):
+        self.assertEqual(
+            ValidInbound._variables_to_fetch(),
+            ["counter", "correlation_key", "message_name"],
+        )
+
     @async_test
     async def test_task_validation_failure(self):
         task = ValidInbound.to_task(client=None)
@@ -70,3 +77,28 @@ class TestInboundConnector(TestCase):
                 correlation_key="key_x",
                 counter="foo",
             )
+
+
+class TestInboundRegistry(TestCase):
+    @async_test
+    async def test_max_in_flight(self):
+        registry = InboundRegistry(max_in_flight=1)
+
+        first = await registry.spawn(asyncio.sleep(0.05))
+        self.assertEqual(registry.in_flight, 1)
+
+        await registry.spawn(asyncio.sleep(0))
+        self.assertTrue(first.done())
+
+        await registry.drain()
+        self.assertEqual(registry.in_flight, 0)
+
+    @async_test
+    async def test_drain_timeout(self):
+        registry = InboundRegistry()
+
+        task = await registry.spawn(asyncio.sleep(10))
+        await registry.drain(timeout=0.01)
+
+        self.assertTrue(task.cancelled())
+        self.assertEqual(registry.in_flight, 0)
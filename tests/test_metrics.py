@@ -0,0 +1,110 @@
+import asyncio
+from unittest import TestCase
+
+from pydantic import ValidationError
+
+from python_camunda_sdk import (
+    CamundaRuntime,
+    InsecureConfig,
+    OutboundConnector,
+)
+from python_camunda_sdk import metrics
+
+from gateway import FakeGateway
+from util import async_test, metric_value, requires_prometheus, DummyJob
+
+
+class MetricsConnector(OutboundConnector):
+    foo: int
+
+    async def run(self) -> int:
+        if self.foo < 0:
+            raise ValueError("negative")
+        return self.foo
+
+    class ConnectorConfig:
+        name = "metrics"
+        type = "metrics"
+
+
+def sample(name):
+    return metric_value(f"camunda_connector_{name}", connector_type="metrics")
+
+
+@requires_prometheus
+class TestMetrics(TestCase):
+    def test_labels_mismatch(self):
+        with self.assertRaises(ValueError):
+            metrics.JOBS_ACTIVATED.labels("a", "b")
+
+    @async_test
+    async def test_task_metrics(self):
+        task = MetricsConnector.to_task(client=None)
+        completed = sample("jobs_completed_total")
+        failed = sample("jobs_failed_total")
+        invalid = sample("validation_failures_total")
+
+        await task(job=DummyJob(result_variable="res"), foo=1)
+        with self.assertRaises(ValueError):
+            await task(job=DummyJob(result_variable="res"), foo=-1)
+        with self.assertRaises(ValidationError):
+            await task(job=DummyJob(result_variable="res"), foo="bar")
+
+        self.assertEqual(sample("jobs_completed_total"), completed + 1)
+        self.assertEqual(sample("jobs_failed_total"), failed + 2)
+        self.assertEqual(sample("validation_failures_total"), invalid + 1)
+        self.assertEqual(sample("jobs_in_flight"), 0)
+
+    @async_test
+    async def test_worker_metrics(self):
+        gateway = await FakeGateway(streaming=False).start()
+        runtime = CamundaRuntime(
+            config=InsecureConfig(hostname="127.0.0.1", port=gateway.port),
+            outbound_connectors=[MetricsConnector],
+        )
+        activated = sample("jobs_activated_total")
+        observed = sample("job_seconds_count")
+
+        main = asyncio.get_running_loop().create_task(runtime.main())
+        try:
+            await asyncio.sleep(0.2)
+            for foo in (1, -1):
+                await gateway.add_job(
+                    "metrics",
+                    variables={"foo": foo},
+                    custom_headers={"resultVariable": "res"},
+                )
+            await gateway.wait_finished(2)
+        finally:
+            await runtime.stop()
+            await main
+            await gateway.stop()
+
+        self.assertEqual(sample("jobs_activated_total"), activated + 2)
+        self.assertEqual(sample("job_seconds_count"), observed + 1)
+
+    @async_test
+    async def test_metrics_server(self):
+        server = metrics.start_metrics_server(0, host="127.0.0.1")
+        try:
+            self.assertTrue(metrics.is_exposed())
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", server.server_port
+            )
+            writer.write(
+                b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+            response = (await reader.read()).decode()
+            writer.close()
+        finally:
+            await asyncio.get_running_loop().run_in_executor(
+                None, metrics.stop_metrics_server, server
+            )
+
+        self.assertFalse(metrics.is_exposed())
+        self.assertTrue(response.startswith("HTTP/1.0 200 OK"))
+        self.assertIn(
+            "# TYPE camunda_connector_jobs_activated_total counter", response
+        )
+        self.assertNotIn("python_gc_objects_collected_total", response)
@@ -1,8 +1,23 @@
+import os
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from unittest import TestCase
 
-from pydantic import ValidationError, BaseModel
+from loguru import logger
+from pydantic import (
+    AliasChoices,
+    AliasPath,
+    BaseModel,
+    Field,
+    ValidationError,
+)
+from pyzeebe.errors import BusinessError
 
 from python_camunda_sdk import OutboundConnector
+from python_camunda_sdk.connectors import JobDeadlineExceeded, RetryPolicy
+from python_camunda_sdk.connectors.connector import _NO_VARIABLES
 
 from util import true_body, none_body, dict_body, async_test, DummyJob
 
@@ -15,6 +30,18 @@ def model_body(self):
     return DummyModel(foo=1)
 
 
+class ProcessOutboundConnector(OutboundConnector):
+    foo: int
+
+    def run(self) -> DummyModel:
+        return DummyModel(foo=os.getpid())
+
+    class ConnectorConfig:
+        name = "process"
+        type = "process"
+        execution_mode = "process"
+
+
 class TestOutbound(TestCase):
     def generate_outbound_connector(self, run_body, ret_type):
         class DummyOutboundConnector(OutboundConnector):
@@ -85,6 +112,54 @@ class TestOutbound(TestCase):
         self.assertIn("ret", ret)
         self.assertTrue(ret["ret"])
 
+    @async_test
+    async def test_sync_run_in_executor(self):
+        class DummyOutboundConnector(OutboundConnector):
+            def run(self) -> str:
+                return threading.current_thread().name
+
+            class ConnectorConfig:
+                name = "dummy"
+                type = "dummy"
+                timeout = 10
+
+        connector = DummyOutboundConnector()
+        executor = ThreadPoolExecutor(thread_name_prefix="dummy-pool")
+
+        job = DummyJob(result_variable="ret")
+        ret = await connector._execute(job=job, executor=executor)
+        executor.shutdown()
+
+        self.assertTrue(ret["ret"].startswith("dummy-pool"))
+
+    @async_test
+    async def test_process_run(self):
+        connector = ProcessOutboundConnector(foo=1)
+        executor = ProcessPoolExecutor(max_workers=1)
+
+        job = DummyJob(result_variable="ret")
+        ret = await connector._execute(job=job, executor=executor)
+        executor.shutdown()
+
+        self.assertIsInstance(ret["ret"], dict)
+        self.assertNotEqual(ret["ret"]["foo"], os.getpid())
+
+    @async_test
+    async def test_process_run_without_pool(self):
+        messages = []
+        handler = logger.add(messages.append, level="WARNING")
+        try:
+            for _ in range(2):
+                ret = await ProcessOutboundConnector(foo=1)._execute(
+                    job=DummyJob(result_variable="ret")
+                )
+                self.assertEqual(ret["ret"]["foo"], os.getpid())
+        finally:
+            logger.remove(handler)
+
+        (message,) = messages
+        self.assertIn("not given a process pool", message)
+
     @async_test
     async def test_return_none(self):
         cls = self.generate_outbound_connector(none_body, None.__class__)
@@ -191,6 +266,30 @@ class TestOutbound(TestCase):
         self.assertIn("ret", ret)
         self.assertTrue(ret["ret"])
 
+    @async_test
+    async def test_task_max_concurrency(self):
+        running = []
+
+        class DummyOutboundConnector(OutboundConnector):
+            async def run(self) -> int:
+                running.append(self)
+                await asyncio.sleep(0.05)
+                concurrency = len(running)
+                running.remove(self)
+                return concurrency
+
+            class ConnectorConfig:
+                name = "dummy"
+                type = "dummy"
+                max_concurrency = 2
+
+        task = DummyOutboundConnector.to_task(client=None)
+        rets = await asyncio.gather(
+            *[task(job=DummyJob(result_variable="ret")) for _ in range(5)]
+        )
+
+        self.assertEqual(max(ret["ret"] for ret in rets), 2)
+
     @async_test
     async def test_task_validation_failure(self):
         class DummyOutboundConnector(OutboundConnector):
@@ -208,3 +307,188 @@ class TestOutbound(TestCase):
         job = DummyJob(result_variable="ret")
         with self.assertRaises(ValidationError):
             await task(job=job, input_field="foo")
+
+    def test_compiled_attributes(self):
+        cls = self.generate_outbound_connector(true_body, bool)
+
+        self.assertFalse(cls._is_coroutine)
+        self.assertEqual(cls._input_fields, ())
+        self.assertTrue(cls._return_adapter.dump_python(True))
+
+    @async_test
+    async def test_trusted_input(self):
+        class DummyOutboundConnector(OutboundConnector):
+            foo: int
+            items: list = []
+
+            async def run(self) -> int:
+                return self.foo
+
+            class ConnectorConfig:
+                name = "dummy"
+                type = "dummy"
+                trusted_input = True
+
+        connector = DummyOutboundConnector._from_variables(
+            {"foo": 1, "bar": 2}
+        )
+        self.assertEqual(connector.foo, 1)
+        self.assertEqual(connector.items, [])
+        self.assertEqual(connector.model_fields_set, {"foo"})
+
+        with self.assertRaises(ValidationError):
+            DummyOutboundConnector._from_variables({"bar": 2})
+
+        task = DummyOutboundConnector.to_task(client=None)
+        ret = await task(job=DummyJob(result_variable="ret"), foo=3)
+        self.assertEqual(ret, {"ret": 3})
+
+    def test_variables_to_fetch(self):
+        class AliasConnector(OutboundConnector):
+            size: int = Field(validation_alias="fileSize")
+            name: str = Field(validation_alias=AliasChoices("name", "title"))
+            owner: str = Field(validation_alias=AliasPath("meta", "owner"))
+            kind: str = Field(alias="type")
+
+            async def run(self) -> int:
+                return self.size
+
+            class ConnectorConfig:
+                name = "alias"
+                type = "alias"
+                trusted_input = True
+
+        self.assertEqual(
+            AliasConnector._variables_to_fetch(),
+            ["fileSize", "name", "title", "meta", "type"],
+        )
+        connector = AliasConnector._from_variables(
+            {
+                "fileSize": 1,
+                "title": "a",
+                "meta": {"owner": "b"},
+                "type": "c",
+            }
+        )
+        self.assertEqual(
+            (connector.size, connector.name, connector.owner, connector.kind),
+            (1, "a", "b", "c"),
+        )
+
+        cls = self.generate_outbound_connector(true_body, bool)
+        self.assertEqual(cls._variables_to_fetch(), [_NO_VARIABLES])
+
+    def test_trusted_input_aliases(self):
+        class DummyOutboundConnector(OutboundConnector):
+            size: int = Field(validation_alias=AliasChoices("size", "bytes"))
+
+            async def run(self) -> int:
+                return self.size
+
+            class ConnectorConfig:
+                name = "dummy"
+                type = "dummy"
+                trusted_input = True
+
+        connector = DummyOutboundConnector._from_variables({"bytes": 2})
+        self.assertEqual(connector.size, 2)
+        self.assertEqual(connector.model_fields_set, {"size"})
+
+    @async_test
+    async def test_deadline(self):
+        class DummyOutboundConnector(OutboundConnector):
+            async def run(self) -> bool:
+                await asyncio.sleep(1)
+                return True
+
+            class ConnectorConfig:
+                name = "dummy"
+                type = "dummy"
+                deadline_margin = 0.5
+
+        job = DummyJob(result_variable="ret")
+        job.key = 1
+        job.deadline = int((time.time() + 0.6) * 1000)
+
+        start = time.perf_counter()
+        with self.assertRaises(JobDeadlineExceeded):
+            await DummyOutboundConnector()._execute(job=job)
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    @async_test
+    async def test_retry(self):
+        calls = []
+
+        class DummyOutboundConnector(OutboundConnector):
+            async def run(self) -> int:
+                calls.append(None)
+                if len(calls) < 3:
+                    raise ConnectionError()
+                return len(calls)
+
+            class ConnectorConfig:
+                name = "dummy"
+                type = "dummy"
+                retry = RetryPolicy(
+                    attempts=3, initial_backoff=0.01, retry_on=(OSError,)
+                )
+
+        job = DummyJob(result_variable="ret")
+        ret_value = await DummyOutboundConnector()._execute(job=job)
+        self.assertEqual(ret_value, {"ret": 3})
+
+        calls.clear()
+        DummyOutboundConnector.config.retry.attempts = 2
+        with self.assertRaises(ConnectionError):
+            await DummyOutboundConnector()._execute(job=job)
+        self.assertEqual(len(calls), 2)
+
+    @async_test
+    async def test_retry_not_retryable(self):
+        calls = []
+
+        class DummyOutboundConnector(OutboundConnector):
+            error: str
+
+            async def run(self) -> bool:
+                calls.append(None)
+                if self.error == "business":
+                    raise BusinessError("code")
+                raise ValueError()
+
+            class ConnectorConfig:
+                name = "dummy"
+                type = "dummy"
+                retry = RetryPolicy(initial_backoff=0, retry_on=(OSError,))
+
+        job = DummyJob(result_variable="ret")
+        for error, exception in (
+            ("business", BusinessError),
+            ("value", ValueError),
+        ):
+            calls.clear()
+            with self.assertRaises(exception):
+                await DummyOutboundConnector(error=error)._execute(job=job)
+            self.assertEqual(len(calls), 1)
+
+    @async_test
+    async def test_retry_within_deadline(self):
+        calls = []
+
+        class DummyOutboundConnector(OutboundConnector):
+            async def run(self) -> bool:
+                calls.append(None)
+                raise ConnectionError()
+
+            class ConnectorConfig:
+                name = "dummy"
+                type = "dummy"
+                retry = RetryPolicy(attempts=10, initial_backoff=1, jitter=0)
+
+        job = DummyJob(result_variable="ret")
+        job.key = 1
+        job.deadline = int((time.time() + 0.5) * 1000)
+
+        with self.assertRaises(ConnectionError):
+            await DummyOutboundConnector()._execute(job=job)
+        self.assertEqual(len(calls), 1)
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from python_camunda_sdk import OutboundConnector
+from python_camunda_sdk.connectors import ProfileConfig
+from python_camunda_sdk.connectors.profiling import Profile, Profiler
+
+from util import async_test, DummyJob
+
+
+def busy(duration):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+
+class BusyConnector(OutboundConnector):
+    duration: float
+
+    async def run(self) -> bool:
+        busy(self.duration)
+        return True
+
+    class ConnectorConfig:
+        name = "busy"
+        type = "busy"
+
+
+class SyncBusyConnector(OutboundConnector):
+    duration: float
+
+    def run(self) -> bool:
+        busy(self.duration)
+        return True
+
+    class ConnectorConfig:
+        name = "sync_busy"
+        type = "sync_busy"
+
+
+class TestProfiling(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        for connector_cls in (BusyConnector, SyncBusyConnector):
+            connector_cls.config.profile = None
+            if "_profiler" in connector_cls.__dict__:
+                del connector_cls._profiler
+
+    def read(self, connector_type):
+        path = os.path.join(self.directory.name, f"{connector_type}.collapsed")
+        if not os.path.exists(path):
+            return ""
+        with open(path) as f:
+            return f.read()
+
+    @async_test
+    async def test_sampled_jobs(self):
+        for connector_cls in (BusyConnector, SyncBusyConnector):
+            connector_cls.config.profile = ProfileConfig(
+                directory=self.directory.name, sample_rate=1, interval=0.001
+            )
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                await connector_cls(duration=0.1)._execute(
+                    job=DummyJob(result_variable="ret"), executor=executor
+                )
+            connector_cls._get_profiler().flush()
+
+            profile = self.read(connector_cls.config.type)
+            for line in profile.splitlines():
+                stack, count = line.rsplit(" ", 1)
+                self.assertIn("busy (test_profiling.py", stack)
+                self.assertGreater(int(count), 0)
+            self.assertNotEqual(profile, "")
+
+    @async_test
+    async def test_latency_threshold(self):
+        BusyConnector.config.profile = ProfileConfig(
+            directory=self.directory.name,
+            sample_rate=0,
+            latency_threshold=0.05,
+            interval=0.001,
+        )
+        job = DummyJob(result_variable="ret")
+
+        await BusyConnector(duration=0)._execute(job=job)
+        BusyConnector._get_profiler().flush()
+        self.assertEqual(self.read("busy"), "")
+
+        await BusyConnector(duration=0.1)._execute(job=job)
+        BusyConnector._get_profiler().flush()
+        self.assertIn("busy (test_profiling.py", self.read("busy"))
+
+    def test_rotation(self):
+        profiler = Profiler(
+            ProfileConfig(
+                directory=self.directory.name, max_bytes=100, backup_count=2
+            ),
+            "rotated",
+        )
+        profile = Profile(DummyJob())
+        profile.stacks["run (connector.py:1)"] = 1
+
+        for _ in range(20):
+            profiler._write(profile, 0.0)
+
+        self.assertEqual(
+            sorted(os.listdir(self.directory.name)),
+            [
+                "rotated.collapsed",
+                "rotated.collapsed.1",
+                "rotated.collapsed.2",
+            ],
+        )
+        for name in os.listdir(self.directory.name):
+            path = os.path.join(self.directory.name, name)
+            self.assertLessEqual(os.path.getsize(path), 100)
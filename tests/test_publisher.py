@@ -0,0 +1,75 @@
+import asyncio
+
+from unittest import TestCase
+
+from pyzeebe.errors import ZeebeBackPressureError
+
+from python_camunda_sdk.runtime.publisher import MessagePublisher
+
+from util import async_test, DummyClient
+
+
+class FlakyClient(DummyClient):
+    def __init__(self, failures):
+        self.failures = failures
+        self.published = []
+
+    async def publish_message(self, name, correlation_key, **kwargs):
+        if self.failures.get(name, 0) > 0:
+            self.failures[name] -= 1
+            raise ZeebeBackPressureError()
+        if name == "invalid":
+            raise ValueError("Invalid message")
+        self.published.append(name)
+
+
+class SlowClient(DummyClient):
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def publish_message(self, name, correlation_key, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+
+class TestMessagePublisher(TestCase):
+    @async_test
+    async def test_publish(self):
+        client = FlakyClient(failures={"retried": 1})
+        publisher = MessagePublisher(client, retry_delay=0)
+
+        results = await asyncio.gather(
+            publisher.publish_message("ok", "key"),
+            publisher.publish_message("retried", "key"),
+            publisher.publish_message("invalid", "key"),
+            return_exceptions=True,
+        )
+        await publisher.close()
+
+        self.assertIsNone(results[0])
+        self.assertIsNone(results[1])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(sorted(client.published), ["ok", "retried"])
+
+    @async_test
+    async def test_retries_exhausted(self):
+        client = FlakyClient(failures={"retried": 2})
+        publisher = MessagePublisher(client, max_retries=1, retry_delay=0)
+
+        with self.assertRaises(ZeebeBackPressureError):
+            await publisher.publish_message("retried", "key")
+
+    @async_test
+    async def test_max_concurrency(self):
+        client = SlowClient()
+        publisher = MessagePublisher(client, max_concurrency=2)
+
+        await asyncio.gather(
+            *[publisher.publish_message(str(i), "key") for i in range(5)]
+        )
+        await publisher.close()
+
+        self.assertEqual(client.max_active, 2)
@@ -0,0 +1,129 @@
+import asyncio
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from pydantic import ValidationError
+
+from python_camunda_sdk import OutboundConnector
+from python_camunda_sdk.connectors import RateLimitConfig
+from python_camunda_sdk.connectors.ratelimit import (
+    SQLiteTokenBucket,
+    TokenBucket,
+    get_token_bucket,
+)
+from python_camunda_sdk.runtime.activation import ActivationController
+
+from util import async_test, DummyJob
+
+
+def refresh(bucket):
+    """Reads the available tokens of an SQLite bucket from the database."""
+    bucket._available_at = float("-inf")
+    bucket.available()
+    bucket._executor.submit(int).result()
+    return bucket.available()
+
+
+class QuotaConnector(OutboundConnector):
+    value: int
+
+    async def run(self) -> int:
+        return self.value
+
+    class ConnectorConfig:
+        name = "quota"
+        type = "quota"
+        rate_limit = RateLimitConfig(rate=50, burst=2, key="api.example.com")
+
+
+class OtherQuotaConnector(QuotaConnector):
+    class ConnectorConfig:
+        name = "other_quota"
+        type = "other_quota"
+        rate_limit = RateLimitConfig(rate=50, burst=2, key="api.example.com")
+
+
+class TestRateLimit(TestCase):
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=10, burst=2)
+
+        self.assertEqual(bucket.available(), 2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.available(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.01)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.01)
+
+    @async_test
+    async def test_sqlite_shared(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ratelimit.sqlite3")
+            first = SQLiteTokenBucket(path, "api", rate=10, burst=2)
+            second = SQLiteTokenBucket(path, "api", rate=10, burst=2)
+            other = SQLiteTokenBucket(path, "other", rate=10, burst=2)
+
+            self.assertEqual(await first.acquire(), 0)
+            self.assertEqual(await second.acquire(), 0)
+            self.assertEqual(first.available(), 1)
+
+            self.assertEqual(refresh(second), 0)
+            self.assertEqual(refresh(other), 2)
+
+            start = time.monotonic()
+            delay = await first.acquire()
+            self.assertGreater(delay, 0)
+            self.assertGreaterEqual(time.monotonic() - start, delay)
+
+            for bucket in (first, second, other):
+                bucket.close()
+
+    def test_sqlite_requires_path(self):
+        with self.assertRaises(ValidationError):
+            RateLimitConfig(rate=1, backend="sqlite")
+
+    def test_shared_key(self):
+        self.assertIs(
+            QuotaConnector._get_token_bucket(),
+            OtherQuotaConnector._get_token_bucket(),
+        )
+
+    def test_shared_key_conflict(self):
+        get_token_bucket(
+            RateLimitConfig(rate=50, burst=2, key="conflict"), "quota"
+        )
+        with self.assertRaises(ValueError):
+            get_token_bucket(
+                RateLimitConfig(rate=10, burst=2, key="conflict"), "quota"
+            )
+        with self.assertRaises(ValueError):
+            get_token_bucket(
+                RateLimitConfig(rate=50, burst=5, key="conflict"), "quota"
+            )
+
+    @async_test
+    async def test_rate_limited_connector(self):
+        task = QuotaConnector.to_task(client=None)
+        await asyncio.sleep(2 / 50)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *[
+                task(job=DummyJob(result_variable="ret"), value=i)
+                for i in range(7)
+            ]
+        )
+
+        self.assertEqual(results, [{"ret": i} for i in range(7)])
+        self.assertGreaterEqual(time.perf_counter() - start, 5 / 50 - 0.01)
+
+    def test_activation_capacity(self):
+        controller = ActivationController()
+        bucket = TokenBucket(rate=1, burst=3)
+        controller.add_capacity_source("quota", bucket.available)
+
+        self.assertEqual(controller.capacity("quota", 32), 3)
+        bucket.reserve()
+        bucket.reserve()
+        self.assertEqual(controller.capacity("quota", 32), 1)
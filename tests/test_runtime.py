@@ -1,12 +1,43 @@
 import os
-from unittest import TestCase
+from unittest import TestCase, mock
+
+from pydantic import Field
+
+from util import async_test, DummyJob
 
 from python_camunda_sdk import (
     CamundaRuntime,
     CloudConfig,
     SecureConfig,
     InsecureConfig,
+    OutboundConnector,
+    CamundaSupervisor,
 )
+from python_camunda_sdk.runtime.channel import ChannelPool
+from python_camunda_sdk.runtime.config import generate_config_from_env
+
+
+class SharedPoolConnector(OutboundConnector):
+    name: str
+    size: int = Field(default=0, alias="fileSize")
+
+    def run(self) -> bool:
+        return True
+
+    class ConnectorConfig:
+        name = "shared"
+        type = "shared"
+
+
+class DedicatedPoolConnector(OutboundConnector):
+    def run(self) -> bool:
+        return True
+
+    class ConnectorConfig:
+        name = "dedicated"
+        type = "dedicated"
+        max_workers = 2
+        max_concurrency = 4
 
 
 class TestRuntime(TestCase):
@@ -36,6 +67,118 @@ class TestRuntime(TestCase):
         runtime = CamundaRuntime(config=config)
         self.assertIsNotNone(runtime)
 
+    def test_executors(self):
+        config = InsecureConfig(hostname="hostname", port=0)
+        runtime = CamundaRuntime(config=config, max_workers=4)
+
+        shared = runtime._get_executor(SharedPoolConnector.config)
+        dedicated = runtime._get_executor(DedicatedPoolConnector.config)
+
+        self.assertIs(
+            shared, runtime._get_executor(SharedPoolConnector.config)
+        )
+        self.assertIsNot(shared, dedicated)
+        self.assertEqual(shared._max_workers, 4)
+        self.assertEqual(dedicated._max_workers, 2)
+
+        runtime._shutdown_executors()
+
+    @async_test
+    async def test_load_connector_limits(self):
+        config = InsecureConfig(hostname="hostname", port=0)
+        runtime = CamundaRuntime(config=config)
+        runtime._connect()
+
+        runtime._load_connector(DedicatedPoolConnector)
+        task_config = runtime._worker.get_task("dedicated").config
+
+        self.assertEqual(task_config.max_jobs_to_activate, 4)
+        self.assertEqual(task_config.max_running_jobs, 4)
+
+        runtime._shutdown_executors()
+
+    @async_test
+    async def test_load_connector_variables(self):
+        config = InsecureConfig(hostname="hostname", port=0)
+        runtime = CamundaRuntime(config=config)
+        runtime._connect()
+
+        runtime._load_connector(SharedPoolConnector)
+        task_config = runtime._worker.get_task("shared").config
+
+        self.assertEqual(task_config.variables_to_fetch, ["name", "fileSize"])
+
+        runtime._shutdown_executors()
+
+    @async_test
+    async def test_max_jobs(self):
+        config = InsecureConfig(hostname="hostname", port=0)
+        runtime = CamundaRuntime(config=config, max_jobs=2)
+        runtime._connect()
+
+        await runtime._count_job(DummyJob())
+        self.assertIsNone(runtime._stopping)
+
+        await runtime._count_job(DummyJob())
+        self.assertIsNotNone(runtime._stopping)
+        await runtime._stopping
+
+    def test_supervisor_pins(self):
+        config = InsecureConfig(hostname="hostname", port=0)
+        supervisor = CamundaSupervisor(
+            config=config,
+            outbound_connectors=[SharedPoolConnector, DedicatedPoolConnector],
+            processes=2,
+            pins={"dedicated": [1]},
+        )
+
+        self.assertEqual(
+            supervisor._connectors_for(0)["outbound_connectors"],
+            [SharedPoolConnector],
+        )
+        self.assertEqual(
+            supervisor._connectors_for(1)["outbound_connectors"],
+            [SharedPoolConnector, DedicatedPoolConnector],
+        )
+
+    def test_supervisor_invalid_pins(self):
+        config = InsecureConfig(hostname="hostname", port=0)
+        with self.assertRaises(ValueError):
+            CamundaSupervisor(
+                config=config,
+                outbound_connectors=[SharedPoolConnector],
+                processes=2,
+                pins={"shared": [2]},
+            )
+
+    def test_supervisor_metrics_ports(self):
+        config = InsecureConfig(hostname="hostname", port=0)
+        supervisor = CamundaSupervisor(
+            config=config,
+            outbound_connectors=[SharedPoolConnector],
+            processes=2,
+            metrics_port=9000,
+        )
+
+        self.assertEqual(
+            supervisor._runtime_kwargs_for(0)["metrics_port"], 9000
+        )
+        self.assertEqual(
+            supervisor._runtime_kwargs_for(1)["metrics_port"], 9001
+        )
+
+    def test_supervisor_kill_timeout(self):
+        config = InsecureConfig(hostname="hostname", port=0)
+        supervisor = CamundaSupervisor(
+            config=config,
+            outbound_connectors=[SharedPoolConnector],
+            shutdown_timeout=10.0,
+        )
+
+        self.assertEqual(
+            supervisor._kill_timeout(), 10.0 + supervisor.kill_margin
+        )
+
     def test_cloud_config_from_env(self):
         os.environ["CAMUNDA_CONNECTION_TYPE"] = "CAMUNDA_CLOUD"
         os.environ["CAMUNDA_CLIENT_ID"] = "client_id"
@@ -86,3 +229,54 @@ class TestRuntime(TestCase):
         del os.environ["CAMUNDA_CONNECTION_TYPE"]
         with self.assertRaises(ValueError):
             CamundaRuntime()
+
+    def test_channel_options(self):
+        config = InsecureConfig(
+            hostname="hostname",
+            keepalive_timeout_ms=10_000,
+            keepalive_permit_without_calls=True,
+            compression="gzip",
+            max_receive_message_length=64 * 1024 * 1024,
+            channel_pool_size=2,
+        )
+
+        self.assertEqual(
+            config.channel_options(),
+            {
+                "grpc.keepalive_time_ms": 45_000,
+                "grpc.keepalive_timeout_ms": 10_000,
+                "grpc.keepalive_permit_without_calls": 1,
+                "grpc.http2.max_pings_without_data": 0,
+                "grpc.default_compression_algorithm": 2,
+                "grpc.max_receive_message_length": 64 * 1024 * 1024,
+                "grpc.use_local_subchannel_pool": 1,
+            },
+        )
+
+    def test_channel_config_from_env(self):
+        env = {
+            "CAMUNDA_CONNECTION_TYPE": "INSECURE",
+            "ZEBEE_HOSTNAME": "zeebe",
+            "CAMUNDA_GRPC_KEEPALIVE_TIME_MS": "20000",
+            "CAMUNDA_GRPC_COMPRESSION": "gzip",
+            "CAMUNDA_GRPC_CHANNEL_POOL_SIZE": "3",
+        }
+        with mock.patch.dict(os.environ, env, clear=True):
+            config = generate_config_from_env()
+
+        self.assertEqual(config.port, 26500)
+        self.assertEqual(config.keepalive_time_ms, 20_000)
+        self.assertEqual(config.compression, "gzip")
+        self.assertEqual(config.channel_pool_size, 3)
+
+    @async_test
+    async def test_channel_pool(self):
+        config = InsecureConfig(hostname="hostname", channel_pool_size=3)
+        runtime = CamundaRuntime(config=config)
+        runtime._connect()
+
+        self.assertIsInstance(runtime._channel, ChannelPool)
+        self.assertEqual(len(runtime._channel.channels), 3)
+        self.assertIs(runtime._worker.zeebe_adapter._channel, runtime._channel)
+
+        await runtime._channel.close()
@@ -0,0 +1,76 @@
+import json
+from unittest import TestCase
+
+import grpc
+
+from pydantic import BaseModel
+
+from zeebe_grpc.gateway_pb2 import ActivatedJob
+
+from python_camunda_sdk import OutboundConnector
+from python_camunda_sdk.runtime.worker import RuntimeAdapter
+from python_camunda_sdk.serialization import (
+    JSONSerializer,
+    OrjsonSerializer,
+    RawJSON,
+    default_serializer,
+)
+
+from util import async_test, DummyJob
+
+
+class Result(BaseModel):
+    values: list
+
+
+class ResultConnector(OutboundConnector):
+    size: int
+
+    async def run(self) -> Result:
+        return Result(values=list(range(self.size)))
+
+    class ConnectorConfig:
+        name = "result"
+        type = "result"
+
+
+class TestSerialization(TestCase):
+    def test_dumps_variables(self):
+        variables = {"foo": [1, "ü"], "ret": RawJSON(b'{"bar":1}')}
+
+        for serializer in (JSONSerializer(), OrjsonSerializer()):
+            encoded = serializer.dumps_variables(variables)
+            self.assertEqual(
+                json.loads(encoded), {"foo": [1, "ü"], "ret": {"bar": 1}}
+            )
+            self.assertEqual(serializer.loads(encoded)["foo"], [1, "ü"])
+
+    def test_default_serializer(self):
+        self.assertIsInstance(default_serializer(), OrjsonSerializer)
+
+    @async_test
+    async def test_decode_job(self):
+        channel = grpc.aio.insecure_channel("localhost:26500")
+        adapter = RuntimeAdapter(channel, serializer=JSONSerializer())
+        job = adapter._create_job_from_raw_job(
+            ActivatedJob(
+                key=1,
+                type="result",
+                customHeaders='{"resultVariable": "ret"}',
+                variables='{"size": 2}',
+            )
+        )
+
+        self.assertEqual(job.variables, {"size": 2})
+        self.assertEqual(job.custom_headers, {"resultVariable": "ret"})
+        await channel.close()
+
+    @async_test
+    async def test_encoded_result(self):
+        task = ResultConnector.to_task(
+            client=None, serializer=JSONSerializer()
+        )
+        ret = await task(job=DummyJob(result_variable="ret"), size=3)
+
+        self.assertIsInstance(ret["ret"], RawJSON)
+        self.assertEqual(json.loads(ret["ret"].data), {"values": [0, 1, 2]})
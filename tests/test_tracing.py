@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+from unittest import TestCase
+
+from python_camunda_sdk import CamundaRuntime, InsecureConfig, tracing
+
+from gateway import FakeGateway
+from util import async_test
+from test_worker import EchoConnector
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+except ImportError:
+    TracerProvider = None
+
+
+class TestTracing(TestCase):
+    def test_disabled(self):
+        self.assertIs(tracing.span("foo"), tracing._NOOP)
+        self.assertIs(tracing.job_span("foo", None, "bar"), tracing._NOOP)
+
+    @unittest.skipIf(TracerProvider is None, "opentelemetry-sdk is missing")
+    @async_test
+    async def test_job_spans(self):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        tracing.enable_tracing(tracer_provider=provider)
+
+        gateway = await FakeGateway(streaming=False).start()
+        runtime = CamundaRuntime(
+            config=InsecureConfig(hostname="127.0.0.1", port=gateway.port),
+            outbound_connectors=[EchoConnector],
+        )
+        main = asyncio.get_running_loop().create_task(runtime.main())
+        try:
+            key = await gateway.add_job(
+                "echo",
+                variables={"value": 1},
+                custom_headers={"resultVariable": "ret"},
+            )
+            await gateway.wait_finished(1)
+        finally:
+            tracing.disable_tracing()
+            await runtime.stop()
+            await main
+            await gateway.stop()
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        self.assertEqual(
+            set(spans),
+            {
+                "camunda.job",
+                "camunda.validate",
+                "camunda.run",
+                "camunda.serialize",
+                "camunda.complete",
+            },
+        )
+
+        root = spans["camunda.job"]
+        for span in spans.values():
+            self.assertEqual(span.context.trace_id, root.context.trace_id)
+            self.assertEqual(span.attributes["camunda.job.key"], key)
+            self.assertEqual(
+                span.attributes["camunda.process_instance.key"], key
+            )
+            self.assertEqual(span.attributes["camunda.connector.type"], "echo")
+            if span is not root:
+                self.assertEqual(span.parent.span_id, root.context.span_id)
@@ -0,0 +1,73 @@
+import asyncio
+import time
+from unittest import TestCase
+
+from loguru import logger
+
+from python_camunda_sdk import OutboundConnector
+from python_camunda_sdk.runtime import LoopWatchdog
+
+from util import async_test, metric_value, requires_prometheus, DummyJob
+
+
+class BlockingConnector(OutboundConnector):
+    async def run(self) -> bool:
+        time.sleep(0.3)
+        return True
+
+    class ConnectorConfig:
+        name = "blocking"
+        type = "blocking"
+
+
+class TestLoopWatchdog(TestCase):
+    @requires_prometheus
+    @async_test
+    async def test_blocked_loop(self):
+        messages = []
+        handler = logger.add(messages.append, level="WARNING")
+        blocked = metric_value(
+            "camunda_event_loop_blocked_total", connector_type="blocking"
+        )
+
+        job = DummyJob(result_variable="ret")
+        job.key = 42
+        job.type = "blocking"
+
+        watchdog = LoopWatchdog(threshold=0.1, interval=0.02)
+        await watchdog.start()
+        try:
+            await asyncio.sleep(0.05)
+            await BlockingConnector()._execute(job=job)
+            await asyncio.sleep(0.05)
+        finally:
+            await watchdog.stop()
+            logger.remove(handler)
+
+        (message,) = messages
+        self.assertIn("by job 42 of blocking", message)
+        self.assertIn("time.sleep(0.3)", message)
+        self.assertEqual(
+            metric_value(
+                "camunda_event_loop_blocked_total", connector_type="blocking"
+            ),
+            blocked + 1,
+        )
+        self.assertGreater(
+            metric_value("camunda_event_loop_lag_seconds_sum"), 0.2
+        )
+
+    @async_test
+    async def test_idle_loop(self):
+        messages = []
+        handler = logger.add(messages.append, level="WARNING")
+
+        watchdog = LoopWatchdog(threshold=0.1, interval=0.02)
+        await watchdog.start()
+        try:
+            await asyncio.sleep(0.2)
+        finally:
+            await watchdog.stop()
+            logger.remove(handler)
+
+        self.assertEqual(messages, [])
@@ -0,0 +1,434 @@
+import asyncio
+import os
+import signal
+import threading
+import time
+
+from unittest import TestCase
+
+from concurrent.futures import ThreadPoolExecutor
+
+from python_camunda_sdk import (
+    CamundaRuntime,
+    InboundConnector,
+    InsecureConfig,
+    OutboundConnector,
+)
+from python_camunda_sdk.runtime.activation import (
+    ActivationController,
+    CountingThreadPoolExecutor,
+    executor_capacity,
+)
+
+from benchmark import SCENARIOS, measure_runtime
+from gateway import FakeGateway
+from util import async_test
+
+
+class EchoConnector(OutboundConnector):
+    value: int
+
+    async def run(self) -> int:
+        return self.value
+
+    class ConnectorConfig:
+        name = "echo"
+        type = "echo"
+
+
+class TestActivationController(TestCase):
+    def test_capacity(self):
+        controller = ActivationController()
+        controller.add_capacity_source("echo", lambda: 3)
+        controller.add_capacity_source("echo", lambda: None)
+
+        self.assertEqual(controller.capacity("echo", 32), 3)
+        self.assertEqual(controller.capacity("echo", 2), 2)
+        self.assertEqual(controller.capacity("other", 32), 32)
+
+    def test_poll_delay(self):
+        controller = ActivationController(
+            max_poll_delay=0.3, initial_poll_delay=0.1
+        )
+
+        controller.record_poll("echo", requested=10, activated=0)
+        self.assertEqual(controller.poll_delay("echo"), 0.1)
+        controller.record_poll("echo", requested=10, activated=0)
+        self.assertEqual(controller.poll_delay("echo"), 0.2)
+        controller.record_poll("echo", requested=10, activated=0)
+        self.assertEqual(controller.poll_delay("echo"), 0.3)
+        controller.record_poll("echo", requested=10, activated=5)
+        self.assertEqual(controller.poll_delay("echo"), 0.15)
+        controller.record_poll("echo", requested=10, activated=10)
+        self.assertEqual(controller.poll_delay("echo"), 0)
+
+    def test_executor_capacity(self):
+        executor = CountingThreadPoolExecutor(max_workers=2)
+        self.assertEqual(executor_capacity(executor), 2)
+
+        release = threading.Event()
+        for _ in range(3):
+            executor.submit(release.wait)
+        self.assertEqual(executor.in_flight, 3)
+        self.assertEqual(executor_capacity(executor), 0)
+
+        release.set()
+        executor.shutdown()
+        self.assertEqual(executor_capacity(executor), 2)
+
+        self.assertIsNone(executor_capacity(ThreadPoolExecutor()))
+
+
+class PooledConnector(OutboundConnector):
+    value: int
+
+    @classmethod
+    async def setup(cls) -> dict:
+        cls.calls = ["setup"]
+        return {"offset": 10}
+
+    @classmethod
+    async def teardown(cls, resources: dict):
+        cls.calls.append(("teardown", resources))
+
+    async def run(self) -> int:
+        return self.value + self.resources["offset"]
+
+    class ConnectorConfig:
+        name = "pooled"
+        type = "pooled"
+
+
+class SlowSetupConnector(OutboundConnector):
+    value: int
+
+    @classmethod
+    async def setup(cls) -> dict:
+        await asyncio.sleep(0.3)
+        return {}
+
+    async def run(self) -> int:
+        return self.value
+
+    class ConnectorConfig:
+        name = "slow-setup"
+        type = "slow-setup"
+
+
+class SlowConnector(OutboundConnector):
+    value: int
+
+    async def run(self) -> int:
+        await asyncio.sleep(5)
+        return self.value
+
+    class ConnectorConfig:
+        name = "slow"
+        type = "slow"
+        timeout = 1
+        deadline_margin = 0.8
+
+
+class SleepConnector(OutboundConnector):
+    value: int
+
+    async def run(self) -> int:
+        await asyncio.sleep(0.3 if self.value == 0 else 5)
+        return self.value
+
+    class ConnectorConfig:
+        name = "sleep"
+        type = "sleep"
+
+
+class SleepInbound(InboundConnector):
+    value: int
+
+    async def run(self) -> int:
+        await asyncio.sleep(5)
+        return self.value
+
+    class ConnectorConfig:
+        name = "sleep inbound"
+        type = "sleep-inbound"
+
+
+class TestRuntimeWorker(TestCase):
+    async def run_jobs(
+        self,
+        gateway,
+        count,
+        connector=EchoConnector,
+        channel_config={},
+        **runtime_kwargs,
+    ):
+        await gateway.start()
+        runtime = CamundaRuntime(
+            config=InsecureConfig(
+                hostname="127.0.0.1", port=gateway.port, **channel_config
+            ),
+            outbound_connectors=[connector],
+            **runtime_kwargs,
+        )
+        main = asyncio.get_running_loop().create_task(runtime.main())
+        try:
+            await asyncio.sleep(0.2)
+            for value in range(count):
+                await gateway.add_job(
+                    connector.config.type,
+                    variables={"value": value, "other": "x" * 100},
+                    custom_headers={"resultVariable": "ret"},
+                )
+            await gateway.wait_finished(count)
+        finally:
+            await runtime.stop()
+            await main
+            await gateway.stop()
+
+    @async_test
+    async def test_polling(self):
+        gateway = FakeGateway(streaming=False)
+        await self.run_jobs(gateway, 3)
+
+        self.assertEqual(len(gateway.completed), 3)
+        for variables in gateway.completed.values():
+            self.assertNotIn("other", variables)
+            self.assertEqual(variables["ret"], variables["value"])
+
+    @async_test
+    async def test_adaptive_polling(self):
+        gateway = FakeGateway(streaming=False)
+        await self.run_jobs(gateway, 3, max_poll_delay=0.2)
+
+        self.assertEqual(len(gateway.completed), 3)
+
+    @async_test
+    async def test_streaming(self):
+        gateway = FakeGateway(streaming=True)
+        await self.run_jobs(gateway, 3, stream_jobs=True)
+
+        self.assertEqual(len(gateway.completed), 3)
+        self.assertEqual(sorted(gateway.streamed), sorted(gateway.completed))
+
+    @async_test
+    async def test_stream_reopen_delay(self):
+        gateway = await FakeGateway(end_streams=True).start()
+        runtime = CamundaRuntime(
+            config=InsecureConfig(hostname="127.0.0.1", port=gateway.port),
+            outbound_connectors=[EchoConnector],
+            stream_jobs=True,
+        )
+        main = asyncio.get_running_loop().create_task(runtime.main())
+        try:
+            await asyncio.sleep(0.5)
+        finally:
+            await runtime.stop()
+            await main
+            await gateway.stop()
+
+        self.assertEqual(gateway.streams_opened, 1)
+
+    @async_test
+    async def test_streaming_fallback(self):
+        gateway = FakeGateway(streaming=False)
+        await self.run_jobs(gateway, 3, stream_jobs=True)
+
+        self.assertEqual(len(gateway.completed), 3)
+        self.assertEqual(gateway.streamed, [])
+
+    @async_test
+    async def test_channel_pool(self):
+        gateway = FakeGateway()
+        await self.run_jobs(
+            gateway,
+            10,
+            stream_jobs=True,
+            channel_config={"channel_pool_size": 2, "compression": "gzip"},
+        )
+
+        self.assertEqual(len(gateway.completed), 10)
+
+    @async_test
+    async def test_connector_resources(self):
+        gateway = FakeGateway(streaming=False)
+        await self.run_jobs(gateway, 3, connector=PooledConnector)
+
+        for variables in gateway.completed.values():
+            self.assertEqual(variables["ret"], variables["value"] + 10)
+        self.assertEqual(
+            PooledConnector.calls, ["setup", ("teardown", {"offset": 10})]
+        )
+        self.assertIsNone(PooledConnector._resources)
+
+    @async_test
+    async def test_deadline(self):
+        gateway = FakeGateway(streaming=False)
+        start = time.perf_counter()
+        await self.run_jobs(gateway, 1, connector=SlowConnector)
+
+        self.assertLess(time.perf_counter() - start, 2)
+        self.assertEqual(gateway.completed, {})
+        (message,) = gateway.failed.values()
+        self.assertIn("deadline", message)
+
+    @async_test
+    async def test_benchmark_scenarios(self):
+        for connector_cls, variables in SCENARIOS.values():
+            result = await measure_runtime(connector_cls, variables, jobs=10)
+            self.assertGreater(result["jobs_per_second"], 0)
+            self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+
+    async def stop_during_jobs(
+        self, stop, values, handle_signals=False, **runtime_kwargs
+    ):
+        gateway = await FakeGateway(streaming=False).start()
+        runtime = CamundaRuntime(
+            config=InsecureConfig(hostname="127.0.0.1", port=gateway.port),
+            outbound_connectors=[SleepConnector],
+            **runtime_kwargs,
+        )
+        main = asyncio.get_running_loop().create_task(
+            runtime.main(handle_signals=handle_signals)
+        )
+        try:
+            await asyncio.sleep(0.2)
+            for value in values:
+                await gateway.add_job(
+                    "sleep",
+                    variables={"value": value},
+                    custom_headers={"resultVariable": "ret"},
+                )
+            await asyncio.sleep(0.1)
+
+            start = time.perf_counter()
+            await stop(runtime)
+            await asyncio.wait_for(main, 2)
+            return gateway, time.perf_counter() - start
+        finally:
+            await gateway.stop()
+
+    @async_test
+    async def test_graceful_stop(self):
+        gateway, _ = await self.stop_during_jobs(
+            lambda runtime: runtime.stop(), [0, 0]
+        )
+
+        self.assertEqual(
+            sorted(
+                variables["ret"] for variables in gateway.completed.values()
+            ),
+            [0, 0],
+        )
+        self.assertEqual(gateway.failed, {})
+
+    @async_test
+    async def test_shutdown_timeout(self):
+        gateway, duration = await self.stop_during_jobs(
+            lambda runtime: runtime.stop(), [0, 1], shutdown_timeout=0.5
+        )
+
+        self.assertLess(duration, 1)
+        self.assertEqual(len(gateway.completed), 1)
+        (key,) = gateway.failed
+        self.assertEqual(gateway.failed[key], "Worker is shutting down")
+        self.assertEqual(gateway.retries[key], 3)
+
+    @async_test
+    async def test_shutdown_deadline(self):
+        gateway = await FakeGateway(streaming=False).start()
+        runtime = CamundaRuntime(
+            config=InsecureConfig(hostname="127.0.0.1", port=gateway.port),
+            outbound_connectors=[SleepConnector],
+            inbound_connectors=[SleepInbound],
+            shutdown_timeout=0.5,
+        )
+        main = asyncio.get_running_loop().create_task(runtime.main())
+        try:
+            await asyncio.sleep(0.2)
+            await gateway.add_job("sleep", variables={"value": 1})
+            await gateway.add_job(
+                "sleep-inbound",
+                variables={
+                    "value": 1,
+                    "correlation_key": "key",
+                    "message_name": "message",
+                },
+            )
+            await asyncio.sleep(0.2)
+            self.assertEqual(runtime.inbound_in_flight, 1)
+
+            start = time.perf_counter()
+            await runtime.stop()
+            await asyncio.wait_for(main, 2)
+            duration = time.perf_counter() - start
+        finally:
+            await gateway.stop()
+
+        self.assertLess(duration, 0.9)
+        self.assertEqual(gateway.messages, [])
+
+    @async_test
+    async def test_sigterm(self):
+        async def send_sigterm(runtime):
+            os.kill(os.getpid(), signal.SIGTERM)
+
+        loop = asyncio.get_running_loop()
+        received = []
+        loop.add_signal_handler(signal.SIGTERM, received.append, "app")
+        try:
+            gateway, _ = await self.stop_during_jobs(
+                send_sigterm, [0], handle_signals=True
+            )
+        finally:
+            self.assertTrue(loop.remove_signal_handler(signal.SIGTERM))
+
+        self.assertEqual(len(gateway.completed), 1)
+        self.assertEqual(received, [])
+
+    @async_test
+    async def test_keeps_signal_handlers(self):
+        async def send_sigterm(runtime):
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.sleep(0.1)
+            await runtime.stop()
+
+        loop = asyncio.get_running_loop()
+        received = []
+        loop.add_signal_handler(signal.SIGTERM, received.append, "app")
+        try:
+            await self.stop_during_jobs(send_sigterm, [0])
+        finally:
+            loop.remove_signal_handler(signal.SIGTERM)
+
+        self.assertEqual(received, ["app"])
+
+    @async_test
+    async def test_second_sigterm(self):
+        async def send_sigterm_twice(runtime):
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.sleep(0.1)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+        gateway, duration = await self.stop_during_jobs(
+            send_sigterm_twice, [1], handle_signals=True
+        )
+
+        self.assertLess(duration, 1)
+        (key,) = gateway.failed
+        self.assertEqual(gateway.failed[key], "Worker is shutting down")
+        self.assertEqual(gateway.retries[key], 3)
+
+    @async_test
+    async def test_stop_during_setup(self):
+        gateway = await FakeGateway(streaming=False).start()
+        runtime = CamundaRuntime(
+            config=InsecureConfig(hostname="127.0.0.1", port=gateway.port),
+            outbound_connectors=[SlowSetupConnector],
+        )
+        main = asyncio.get_running_loop().create_task(runtime.main())
+        try:
+            await asyncio.sleep(0.1)
+            await runtime.stop()
+            await asyncio.wait_for(main, 2)
+        finally:
+            await gateway.stop()
@@ -1,4 +1,7 @@
 import asyncio
+import unittest
+
+from python_camunda_sdk import metrics
 
 
 class DummyJob:
@@ -7,7 +10,14 @@ class DummyJob:
 
 
 class DummyClient:
-    async def publish_message(self, name, correlation_key, variables):
+    async def publish_message(
+        self,
+        name,
+        correlation_key,
+        variables=None,
+        time_to_live_in_milliseconds=60000,
+        message_id=None,
+    ):
         self.message_name = name
         self.correlation_key = correlation_key
         self.variables = variables
@@ -25,6 +35,16 @@ def dict_body(self):
     return {"foo": "1"}
 
 
+requires_prometheus = unittest.skipIf(
+    metrics.REGISTRY is None, "prometheus-client is missing"
+)
+
+
+def metric_value(name, **labels):
+    """Returns the value of a sample of the connector metrics."""
+    return metrics.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
 def async_test(coro):
     def wrapper(*args, **kwargs):
         loop = asyncio.new_event_loop()